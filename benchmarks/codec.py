@@ -0,0 +1,83 @@
+"""Measures CPU time of JSON codecs per request body and response.
+
+Usage: python -m benchmarks.codec
+"""
+import sys
+import timeit
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from urequest.codec import Codec, OrJsonCodec, StdCodec, UJsonCodec
+from urequest.response import HttpResponse
+
+_ROUNDS: int = 200
+
+
+def payload() -> Dict[str, Any]:
+    """Returns a payload typical for a listing API."""
+    return {
+        "data": [
+            {
+                "id": index,
+                "name": f"user-{index}",
+                "score": index * 0.5,
+                "active": index % 2 == 0,
+                "tags": ["alpha", "beta", "gamma"],
+            }
+            for index in range(1000)
+        ]
+    }
+
+
+def _codecs() -> List[Codec]:
+    """Returns codecs which packages are installed."""
+    codecs: List[Codec] = [StdCodec()]
+    for codec in (UJsonCodec(), OrJsonCodec()):
+        try:
+            codec.encode({})
+        except AttributeError:
+            continue
+        codecs.append(codec)
+    return codecs
+
+
+def _request(codec: Codec, document: Dict[str, Any]) -> Callable[[], Any]:
+    """Returns a single encode and decode of a request round trip."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = codec.encode(document)
+
+    def run() -> Any:
+        codec.encode(document)
+        return HttpResponse(response, codec).as_json()
+
+    return run
+
+
+def _baseline(document: Dict[str, Any]) -> Callable[[], Any]:
+    """Returns a round trip of ``requests`` JSON encoder and decoder."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = StdCodec().encode(document)
+
+    def run() -> Any:
+        requests.Request("POST", "http://localhost", json=document).prepare()
+        return HttpResponse(response).as_json()
+
+    return run
+
+
+def main() -> None:
+    """Prints CPU time per request of every codec."""
+    document: Dict[str, Any] = payload()
+    runs: Dict[str, Callable[[], Any]] = {"requests": _baseline(document)}
+    for codec in _codecs():
+        runs[type(codec).__name__] = _request(codec, document)
+    for name, run in runs.items():
+        seconds: float = min(timeit.repeat(run, number=_ROUNDS, repeat=3))
+        sys.stdout.write(f"{name:>12}: {seconds / _ROUNDS * 1e6:10.1f} us\n")
+
+
+if __name__ == "__main__":
+    main()
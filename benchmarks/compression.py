@@ -0,0 +1,51 @@
+"""Measures throughput and CPU time of request body compression.
+
+Bodies are posted to the test echo server, which decodes them.
+
+Usage: python -m benchmarks.compression
+"""
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from benchmarks.codec import payload
+from tests.mock import Endpoint
+from tests.mock.echo import EchoMock
+from urequest import Compression, HttpSession, HttpUrl
+
+_ROUNDS: int = 50
+
+
+def _measure(url: HttpUrl, compression: Optional[Compression]) -> str:
+    """Returns a report of posting a payload with a compression."""
+    document: Dict[str, Any] = payload()
+    with HttpSession(compression=compression) as session:
+        size: int = session.post(url, as_dict=document).as_json()["size"]
+        started, cpu = time.perf_counter(), time.process_time()
+        for _ in range(_ROUNDS):
+            session.post(url, as_dict=document)
+        elapsed: float = time.perf_counter() - started
+        spent: float = time.process_time() - cpu
+    return (
+        f"{size / 1024:8.1f} KiB {_ROUNDS / elapsed:8.1f} rps "
+        f"{spent / _ROUNDS * 1e3:8.2f} ms CPU\n"
+    )
+
+
+def main() -> None:
+    """Prints body size, requests per second and CPU time per request."""
+    runs: Dict[str, Optional[Compression]] = {"identity": None}
+    for encoding in ("gzip", "deflate", "zstd"):
+        for level in (1, 6, 9):
+            try:
+                runs[f"{encoding}:{level}"] = Compression(encoding, level)
+            except ValueError:
+                break
+    with EchoMock(Endpoint(host="127.0.0.1", port=4446)) as mock:
+        url = HttpUrl(mock.bind)
+        for name, compression in runs.items():
+            sys.stdout.write(f"{name:>10}: {_measure(url, compression)}")
+
+
+if __name__ == "__main__":
+    main()
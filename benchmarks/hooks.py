@@ -0,0 +1,74 @@
+"""Measures overhead of instrumentation hooks per request.
+
+Requests are answered by an in-memory adapter, so only a session
+dispatch is measured.
+
+Usage: python -m benchmarks.hooks
+"""
+import sys
+import timeit
+from functools import partial
+from typing import Any, Callable, Dict
+
+import requests
+from requests.adapters import BaseAdapter
+
+from urequest import Event, Hooks, HttpSession, HttpUrl
+
+_ROUNDS: int = 5000
+
+
+class _Adapter(BaseAdapter):
+    """The class represents an adapter replying without a network."""
+
+    def send(  # pylint: disable=arguments-differ
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _session(hooks: Hooks) -> HttpSession:
+    """Returns a session which requests never leave a process."""
+    session = requests.Session()
+    session.mount("http://", _Adapter())
+    return HttpSession(session, hooks=hooks)
+
+
+def _ignore(event: Event) -> None:
+    """Drops an event."""
+    pass
+
+
+def _hooked() -> Hooks:
+    """Returns hooks listening to every event."""
+    hooks = Hooks()
+    hooks.before(_ignore)
+    hooks.after(_ignore)
+    hooks.error(_ignore)
+    return hooks
+
+
+def main() -> None:
+    """Prints CPU time per request with and without hooks."""
+    url = HttpUrl("localhost")
+    sessions: Dict[str, HttpSession] = {
+        "no hooks": _session(Hooks()),
+        "hooks": _session(_hooked()),
+    }
+    for name, session in sessions.items():
+        run: Callable[[], Any] = partial(session.get, url)
+        seconds: float = min(timeit.repeat(run, number=_ROUNDS, repeat=3))
+        sys.stdout.write(f"{name:>12}: {seconds / _ROUNDS * 1e6:10.1f} us\n")
+    seconds = min(timeit.repeat(Hooks().__bool__, number=_ROUNDS, repeat=3))
+    sys.stdout.write(f"{'check':>12}: {seconds / _ROUNDS * 1e6:10.3f} us\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Compares import time and throughput of HTTP sessions.
+
+Import time is measured in a new interpreter per run. Requests are sent
+over a kept-alive connection to the test echo server, so a session
+overhead takes a noticeable part of a round trip.
+
+Usage: python -m benchmarks.light
+"""
+import subprocess
+import sys
+import time
+from typing import Callable, Dict
+
+from tests.mock import Endpoint
+from tests.mock.echo import EchoMock
+from urequest import HttpSession, HttpUrl, LightHttpSession, Session
+
+_IMPORTS: int = 10
+_ROUNDS: int = 2000
+
+
+def _imported(name: str) -> float:
+    """Returns least seconds a new interpreter takes to import a session."""
+    script: str = (
+        "import time; started = time.perf_counter(); "
+        f"from urequest import {name}; "
+        "print(time.perf_counter() - started)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                (sys.executable, "-c", script),
+                check=True,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+            ).stdout
+        )
+        for _ in range(_IMPORTS)
+    )
+
+
+def _throughput(session: Session, url: HttpUrl) -> float:
+    """Returns requests per second of a session."""
+    with session:
+        session.get(url)
+        started: float = time.perf_counter()
+        for _ in range(_ROUNDS):
+            session.get(url)
+        return _ROUNDS / (time.perf_counter() - started)
+
+
+def main() -> None:
+    """Prints import time and requests per second of every session."""
+    sessions: Dict[str, Callable[[], Session]] = {
+        "HttpSession": HttpSession,
+        "LightHttpSession": LightHttpSession,
+    }
+    with EchoMock(Endpoint(host="127.0.0.1", port=4450)) as mock:
+        url = HttpUrl(mock.bind)
+        for name, session in sessions.items():
+            sys.stdout.write(
+                f"{name:>16}: {_imported(name) * 1e3:8.1f} ms import "
+                f"{_throughput(session(), url):8.1f} rps\n"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compares full and resumed TLS handshakes of new connections.
+
+Every request closes its connection, so every request does a handshake
+with the test echo server over TLS of a self-signed certificate.
+
+Usage: python -m benchmarks.tls
+"""
+import sys
+import time
+
+from tests.mock import Endpoint
+from tests.mock.echo import CERTIFICATE, EchoMock, server_context
+from urequest import HttpSession, HttpsUrl, Pool, Tls
+
+_ROUNDS: int = 200
+
+
+def _measure(url: HttpsUrl, tls: Tls) -> str:
+    """Returns a report of requests over new connections."""
+    with HttpSession(pool=Pool(tls=tls)) as session:
+        session.get(url)
+        before = tls.stats()
+        started: float = time.perf_counter()
+        for _ in range(_ROUNDS):
+            session.get(url, headers={"Connection": "close"})
+        elapsed: float = time.perf_counter() - started
+    resumed: int = tls.stats().resumed - before.resumed
+    return (
+        f"{_ROUNDS / elapsed:8.1f} rps "
+        f"{elapsed / _ROUNDS * 1e3:8.2f} ms per request "
+        f"{resumed:5d}/{_ROUNDS} resumed\n"
+    )
+
+
+def main() -> None:
+    """Prints requests per second over full and resumed handshakes."""
+    with EchoMock(
+        Endpoint(host="127.0.0.1", port=4448), server_context()
+    ) as mock:
+        url = HttpsUrl(f"localhost:{mock.bind.split(':')[1]}")
+        for name, resumption in (("full", False), ("resumed", True)):
+            tls = Tls(ca_bundle=CERTIFICATE, resumption=resumption)
+            sys.stdout.write(f"{name:>8}: {_measure(url, tls)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+from typing import Iterator
+
 import pytest
 
 from tests.mock import Endpoint
+from tests.mock.echo import EchoMock, server_context
 from tests.mock.employees import EmployeesMock, Mock
 from urequest.credentials import Credentials
 from urequest.response import Response
@@ -46,3 +49,31 @@ def logged_response(logged_session: Session, session_url: Address) -> Response:
 def employees_mock() -> Mock:
     with EmployeesMock(Endpoint(host="0.0.0.0", port=4444)) as mock:
         return mock
+
+
+@pytest.fixture()
+def _clean_up_employees(employees_mock: Mock) -> None:
+    """Cleans up employees storage at teardown."""
+    yield
+    employees_mock.clean_up()
+
+
+@pytest.fixture(scope="session")
+def echo_mock() -> Iterator[Mock]:
+    with EchoMock(Endpoint(host="127.0.0.1", port=4445)) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="session")
+def tls_mock() -> Iterator[Mock]:
+    with EchoMock(
+        Endpoint(host="127.0.0.1", port=4447), server_context()
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture()
+def _clean_up_echo(echo_mock: Mock) -> None:
+    """Cleans up echo server counters at teardown."""
+    yield
+    echo_mock.clean_up()
@@ -0,0 +1,289 @@
+import asyncio
+import gzip
+import importlib
+import json
+import os
+import ssl
+import zlib
+from threading import Event, Thread
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
+
+from tests.mock import Endpoint, Mock
+
+CERTIFICATE: str = os.path.join(
+    os.path.dirname(__file__), "certs", "localhost.pem"
+)
+_CLOSE: bytes = b"\r\nConnection: close\r\n"
+
+
+def server_context() -> ssl.SSLContext:
+    """Returns a TLS context of a self-signed ``localhost`` certificate."""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(CERTIFICATE, CERTIFICATE.replace(".pem", ".key"))
+    return context
+
+
+async def _read_request(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Reads a single HTTP/1.1 request."""
+    line = await reader.readline()
+    if not line:
+        return None
+    method, target, _ = line.decode().split(" ", 2)
+    headers: Dict[str, str] = {}
+    line = await reader.readline()
+    while line not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+        line = await reader.readline()
+    if headers.get("transfer-encoding") == "chunked":
+        return method, target, headers, await _read_chunks(reader)
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return method, target, headers, body
+
+
+async def _read_chunks(reader: asyncio.StreamReader) -> bytes:
+    """Reads a body of chunked transfer encoding."""
+    body: bytes = b""
+    size: int = int((await reader.readline()).split(b";")[0], 16)
+    while size:
+        body += await reader.readexactly(size)
+        await reader.readline()
+        size = int((await reader.readline()).split(b";")[0], 16)
+    await reader.readline()
+    return body
+
+
+def _reply(
+    code: int, body: bytes, chunked: bool = False, extra: bytes = b""
+) -> bytes:
+    """Composes a plain HTTP/1.1 response."""
+    head = b"HTTP/1.1 %d Echo\r\nContent-Type: application/json\r\n" % code
+    head += extra
+    if not chunked:
+        return head + b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+    middle = len(body) // 2
+    chunks = b"".join(
+        b"%x\r\n%s\r\n" % (len(chunk), chunk)
+        for chunk in (body[:middle], body[middle:])
+        if chunk
+    )
+    return head + b"Transfer-Encoding: chunked\r\n\r\n%s0\r\n\r\n" % chunks
+
+
+def _decoded(headers: Dict[str, str], body: bytes) -> bytes:
+    """Returns a request body decoded by its content encoding."""
+    encoding = headers.get("content-encoding")
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    if encoding == "zstd":
+        zstandard = importlib.import_module("zstandard")
+        return zstandard.ZstdDecompressor().decompress(body)
+    return body
+
+
+def _encoded(encoding: str, body: bytes) -> bytes:
+    """Returns a response body encoded by a content encoding."""
+    if encoding == "gzip":
+        return gzip.compress(body)
+    if encoding == "deflate":
+        return zlib.compress(body)
+    return importlib.import_module("brotli").compress(body)
+
+
+def content(size: int) -> bytes:
+    """Returns a deterministic body of a file of a given size."""
+    return bytes(index % 251 for index in range(size))
+
+
+def _file(method: str, target: str, headers: Dict[str, str]) -> bytes:
+    """Composes a response of a file serving byte ranges."""
+    body = content(int(target.rsplit("/", 1)[1]))
+    extra = (
+        b'ETag: "file"\r\nAccept-Ranges: bytes\r\n'
+        b"Cache-Control: max-age=60\r\n"
+    )
+    if method == "HEAD" and target.startswith("/headless/"):
+        return _reply(405, b"")
+    if method == "HEAD":
+        return b"HTTP/1.1 200 Echo\r\n%sContent-Length: %d\r\n\r\n" % (
+            extra,
+            len(body),
+        )
+    requested = headers.get("range", "").partition("=")[2]
+    if not requested or headers.get("if-range", '"file"') != '"file"':
+        return _reply(200, body, extra=extra)
+    start, _, end = requested.partition("-")
+    first, last = int(start), int(end or len(body) - 1)
+    stop = last + 1
+    extra += b"Content-Range: bytes %d-%d/%d\r\n" % (first, last, len(body))
+    return _reply(206, body[first:stop], extra=extra)
+
+
+def _respond(
+    method: str, target: str, headers: Dict[str, str], body: bytes
+) -> bytes:
+    """Composes a response to a request."""
+    if target.startswith(("/file/", "/broken/", "/headless/")):
+        return _file(method, target, headers)
+    if target.startswith("/redirect/"):
+        return (
+            b"HTTP/1.1 %s Moved\r\nLocation: /users\r\n"
+            b"Content-Length: 0\r\n\r\n" % target.rsplit("/", 1)[1].encode()
+        )
+    code, extra = 200, b""
+    if target.startswith("/status/"):
+        code = int(target.rsplit("/", 1)[1])
+    if target.startswith("/cache/"):
+        if headers.get("if-none-match") == '"echo"':
+            return b"HTTP/1.1 304 Not Modified\r\nContent-Length: 0\r\n\r\n"
+        extra = (
+            b'Cache-Control: max-age=%s\r\nETag: "echo"\r\nVary: Accept\r\n'
+            % target.split("?")[0].rsplit("/", 1)[1].encode()
+        )
+    echo = json.dumps(
+        {
+            "method": method,
+            "path": target,
+            "headers": headers,
+            "body": _decoded(headers, body).decode(),
+            "size": len(body),
+        }
+    ).encode()
+    if method == "HEAD":
+        echo = b""
+    if target.startswith("/encoded/"):
+        encoding = target.rsplit("/", 1)[1]
+        echo = _encoded(encoding, echo)
+        extra = b"Content-Encoding: %s\r\n" % encoding.encode()
+    return _reply(code, echo, chunked=target == "/chunked", extra=extra)
+
+
+class EchoMock(Mock):
+    """The class represents an asyncio HTTP/1.1 stand-in server.
+
+    It replies with JSON describing a request and keeps connections alive.
+    Path ``/status/<code>`` replies with a given status code,
+    path ``/redirect/<code>`` redirects to ``/users``,
+    path ``/cache/<seconds>`` replies with a cacheable response validated
+    by ``"echo"`` entity tag, path ``/delay/<seconds>`` replies after
+    a delay, path ``/flaky/<count>`` replies ``503`` to first requests,
+    path ``/lag/<count>`` replies to first requests after a second,
+    path ``/stall`` replies after a minute,
+    path ``/encoded/<encoding>`` replies with ``gzip``, ``deflate`` or
+    ``br`` encoded body, path ``/file/<size>`` serves byte ranges of
+    a cacheable file, path ``/broken/<size>`` does the same but drops
+    a connection in the middle of a first body, path ``/headless/<size>``
+    does the same but rejects ``HEAD`` requests and path ``/chunked``
+    replies with chunked transfer encoding. Encoded request bodies are
+    decoded. A connection is closed after a reply to ``Connection: close``
+    request. A server speaks TLS if a server context is given.
+
+    A server loop runs in a separate thread.
+    """
+
+    def __init__(self, endpoint: Endpoint, tls: ssl.SSLContext = None) -> None:
+        self._endpoint = endpoint
+        self._tls = tls
+        self._loop = asyncio.new_event_loop()
+        self._ready = Event()
+        self.connections = 0
+        self.requests = 0
+        self._hits: Dict[str, int] = {}
+
+    @property
+    def bind(self) -> str:
+        return f"{self._endpoint.host}:{self._endpoint.port}"
+
+    def start(self) -> None:
+        thread = Thread(target=self._serve, daemon=True)
+        thread.start()
+        self._ready.wait(timeout=10)
+
+    def clean_up(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self._hits.clear()
+
+    def __enter__(self) -> Mock:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(
+            timeout=10
+        )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        for task in asyncio.all_tasks():
+            if task is not asyncio.current_task():
+                task.cancel()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(
+                self._handle,
+                self._endpoint.host,
+                self._endpoint.port,
+                ssl=self._tls,
+            )
+        )
+        self._ready.set()
+        self._loop.run_forever()
+
+    def _first(self, target: str) -> bool:
+        """Returns `True` for first requests to a counted path."""
+        self._hits[target] = self._hits.get(target, 0) + 1
+        return self._hits[target] <= int(target.rsplit("/", 1)[1])
+
+    def _flaky_reply(self, target: str) -> bytes:
+        """Composes a failure reply of first requests to a flaky path."""
+        if not target.startswith("/flaky/") or not self._first(target):
+            return b""
+        return _reply(503, b"", extra=b"Retry-After: 0\r\n")
+
+    def _broken(self, method: str, target: str) -> bool:
+        """Returns `True` for a first body of a broken path."""
+        if method != "GET" or not target.startswith("/broken/"):
+            return False
+        self._hits[target] = self._hits.get(target, 0) + 1
+        return self._hits[target] == 1
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        request = await _read_request(reader)
+        while request is not None:
+            self.requests += 1
+            if request[1] == "/stall":
+                await asyncio.sleep(60)
+            if request[1].startswith("/delay/"):
+                await asyncio.sleep(float(request[1].rsplit("/", 1)[1]))
+            if request[1].startswith("/lag/") and self._first(request[1]):
+                await asyncio.sleep(1)
+            reply = self._flaky_reply(request[1]) or _respond(*request)
+            if self._broken(*request[:2]):
+                writer.write(reply[: len(reply) // 2])
+                await writer.drain()
+                break
+            if request[2].get("connection") == "close":
+                writer.write(reply.replace(b"\r\n", _CLOSE, 1))
+                await writer.drain()
+                break
+            writer.write(reply)
+            await writer.drain()
+            request = await _read_request(reader)
+        writer.close()
@@ -0,0 +1,140 @@
+import json
+import socket
+import ssl
+from threading import Lock, Thread, Timer
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+from h2.config import H2Configuration
+from h2.connection import H2Connection
+from h2.events import DataReceived, RequestReceived, StreamEnded
+
+from tests.mock import Endpoint, Mock
+from tests.mock.echo import server_context
+
+
+class _Connection:
+    """The class represents a served HTTP/2 connection."""
+
+    def __init__(self, sock: ssl.SSLSocket) -> None:
+        self._sock = sock
+        self._h2 = H2Connection(
+            H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        self._lock = Lock()
+        self._requests: Dict[int, Tuple[Dict[str, str], List[bytes]]] = {}
+
+    def serve(self) -> None:
+        with self._lock:
+            self._h2.initiate_connection()
+            self._flush()
+        data = self._sock.recv(65535)
+        while data:
+            with self._lock:
+                events = self._h2.receive_data(data)
+                self._flush()
+            for event in events:
+                self._handle(event)
+            data = self._sock.recv(65535)
+        self._sock.close()
+
+    def _handle(self, event: object) -> None:
+        if isinstance(event, RequestReceived):
+            self._requests[event.stream_id] = (dict(event.headers), [])
+        elif isinstance(event, DataReceived):
+            self._requests[event.stream_id][1].append(event.data)
+            with self._lock:
+                self._h2.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+                self._flush()
+        elif isinstance(event, StreamEnded):
+            path = self._requests[event.stream_id][0][":path"]
+            delay = float(path.rsplit("/", 1)[1]) if "/delay/" in path else 0
+            Timer(delay, self._reply, (event.stream_id,)).start()
+
+    def _reply(self, stream: int) -> None:
+        headers, chunks = self._requests.pop(stream)
+        path = headers[":path"]
+        code = path.rsplit("/", 1)[1] if path.startswith("/status/") else 200
+        body = json.dumps(
+            {
+                "method": headers[":method"],
+                "path": path,
+                "headers": headers,
+                "body": b"".join(chunks).decode(),
+                "protocol": "HTTP/2",
+            }
+        ).encode()
+        with self._lock:
+            self._h2.send_headers(
+                stream,
+                [
+                    (":status", str(code)),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(body))),
+                ],
+            )
+            self._h2.send_data(stream, body, end_stream=True)
+            self._flush()
+
+    def _flush(self) -> None:
+        self._sock.sendall(self._h2.data_to_send())
+
+
+class Http2Mock(Mock):
+    """The class represents HTTP/2 echo mock server over TLS.
+
+    It replies with JSON describing a request, path ``/status/<code>``
+    replies with a given status code and path ``/delay/<seconds>``
+    replies after a delay without holding other streams.
+
+    A server runs in a separate thread, every connection in its own one.
+    """
+
+    def __init__(self, endpoint: Endpoint) -> None:
+        self._endpoint = endpoint
+        self._tls = server_context()
+        self._tls.set_alpn_protocols(["h2"])
+        self._listener = socket.socket()
+        self.connections = 0
+
+    @property
+    def bind(self) -> str:
+        return f"{self._endpoint.host}:{self._endpoint.port}"
+
+    def start(self) -> None:
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((self._endpoint.host, self._endpoint.port))
+        self._listener.listen()
+        Thread(target=self._accept, daemon=True).start()
+
+    def clean_up(self) -> None:
+        self.connections = 0
+
+    def __enter__(self) -> Mock:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._listener.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            self.connections += 1
+            Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def _serve(self, sock: socket.socket) -> None:
+        try:
+            _Connection(self._tls.wrap_socket(sock, server_side=True)).serve()
+        except OSError:
+            sock.close()
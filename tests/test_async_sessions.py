@@ -0,0 +1,233 @@
+import asyncio
+from http import HTTPStatus
+from typing import Any, Awaitable, Iterator, List
+
+import _pytest
+import pytest
+from requests.exceptions import ReadTimeout
+
+from tests.mock.echo import CERTIFICATE, EchoMock
+from urequest import (
+    AsyncHttpSession,
+    HttpConnectionError,
+    HttpsUrl,
+    HttpUrl,
+    Pool,
+    Resolver,
+    Response,
+    ResponseError,
+    Tls,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.fixture()
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture()
+def mock(echo_mock: EchoMock) -> Iterator[EchoMock]:
+    yield echo_mock
+    echo_mock.clean_up()
+
+
+def _run(loop: asyncio.AbstractEventLoop, coroutine: Awaitable[Any]) -> Any:
+    return loop.run_until_complete(coroutine)
+
+
+def test_async_session_get(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(
+                HttpUrl(mock.bind, path="users"), params={"page": "2"}
+            )
+
+    response: Response = _run(loop, get())
+    assert response.is_ok()
+    assert response.status() is HTTPStatus.OK
+    assert response.as_json()["path"] == "/users?page=2"
+
+
+def test_async_session_post(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def post() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.post(
+                HttpUrl(mock.bind, path="users"), as_dict={"name": "Mike"}
+            )
+
+    echo = _run(loop, post()).as_json()
+    assert echo["method"] == "POST"
+    assert echo["body"] == '{"name": "Mike"}'
+    assert echo["headers"]["content-type"] == "application/json"
+
+
+def test_async_session_chunked(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(HttpUrl(mock.bind, path="chunked"))
+
+    assert _run(loop, get()).as_json()["path"] == "/chunked"
+
+
+def test_async_session_head(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def head() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.head(HttpUrl(mock.bind))
+
+    assert str(_run(loop, head())) == ""
+
+
+def test_async_session_reuses_connections(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get_all() -> List[Response]:
+        async with AsyncHttpSession() as session:
+            first = await asyncio.gather(
+                *(session.get(HttpUrl(mock.bind)) for _ in range(5))
+            )
+            second = await asyncio.gather(
+                *(session.get(HttpUrl(mock.bind)) for _ in range(5))
+            )
+            return [*first, *second]
+
+    assert all(response.is_ok() for response in _run(loop, get_all()))
+    assert mock.connections == 5
+
+
+def test_async_session_safe_response(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def delete() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.delete(HttpUrl(mock.bind, path="status/500"))
+
+    with pytest.raises(ResponseError):
+        _run(loop, delete())
+
+
+def test_async_session_connection_error(
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(HttpUrl("127.0.0.1:1"))
+
+    with pytest.raises(HttpConnectionError):
+        _run(loop, get())
+
+
+def test_async_session_timeout(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(
+                HttpUrl(mock.bind, path="stall"), timeout=0.2
+            )
+
+    with pytest.raises(ReadTimeout):
+        _run(loop, get())
+
+
+def test_async_session_unsupported_argument(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(HttpUrl(mock.bind), verify=False)
+
+    with pytest.raises(TypeError, match="verify"):
+        _run(loop, get())
+
+
+def test_async_session_merges_headers(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def post() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.post(
+                HttpUrl(mock.bind),
+                as_dict={},
+                headers={"content-type": "text/plain", "host": "example"},
+            )
+
+    echo = _run(loop, post()).as_json()
+    assert echo["headers"]["content-type"] == "text/plain"
+    assert echo["headers"]["host"] == "example"
+
+
+@pytest.mark.parametrize(  # noqa: PT006, PT007
+    "code, method",
+    (
+        pytest.param(301, "GET", id="moved permanently"),
+        pytest.param(302, "GET", id="found"),
+        pytest.param(303, "GET", id="see other"),
+        pytest.param(307, "POST", id="temporary redirect"),
+        pytest.param(308, "POST", id="permanent redirect"),
+    ),
+)
+def test_async_session_follows_redirects(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock, code: int, method: str
+) -> None:
+    async def post() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.post(
+                HttpUrl(mock.bind, path=f"redirect/{code}"), plain="data"
+            )
+
+    echo = _run(loop, post()).as_json()
+    assert echo["path"] == "/users"
+    assert echo["method"] == method
+
+
+def test_async_session_without_redirects(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        async with AsyncHttpSession() as session:
+            return await session.get(
+                HttpUrl(mock.bind, path="redirect/302"), allow_redirects=False
+            )
+
+    with pytest.raises(ResponseError):
+        _run(loop, get())
+
+
+def test_async_session_resolver(
+    loop: asyncio.AbstractEventLoop, mock: EchoMock
+) -> None:
+    resolver = Resolver(overrides={"echo.test": ("127.0.0.1",)})
+
+    async def get() -> Response:
+        async with AsyncHttpSession(Pool(resolver=resolver)) as session:
+            return await session.get(
+                HttpUrl(f"echo.test:{mock.bind.split(':')[1]}")
+            )
+
+    assert _run(loop, get()).is_ok()
+    assert resolver.stats().misses == 1
+
+
+def test_async_session_tls(
+    loop: asyncio.AbstractEventLoop, tls_mock: EchoMock
+) -> None:
+    async def get() -> Response:
+        pool = Pool(tls=Tls(ca_bundle=CERTIFICATE))
+        async with AsyncHttpSession(pool) as session:
+            return await session.get(
+                HttpsUrl(f"localhost:{tls_mock.bind.split(':')[1]}")
+            )
+
+    assert _run(loop, get()).as_json()["method"] == "GET"
@@ -0,0 +1,121 @@
+import time
+from functools import partial
+from typing import List
+
+import _pytest
+import pytest
+
+from tests.fake.response import FakeHttpResponse
+from tests.mock.employees import Mock
+from urequest import (
+    HTTPStatus,
+    HttpUrl,
+    Outcome,
+    Response,
+    ResponseError,
+    Session,
+)
+from urequest.batch import fan_out
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_employees")
+def test_session_get_many(employees_mock: Mock, session: Session) -> None:
+    outcomes: List[Outcome] = list(
+        session.get_many((HttpUrl(employees_mock.bind),) * 5, concurrency=3)
+    )
+    assert len(outcomes) == 5
+    assert all(outcome.is_ok() for outcome in outcomes)
+    assert all(
+        str(outcome.response()) == "Welcome to the employees test app!"
+        for outcome in outcomes
+    )
+
+
+@pytest.mark.usefixtures("_clean_up_employees")
+def test_session_get_many_keeps_failures(
+    employees_mock: Mock, session: Session
+) -> None:
+    first, second, third = session.get_many(
+        (
+            HttpUrl(employees_mock.bind),
+            HttpUrl(employees_mock.bind, path="users/100"),
+            HttpUrl(employees_mock.bind, path="users"),
+        )
+    )
+    assert first.is_ok()
+    assert not second.is_ok()
+    assert isinstance(second.error(), ResponseError)
+    with pytest.raises(ResponseError):
+        second.response()
+    assert third.response().as_json() == []
+
+
+@pytest.mark.usefixtures("_clean_up_employees")
+def test_session_get_many_as_completed(
+    employees_mock: Mock, session: Session
+) -> None:
+    outcomes: List[Outcome] = list(
+        session.get_many(
+            (
+                HttpUrl(employees_mock.bind, path="users"),
+                HttpUrl(employees_mock.bind),
+            ),
+            ordered=False,
+        )
+    )
+    assert sorted(str(outcome.response()) for outcome in outcomes) == [
+        "Welcome to the employees test app!",
+        "[]",
+    ]
+
+
+def test_fan_out_as_completed() -> None:
+    def respond(delay: float, text: str) -> Response:
+        time.sleep(delay)
+        return FakeHttpResponse(HTTPStatus.OK, as_str=text)
+
+    outcomes = fan_out(
+        (
+            (HttpUrl("slow"), partial(respond, 0.3, "slow")),
+            (HttpUrl("fast"), partial(respond, 0, "fast")),
+        ),
+        ordered=False,
+    )
+    assert [str(outcome.response()) for outcome in outcomes] == [
+        "fast",
+        "slow",
+    ]
+
+
+def test_fan_out_is_lazy() -> None:
+    calls: List[int] = []
+    fan_out(((HttpUrl("lazy"), partial(calls.append, 1)),))
+    assert not calls
+
+
+@pytest.mark.usefixtures("_clean_up_employees")
+def test_session_post_many_bodies_mismatch(
+    employees_mock: Mock, session: Session
+) -> None:
+    with pytest.raises(ValueError):
+        session.post_many(
+            (HttpUrl(employees_mock.bind, path="create_user"),) * 2,
+            as_dicts=({"name": "Mike"},),
+        )
+
+
+@pytest.mark.usefixtures("_clean_up_employees")
+def test_session_post_many(employees_mock: Mock, session: Session) -> None:
+    names = ("Mike", "Luke", "Leia")
+    outcomes: List[Outcome] = list(
+        session.post_many(
+            (HttpUrl(employees_mock.bind, path="create_user"),) * 3,
+            as_dicts=({"name": name} for name in names),
+            concurrency=1,
+        )
+    )
+    assert [outcome.response().as_json()["name"] for outcome in outcomes] == [
+        *names
+    ]
@@ -0,0 +1,69 @@
+import time
+from typing import List, Tuple
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    HttpSession,
+    HttpUrl,
+    ResponseError,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_breaker_opens_and_recovers(echo_mock: EchoMock) -> None:
+    changes: List[Tuple[str, CircuitState, CircuitState]] = []
+    breaker = CircuitBreaker(
+        window=4,
+        minimum=2,
+        open_for=0.2,
+        on_change=lambda *change: changes.append(change),
+    )
+    with HttpSession(breaker=breaker) as session:
+        for _ in range(2):
+            with pytest.raises(ResponseError):
+                session.get(HttpUrl(echo_mock.bind, path="status/503"))
+        with pytest.raises(CircuitOpenError):
+            session.get(HttpUrl(echo_mock.bind))
+        assert echo_mock.requests == 2
+        time.sleep(0.2)
+        assert session.get(HttpUrl(echo_mock.bind)).is_ok()
+    host = echo_mock.bind
+    assert breaker.state(host) is CircuitState.CLOSED
+    assert changes == [
+        (host, CircuitState.CLOSED, CircuitState.OPEN),
+        (host, CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (host, CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_breaker_ignores_client_errors(echo_mock: EchoMock) -> None:
+    breaker = CircuitBreaker(window=2, minimum=1)
+    with HttpSession(breaker=breaker) as session:
+        for _ in range(3):
+            with pytest.raises(ResponseError):
+                session.get(HttpUrl(echo_mock.bind, path="status/404"))
+    assert breaker.state(echo_mock.bind) is CircuitState.CLOSED
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_breaker_failed_probe(echo_mock: EchoMock) -> None:
+    breaker = CircuitBreaker(window=1, minimum=1, open_for=0.1)
+    with HttpSession(breaker=breaker) as session:
+        url = HttpUrl(echo_mock.bind, path="status/500")
+        with pytest.raises(ResponseError):
+            session.get(url)
+        time.sleep(0.1)
+        with pytest.raises(ResponseError):
+            session.get(url)
+        with pytest.raises(CircuitOpenError):
+            session.get(url)
+    assert breaker.state(echo_mock.bind) is CircuitState.OPEN
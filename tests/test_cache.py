@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock, content
+from urequest import CachedHttpSession, HttpSession, HttpUrl, ResponseCache
+from urequest.cache import CacheStats
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_fresh_hit(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/60")
+        assert session.get(url) is session.get(url)
+        assert session.stats() == CacheStats(hits=1, misses=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_revalidation(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/0")
+        first = session.get(url)
+        assert session.get(url) is first
+        assert session.stats() == CacheStats(hits=1, misses=1, revalidations=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_vary(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/60")
+        session.get(url, headers={"Accept": "application/json"})
+        session.get(url, headers={"Accept": "text/plain"})
+        session.get(url, headers={"accept": "application/json"})
+        assert session.stats() == CacheStats(hits=1, misses=2)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_invalidation(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/60")
+        session.get(url, params={"page": 1})
+        session.post(url, as_dict={"name": "user"}, params={"page": 1})
+        session.get(url, params={"page": 1})
+        assert session.stats() == CacheStats(misses=2)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_spills_to_disk(echo_mock: EchoMock, tmp_path: Path) -> None:
+    cache = ResponseCache(entries=1, directory=tmp_path)
+    with CachedHttpSession(HttpSession(), cache) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/60")
+        first = session.get(url, params={"page": 1})
+        session.get(url, params={"page": 2})
+        assert len(list(tmp_path.iterdir())) == 1
+        assert str(session.get(url, params={"page": 1})) == str(first)
+        assert session.stats() == CacheStats(hits=1, misses=2)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_bypasses_streams(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="cache/60")
+        session.get(url, stream=True).close()
+        assert session.stats() == CacheStats()
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_cache_bypasses_ranges(echo_mock: EchoMock) -> None:
+    with CachedHttpSession(HttpSession()) as session:
+        url = HttpUrl(echo_mock.bind, path="file/16")
+        partial = session.get(url, headers={"Range": "bytes=0-2"})
+        assert partial.as_bytes() == content(3)
+        assert session.get(url).as_bytes() == content(16)
+        assert session.get(url).as_bytes() == content(16)
+        assert session.stats() == CacheStats(hits=1, misses=1)
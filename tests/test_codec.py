@@ -0,0 +1,60 @@
+import json
+from typing import Any, Dict
+
+import _pytest
+import pytest
+import requests
+
+from tests.mock.echo import EchoMock
+from urequest import HttpSession, HttpUrl
+from urequest.codec import Codec, StdCodec, default_codec
+from urequest.response import HttpResponse
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+_document: Dict[str, Any] = {"name": "Ünïcode", "ids": [1, 2.5, None, True]}
+
+
+class _CountingCodec(StdCodec):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def decode(self, content: Any) -> Any:
+        self.calls += 1
+        return super().decode(content)
+
+
+@pytest.mark.parametrize("codec", (StdCodec(), default_codec()))  # noqa: PT007
+def test_codec_round_trip(codec: Codec) -> None:
+    encoded = codec.encode(_document)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == codec.decode(encoded) == _document
+
+
+def test_response_decodes_charset() -> None:
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-16"
+    response._content = json.dumps(_document).encode("utf-16")
+    assert HttpResponse(response, StdCodec()).as_json() == _document
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_session_codec(echo_mock: EchoMock) -> None:
+    codec = _CountingCodec()
+    with HttpSession(codec=codec) as session:
+        echo = session.post(HttpUrl(echo_mock.bind), as_dict=_document)
+        assert echo.as_json()["headers"]["content-type"] == "application/json"
+        assert json.loads(echo.as_json()["body"]) == _document
+        assert codec.calls == 1
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_session_codec_keeps_content_type(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        echo = session.put(
+            HttpUrl(echo_mock.bind),
+            as_dict=_document,
+            headers={"content-type": "application/vnd.api+json"},
+        ).as_json()
+        assert echo["headers"]["content-type"] == "application/vnd.api+json"
@@ -0,0 +1,61 @@
+import gzip
+import zlib
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import Compression, HttpSession, HttpUrl
+from urequest.compression import accepted_encodings
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def test_compress() -> None:
+    deflated = Compression("deflate", level=1).compress(b"data")
+    assert gzip.decompress(Compression().compress("data")) == b"data"
+    assert zlib.decompress(deflated) == b"data"
+
+
+def test_unsupported_encoding() -> None:
+    with pytest.raises(ValueError):
+        Compression("lzma")
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_large_body_is_compressed(echo_mock: EchoMock) -> None:
+    document = {"items": ["item"] * 1000}
+    with HttpSession(compression=Compression()) as session:
+        echo = session.post(
+            HttpUrl(echo_mock.bind), as_dict=document
+        ).as_json()
+    assert echo["headers"]["content-encoding"] == "gzip"
+    assert echo["headers"]["accept-encoding"] == accepted_encodings()
+    assert echo["size"] < len(echo["body"])
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_small_body_is_plain(echo_mock: EchoMock) -> None:
+    with HttpSession(compression=Compression(threshold=100)) as session:
+        echo = session.put(HttpUrl(echo_mock.bind), plain="data").as_json()
+        given = session.post(
+            HttpUrl(echo_mock.bind),
+            plain="data" * 100,
+            headers={"Content-Encoding": "identity"},
+        ).as_json()
+    assert "content-encoding" not in echo["headers"]
+    assert echo["body"] == "data"
+    assert given["headers"]["content-encoding"] == "identity"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_encoded_responses(echo_mock: EchoMock) -> None:
+    encodings = ["gzip", "deflate"]
+    if "br" in accepted_encodings():
+        encodings.append("br")
+    with HttpSession(compression=Compression()) as session:
+        for encoding in encodings:
+            response = session.get(
+                HttpUrl(echo_mock.bind, path=f"encoded/{encoding}")
+            )
+            assert response.as_json()["method"] == "GET"
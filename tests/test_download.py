@@ -0,0 +1,95 @@
+import json
+import os
+from pathlib import Path
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock, content
+from urequest import HttpSession, HttpUrl
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "file.bin"
+    with HttpSession() as session:
+        size = session.download(HttpUrl(echo_mock.bind, "file/3000"), target)
+    assert size == 3000
+    assert target.read_bytes() == content(3000)
+    assert not (tmp_path / "file.bin.download").exists()
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_segments(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "file.bin"
+    with HttpSession() as session:
+        session.download(
+            HttpUrl(echo_mock.bind, "file/100000"),
+            target,
+            segments=4,
+            memory_map=True,
+        )
+    assert target.read_bytes() == content(100000)
+    assert echo_mock.requests == 5
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_resumes_broken(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "file.bin"
+    with HttpSession() as session:
+        session.download(HttpUrl(echo_mock.bind, "broken/100000"), target)
+    assert target.read_bytes() == content(100000)
+    assert echo_mock.requests == 3
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_resumes_state(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "file.bin"
+    target.write_bytes(b"\0" * 1000)
+    (tmp_path / "file.bin.download").write_text(
+        json.dumps(
+            {"etag": '"file"', "length": 1000, "segments": [[10, 1000]]}
+        )
+    )
+    with HttpSession() as session:
+        session.download(HttpUrl(echo_mock.bind, "file/1000"), target)
+    assert target.read_bytes() == b"\0" * 10 + content(1000)[10:]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_without_ranges(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "echo.json"
+    with HttpSession() as session:
+        size = session.download(HttpUrl(echo_mock.bind, "chunked"), target)
+    assert size == len(target.read_bytes())
+    assert json.loads(target.read_bytes())["path"] == "/chunked"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_without_head(echo_mock: EchoMock, tmp_path: Path) -> None:
+    target = tmp_path / "file.bin"
+    with HttpSession() as session:
+        size = session.download(
+            HttpUrl(echo_mock.bind, "headless/3000"), target, segments=2
+        )
+    assert size == 3000
+    assert target.read_bytes() == content(3000)
+    assert echo_mock.requests == 4
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_download_saves_state_rarely(
+    echo_mock: EchoMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    saved = []
+    replace = os.replace
+    monkeypatch.setattr(
+        os, "replace", lambda *paths: saved.append(paths) or replace(*paths)
+    )
+    with HttpSession() as session:
+        session.download(
+            HttpUrl(echo_mock.bind, "file/3000000"), tmp_path / "file.bin"
+        )
+    assert len(saved) == 1
@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    DeadlineExceededError,
+    HttpSession,
+    HttpUrl,
+    SingleFlight,
+    deadline,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_single_flight_shares_response(echo_mock: EchoMock) -> None:
+    with HttpSession(flight=SingleFlight()) as session:
+        url = HttpUrl(echo_mock.bind, path="delay/0.3")
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            responses = list(
+                executor.map(lambda _: session.get(url), range(5))
+            )
+        assert all(response is responses[0] for response in responses)
+        assert echo_mock.requests == 1
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_single_flight_distinct_headers(echo_mock: EchoMock) -> None:
+    with HttpSession(flight=SingleFlight()) as session:
+        url = HttpUrl(echo_mock.bind, path="delay/0.3")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(
+                executor.map(
+                    lambda accept: session.get(
+                        url, headers={"Accept": accept}
+                    ),
+                    ("text/plain", "application/json"),
+                )
+            )
+        assert echo_mock.requests == 2
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_single_flight_methods(echo_mock: EchoMock) -> None:
+    with HttpSession(flight=SingleFlight(methods=("GET",))) as session:
+        url = HttpUrl(echo_mock.bind, path="delay/0.3")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: session.head(url), range(3)))
+        assert echo_mock.requests == 3
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_single_flight_waiter_deadline(echo_mock: EchoMock) -> None:
+    with HttpSession(flight=SingleFlight()) as session:
+        url = HttpUrl(echo_mock.bind, path="delay/1")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(session.get, url)
+            time.sleep(0.2)
+            started = time.monotonic()
+            with deadline(0.2), pytest.raises(DeadlineExceededError):
+                session.get(url)
+            assert time.monotonic() - started < 0.5
+            assert leader.result().is_ok()
+        assert echo_mock.requests == 1
@@ -0,0 +1,46 @@
+import time
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import Hedge, HedgeStats, HttpSession, HttpUrl, RetryBudget
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_hedge_wins_slow_request(echo_mock: EchoMock) -> None:
+    hedge = Hedge(delay=0.1)
+    with HttpSession(hedge=hedge) as session:
+        started = time.monotonic()
+        assert session.get(HttpUrl(echo_mock.bind, path="lag/1")).is_ok()
+        assert time.monotonic() - started < 0.9
+    assert hedge.stats() == HedgeStats(requests=1, hedged=1, won=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_hedge_skips_fast_request(echo_mock: EchoMock) -> None:
+    hedge = Hedge(delay=0.05)
+    with HttpSession(hedge=hedge) as session:
+        session.get(HttpUrl(echo_mock.bind))
+        session.post(HttpUrl(echo_mock.bind, path="delay/0.2"), plain="data")
+    assert hedge.stats() == HedgeStats(requests=1)
+    assert echo_mock.requests == 2
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_hedge_budget(echo_mock: EchoMock) -> None:
+    hedge = Hedge(delay=0.1, budget=RetryBudget(ratio=0, reserve=0))
+    with HttpSession(hedge=hedge) as session:
+        session.get(HttpUrl(echo_mock.bind, path="lag/1"))
+    assert hedge.stats() == HedgeStats(requests=1)
+
+
+def test_hedge_adaptive_delay() -> None:
+    hedge = Hedge(minimum=3)
+    url = HttpUrl("localhost")
+    for latency in (0.01, 0.02, 0.03):
+        assert hedge.delay(url.host()) is None
+        hedge.perform("GET", url, {}, lambda: time.sleep(latency))
+    assert 0.02 <= hedge.delay(url.host()) < 0.05
@@ -0,0 +1,69 @@
+from typing import List
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    Credentials,
+    Event,
+    Hooks,
+    HttpSession,
+    HttpUrl,
+    LoggedHttpSession,
+    ResponseError,
+    Retry,
+)
+from urequest.response import HTTPStatus
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def test_empty_hooks() -> None:
+    hooks = Hooks()
+    assert not hooks
+    hooks.after(print)
+    assert hooks
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_before_and_after_hooks(echo_mock: EchoMock) -> None:
+    events: List[Event] = []
+    with HttpSession() as session:
+        session.hooks().before(events.append)
+        session.hooks().after(events.append)
+        url = HttpUrl(echo_mock.bind)
+        response = session.post(url, plain="data")
+    before, after = events
+    assert (before.method, before.url, before.sent) == ("POST", url, 4)
+    assert before.status is None
+    assert after.status == HTTPStatus.OK
+    assert after.received == len(str(response).encode())
+    assert after.timing == response.timing()
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_error_hook(echo_mock: EchoMock) -> None:
+    errors: List[Event] = []
+    hooks = Hooks()
+    hooks.error(errors.append)
+    with HttpSession(hooks=hooks) as session:
+        with pytest.raises(ResponseError):
+            session.get(HttpUrl(echo_mock.bind, path="status/404"))
+    (event,) = errors
+    assert event.status == HTTPStatus.NOT_FOUND
+    assert isinstance(event.error, ResponseError)
+    assert event.timing.total > 0
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_hooks_per_attempt(echo_mock: EchoMock) -> None:
+    statuses: List[HTTPStatus] = []
+    hooks = Hooks()
+    hooks.error(lambda event: statuses.append(event.status))
+    hooks.after(lambda event: statuses.append(event.status))
+    with LoggedHttpSession(
+        Credentials("user", "pass"), retry=Retry(backoff=0), hooks=hooks
+    ) as session:
+        session.get(HttpUrl(echo_mock.bind, path="flaky/1"))
+    assert statuses == [HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.OK]
@@ -0,0 +1,103 @@
+# pylint: disable-all
+import json
+from typing import Any, Iterator, List
+
+import _pytest.mark
+import pytest
+from tests.fake.response import FakeHttpResponse
+from tests.mock.echo import EchoMock
+from urequest import HTTPStatus, HttpSession, HttpUrl
+from urequest.items import iter_items, select_items
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+_document: Any = {
+    "total": 3,
+    "skipped": [{"nested": [1, 2]}, "text with ] and }"],
+    "data": [
+        {"id": 1, "name": "Mike", "tags": ["a"]},
+        {"id": 12345678901234567890, "name": "Łukasz", "tags": []},
+        {"id": 3.5e-1, "name": None, "tags": ["b", "c"]},
+    ],
+}
+
+
+def _chunks(document: Any, size: int = 1) -> Iterator[bytes]:
+    content = json.dumps(document, ensure_ascii=False).encode()
+    return (
+        content[start:][:size] for start in range(0, len(content), size)
+    )
+
+
+@pytest.mark.parametrize("size", (1, 3, 1024))  # noqa: PT006, PT007
+def test_iter_items(size: int) -> None:
+    items = list(iter_items(_chunks(_document, size), "data.item"))
+    assert items == _document["data"]
+
+
+def test_iter_nested_items() -> None:
+    assert list(iter_items(_chunks(_document), "data.item.tags.item")) == [
+        "a",
+        "b",
+        "c",
+    ]
+
+
+def test_iter_top_level_items() -> None:
+    assert list(iter_items(_chunks([1, [2], {"three": 3}]))) == [
+        1,
+        [2],
+        {"three": 3},
+    ]
+
+
+def test_iter_value() -> None:
+    assert list(iter_items(_chunks(_document), "total")) == [3]
+
+
+def test_iter_missing_items() -> None:
+    assert list(iter_items(_chunks(_document), "missing.item")) == []
+
+
+def test_iter_items_lazily() -> None:
+    consumed: List[bytes] = []
+
+    def chunks() -> Iterator[bytes]:
+        for chunk in _chunks([{"id": 1}, {"id": 2}], size=4):
+            consumed.append(chunk)
+            yield chunk
+
+    items = iter_items(chunks())
+    assert next(items) == {"id": 1}
+    assert len(consumed) < 6
+
+
+def test_iter_malformed_items() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_items((b'[{"id": 1}, {"id": ',)))
+
+
+def test_select_items() -> None:
+    assert list(select_items(_document, "data.item.name")) == [
+        "Mike",
+        "Łukasz",
+        None,
+    ]
+
+
+def test_response_json_items() -> None:
+    assert list(
+        FakeHttpResponse(HTTPStatus.OK, as_dict=_document).iter_json_items(
+            "data.item.id"
+        )
+    ) == [1, 12345678901234567890, 0.35]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_response_json_items(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        assert list(
+            session.get(
+                HttpUrl(echo_mock.bind, path="chunked"), stream=True
+            ).iter_json_items("path")
+        ) == ["/chunked"]
@@ -0,0 +1,130 @@
+import io
+import subprocess
+import sys
+from http import HTTPStatus
+from typing import Iterator
+
+import _pytest
+import pytest
+
+from tests.mock.echo import CERTIFICATE, EchoMock
+from urequest import (
+    HttpsUrl,
+    HttpUrl,
+    LightHttpSession,
+    ResponseError,
+    Tls,
+)
+from urequest.protocol import ReadTimeoutError
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.fixture()
+def mock(echo_mock: EchoMock) -> Iterator[EchoMock]:
+    yield echo_mock
+    echo_mock.clean_up()
+
+
+def test_get(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        response = session.get(
+            HttpUrl(mock.bind, path="users"), params={"page": "2"}
+        )
+    assert response.status() is HTTPStatus.OK
+    assert response.as_json()["path"] == "/users?page=2"
+    assert response.headers()["Content-Type"] == "application/json"
+
+
+def test_post(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        echo = session.post(
+            HttpUrl(mock.bind, path="users"), as_dict={"name": "Mike"}
+        ).as_json()
+    assert echo["method"] == "POST"
+    assert echo["body"] == '{"name": "Mike"}'
+    assert echo["headers"]["content-type"] == "application/json"
+
+
+def test_upload(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        echo = session.put(
+            HttpUrl(mock.bind), io.BytesIO(b"streamed")
+        ).as_json()
+        chunked = session.patch(
+            HttpUrl(mock.bind), iter((b"a", b"b"))
+        ).as_json()
+    assert echo["body"] == "streamed"
+    assert echo["headers"]["content-length"] == "8"
+    assert chunked["body"] == "ab"
+    assert chunked["headers"]["transfer-encoding"] == "chunked"
+
+
+def test_head(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        response = session.head(HttpUrl(mock.bind))
+    assert response.is_ok()
+    assert not response.as_bytes()
+
+
+def test_keeps_connections_alive(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        for _ in range(3):
+            session.get(HttpUrl(mock.bind))
+    assert mock.connections == 1
+
+
+def test_redirect(mock: EchoMock) -> None:
+    with LightHttpSession() as session:
+        echo = session.post(
+            HttpUrl(mock.bind, path="redirect/303"), "moved"
+        ).as_json()
+        with pytest.raises(ResponseError) as error:
+            session.get(
+                HttpUrl(mock.bind, path="redirect/302"),
+                allow_redirects=False,
+            )
+    assert echo["method"] == "GET"
+    assert echo["path"] == "/users"
+    assert error.value.response().status() is HTTPStatus.FOUND
+
+
+def test_status_error(mock: EchoMock) -> None:
+    with LightHttpSession() as session, pytest.raises(ResponseError):
+        session.get(HttpUrl(mock.bind, path="status/500"))
+
+
+def test_read_timeout(mock: EchoMock) -> None:
+    with LightHttpSession() as session, pytest.raises(ReadTimeoutError):
+        session.get(HttpUrl(mock.bind, path="delay/1"), timeout=0.1)
+
+
+def test_unsupported_argument(mock: EchoMock) -> None:
+    with LightHttpSession() as session, pytest.raises(TypeError):
+        session.get(HttpUrl(mock.bind), stream=True)
+
+
+def test_https(tls_mock: EchoMock) -> None:
+    context = Tls(ca_bundle=CERTIFICATE).context(shared=False)
+    with LightHttpSession(context=context) as session:
+        echo = session.get(
+            HttpsUrl(f"localhost:{tls_mock.bind.split(':')[1]}")
+        ).as_json()
+    assert echo["method"] == "GET"
+
+
+def test_does_not_import_requests() -> None:
+    modules = subprocess.run(
+        (
+            sys.executable,
+            "-c",
+            "import sys; from urequest import LightHttpSession; "
+            "print(' '.join(sys.modules))",
+        ),
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.split()
+    assert "urequest.light" in modules
+    assert "requests" not in modules
+    assert "urllib3" not in modules
@@ -0,0 +1,74 @@
+import time
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    DeadlineExceededError,
+    HttpSession,
+    HttpUrl,
+    RateLimiter,
+    RateLimitError,
+    deadline,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def test_limiter_burst() -> None:
+    limiter = RateLimiter(rate=1, burst=2)
+    assert limiter.try_acquire("host")
+    assert limiter.try_acquire("host")
+    assert not limiter.try_acquire("host")
+    assert limiter.try_acquire("other")
+
+
+def test_limiter_blocking() -> None:
+    limiter = RateLimiter(rate=20)
+    started = time.monotonic()
+    assert all(limiter.acquire("host") for _ in range(5))
+    assert time.monotonic() - started >= 0.2
+    assert not limiter.acquire("host", timeout=0.01)
+
+
+def test_limiter_rate_limit_headers() -> None:
+    limiter = RateLimiter(rate=1000)
+    limiter.observe(
+        "host", {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "60"}
+    )
+    assert not limiter.try_acquire("host")
+    limiter.observe(
+        "other", {"x-ratelimit-remaining": "1", "x-ratelimit-reset": "60"}
+    )
+    assert limiter.try_acquire("other")
+    assert not limiter.acquire("other", timeout=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_limiter_session(echo_mock: EchoMock) -> None:
+    limiter = RateLimiter(rate=1, timeout=0)
+    with HttpSession(limiter=limiter) as session:
+        assert session.get(HttpUrl(echo_mock.bind)).is_ok()
+        with pytest.raises(RateLimitError):
+            session.get(HttpUrl(echo_mock.bind))
+    assert echo_mock.requests == 1
+
+
+def test_limiter_retry_after() -> None:
+    limiter = RateLimiter(rate=1000, burst=10)
+    limiter.observe("host", {"retry-after": "1"})
+    assert not limiter.try_acquire("host")
+    assert not limiter.acquire("host", timeout=0.5)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_limiter_deadline(echo_mock: EchoMock) -> None:
+    limiter = RateLimiter(rate=0.1, timeout=30)
+    with HttpSession(limiter=limiter) as session:
+        session.get(HttpUrl(echo_mock.bind))
+        started = time.monotonic()
+        with deadline(5), pytest.raises(DeadlineExceededError):
+            session.get(HttpUrl(echo_mock.bind))
+        assert time.monotonic() - started < 0.5
+    assert echo_mock.requests == 1
@@ -0,0 +1,77 @@
+from dataclasses import replace
+from typing import List
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    Call,
+    Credentials,
+    HttpSession,
+    HttpUrl,
+    Interceptor,
+    LoggedHttpSession,
+    Response,
+)
+from urequest.pipeline import Handler, pipeline
+from urequest.response import RawHttpResponse
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+class _Tagged(Interceptor):
+    def __init__(self, tag: str, trail: List[str]) -> None:
+        self._tag = tag
+        self._trail = trail
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        self._trail.append(self._tag)
+        headers = {**call.kwargs.get("headers", {}), "X-Tag": self._tag}
+        return proceed(
+            replace(call, kwargs={**call.kwargs, "headers": headers})
+        )
+
+
+class _Canned(Interceptor):
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        return RawHttpResponse(200, {}, b"canned")
+
+
+def test_pipeline_order() -> None:
+    trail: List[str] = []
+    handler = pipeline(
+        (_Tagged("outer", trail), _Tagged("inner", trail)),
+        lambda call: RawHttpResponse(
+            200, {}, call.kwargs["headers"]["X-Tag"].encode()
+        ),
+    )
+    assert str(handler(Call("GET", HttpUrl("localhost"), {}))) == "inner"
+    assert trail == ["outer", "inner"]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_session_interceptors(echo_mock: EchoMock) -> None:
+    trail: List[str] = []
+    with HttpSession(interceptors=[_Tagged("tag", trail)]) as session:
+        response = session.get(HttpUrl(echo_mock.bind))
+    assert response.as_json()["headers"]["x-tag"] == "tag"
+    assert trail == ["tag"]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_interceptor_short_circuit(echo_mock: EchoMock) -> None:
+    with HttpSession(interceptors=[_Canned()]) as session:
+        assert str(session.get(HttpUrl(echo_mock.bind))) == "canned"
+    assert echo_mock.requests == 0
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_logged_session_verbs(echo_mock: EchoMock) -> None:
+    with LoggedHttpSession(Credentials("user", "pass")) as session:
+        url = HttpUrl(echo_mock.bind)
+        sent = session.put(url, as_dict={"a": 1}).as_json()
+        own = session.get(url, auth=("other", "pass")).as_json()
+    assert sent["method"] == "PUT"
+    assert sent["headers"]["authorization"] == "Basic dXNlcjpwYXNz"
+    assert own["headers"]["authorization"] == "Basic b3RoZXI6cGFzcw=="
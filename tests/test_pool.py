@@ -0,0 +1,83 @@
+# pylint: disable-all
+import socket
+from typing import Any
+import _pytest.mark
+from _pytest.monkeypatch import MonkeyPatch
+import pytest
+import requests
+from urequest.pool import Pool, PooledAdapter
+from urequest.session import HttpSession
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.fixture()
+def pool() -> Pool:
+    return Pool(
+        hosts=2,
+        connections=3,
+        block=True,
+        idle_timeout=5,
+        per_host={"hard.host": 30},
+    )
+
+
+@pytest.fixture()
+def adapter(pool: Pool) -> PooledAdapter:
+    return PooledAdapter(pool)
+
+
+def test_pool_connections_for_host(pool: Pool) -> None:
+    assert pool.connections_for("hard.host") == 30
+
+
+def test_pool_default_connections(pool: Pool) -> None:
+    assert pool.connections_for("other.host") == 3
+
+
+def test_adapter_pool_size(adapter: PooledAdapter) -> None:
+    assert adapter.poolmanager.connection_from_url("http://other.host").pool.maxsize == 3
+
+
+def test_adapter_per_host_pool_size(adapter: PooledAdapter) -> None:
+    assert adapter.poolmanager.connection_from_url("http://hard.host").pool.maxsize == 30
+
+
+def test_adapter_pool_block(adapter: PooledAdapter) -> None:
+    assert adapter.poolmanager.connection_from_url("http://other.host").block
+
+
+def _kept_connection(
+    adapter: PooledAdapter, monkeypatch: MonkeyPatch, idle: float
+) -> Any:
+    host_pool = adapter.poolmanager.connection_from_url("http://other.host")
+    connection = host_pool._get_conn()
+    connection.sock, peer = socket.socketpair()
+    monkeypatch.setattr("urequest.pool.monotonic", lambda: 100.0)
+    host_pool._put_conn(connection)
+    monkeypatch.setattr("urequest.pool.monotonic", lambda: 100.0 + idle)
+    kept = host_pool._get_conn()
+    peer.close()
+    return kept
+
+
+def test_adapter_drops_idle_connection(
+    adapter: PooledAdapter, monkeypatch: MonkeyPatch
+) -> None:
+    assert _kept_connection(adapter, monkeypatch, idle=6).sock is None
+
+
+def test_adapter_keeps_fresh_connection(
+    adapter: PooledAdapter, monkeypatch: MonkeyPatch
+) -> None:
+    assert _kept_connection(adapter, monkeypatch, idle=4).sock is not None
+
+
+def test_session_mounts_pool(pool: Pool) -> None:
+    session = requests.Session()
+    HttpSession(session, pool)
+    assert isinstance(session.get_adapter("https://hard.host"), PooledAdapter)
+
+
+def test_sessions_own_pools() -> None:
+    assert HttpSession()._session is not HttpSession()._session
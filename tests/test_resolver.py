@@ -0,0 +1,66 @@
+import socket
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import HttpSession, HttpUrl, Pool, Resolver, ResolverStats
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def test_resolver_cache() -> None:
+    resolver = Resolver(entries=1)
+    resolver.resolve("localhost", 80)
+    resolver.resolve("localhost", 80)
+    resolver.resolve("127.0.0.1", 80)
+    assert resolver.stats() == ResolverStats(hits=1, misses=2, evictions=1)
+
+
+def test_resolver_ttl() -> None:
+    resolver = Resolver(ttl=0)
+    resolver.resolve("localhost", 80)
+    resolver.resolve("localhost", 80)
+    assert resolver.stats() == ResolverStats(misses=2, expirations=1)
+
+
+def test_resolver_balances_records() -> None:
+    resolver = Resolver(overrides={"api.test": ["127.0.0.1", "127.0.0.2"]})
+    first = resolver.resolve("api.test", 80)
+    second = resolver.resolve("api.test", 80)
+    assert [address for _, address in first] == [
+        ("127.0.0.1", 80),
+        ("127.0.0.2", 80),
+    ]
+    assert second == first[::-1]
+
+
+def test_resolver_interleaves_families() -> None:
+    resolver = Resolver(overrides={"api.test": ["::1", "::2", "127.0.0.1"]})
+    families = [family for family, _ in resolver.resolve("api.test", 80)]
+    assert families == [socket.AF_INET6, socket.AF_INET, socket.AF_INET6]
+
+
+def test_resolver_connects_next_address(echo_mock: EchoMock) -> None:
+    host, port = echo_mock.bind.split(":")
+    resolver = Resolver(overrides={"api.test": [host]})
+    closed = resolver.resolve("api.test", 1)
+    opened = resolver.resolve("api.test", int(port))
+    connection = resolver.connect([closed[0], opened[0]], timeout=1)
+    assert connection.getpeername()[1] == int(port)
+    connection.close()
+    with pytest.raises(OSError):
+        resolver.connect(closed, timeout=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_session_resolves_overrides(echo_mock: EchoMock) -> None:
+    host, port = echo_mock.bind.split(":")
+    resolver = Resolver(overrides={"echo.test": [host]})
+    url = HttpUrl(f"echo.test:{port}")
+    with HttpSession(pool=Pool(resolver=resolver)) as session:
+        echo = session.get(url).as_json()
+    with HttpSession(pool=Pool(resolver=resolver)) as session:
+        session.get(url)
+    assert echo["headers"]["host"] == f"echo.test:{port}"
+    assert resolver.stats() == ResolverStats(hits=1, misses=1)
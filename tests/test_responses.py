@@ -2,9 +2,11 @@
 from typing import Iterable
 import _pytest.mark
 import pytest
+import requests
 from tests.fake.response import FakeHttpResponse
 from urequest.response import (
     HTTPStatus,
+    HttpResponse,
     Response,
     ResponseError,
     safe_response,
@@ -106,3 +108,37 @@ def test_logged_response_code(logged_response: Response) -> None:
 
 def test_logged_response_text(logged_response: Response) -> None:
     assert str(logged_response)
+
+
+def _http_response(content: bytes) -> HttpResponse:
+    response = requests.Response()
+    response.status_code = HTTPStatus.OK
+    response.encoding = "utf-8"
+    response._content = content
+    return HttpResponse(response)
+
+
+def test_http_response_memoized() -> None:
+    response = _http_response(b'{"users": [1, 2]}')
+    assert response.as_json() is response.as_json()
+    assert str(response) is str(response)
+    assert response.status() is HTTPStatus.OK
+
+
+def test_http_response_slots() -> None:
+    assert not hasattr(_http_response(b"{}"), "__dict__")
+
+
+def test_http_response_bytes() -> None:
+    content = b"\x89PNG\r\n\x1a\n\xff"
+    response = _http_response(content)
+    assert response.as_bytes() is content
+    view = response.as_memoryview()
+    assert view.readonly
+    assert view.obj is content
+
+
+def test_fallback_bytes() -> None:
+    response = FakeHttpResponse(HTTPStatus.OK, as_str="ok")
+    assert response.as_bytes() == b"ok"
+    assert bytes(response.as_memoryview()) == b"ok"
@@ -0,0 +1,69 @@
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    HttpConnectionError,
+    HttpSession,
+    HttpUrl,
+    ResponseError,
+    Retry,
+    RetryBudget,
+    RetryStats,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_retry_recovers(echo_mock: EchoMock) -> None:
+    retry = Retry(attempts=3, backoff=0.01)
+    with HttpSession(retry=retry) as session:
+        assert session.get(HttpUrl(echo_mock.bind, path="flaky/2")).is_ok()
+        assert retry.stats() == RetryStats(requests=1, retries=2)
+        assert echo_mock.requests == 3
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_retry_exhausted(echo_mock: EchoMock) -> None:
+    retry = Retry(attempts=2, backoff=0.01)
+    with HttpSession(retry=retry) as session, pytest.raises(ResponseError):
+        session.get(HttpUrl(echo_mock.bind, path="status/503"))
+    assert retry.stats() == RetryStats(requests=1, retries=1, exhausted=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_retry_idempotent_only(echo_mock: EchoMock) -> None:
+    retry = Retry(backoff=0.01)
+    with HttpSession(retry=retry) as session, pytest.raises(ResponseError):
+        session.post(HttpUrl(echo_mock.bind, path="flaky/1"), plain="data")
+    assert echo_mock.requests == 1
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_retry_budget(echo_mock: EchoMock) -> None:
+    retry = Retry(backoff=0.01, budget=RetryBudget(ratio=0, reserve=1))
+    with HttpSession(retry=retry) as session:
+        session.get(HttpUrl(echo_mock.bind, path="flaky/1"))
+        with pytest.raises(ResponseError):
+            session.get(HttpUrl(echo_mock.bind, path="status/502"))
+    assert retry.stats() == RetryStats(requests=2, retries=1, throttled=1)
+
+
+def test_retry_connection_error() -> None:
+    retry = Retry(attempts=2, backoff=0.01)
+    with HttpSession(retry=retry) as session:
+        with pytest.raises(HttpConnectionError):
+            session.get(HttpUrl("127.0.0.1:1"))
+    assert retry.stats() == RetryStats(requests=1, retries=1, exhausted=1)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_retry_unreplayable_body(echo_mock: EchoMock) -> None:
+    retry = Retry(backoff=0.01)
+    with HttpSession(retry=retry) as session, pytest.raises(ResponseError):
+        session.put(
+            HttpUrl(echo_mock.bind, path="flaky/1"), iter((b"a", b"b"))
+        )
+    assert retry.stats() == RetryStats(requests=1)
+    assert echo_mock.requests == 1
@@ -9,13 +9,6 @@ from urequest import HttpUrl, Response, Session
 pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
 
 
-@pytest.fixture()
-def _clean_up_employees(employees_mock: Mock) -> None:
-    """Cleans up employees storage at teardown."""
-    yield
-    employees_mock.clean_up()
-
-
 @pytest.mark.usefixtures("_clean_up_employees")
 def test_session_get(employees_mock: Mock, session: Session) -> None:
     response: Response = session.get(HttpUrl(employees_mock.bind))
@@ -0,0 +1,79 @@
+import json
+from pathlib import Path
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import HttpSession, HttpUrl, ResponseError, StreamResponse
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_iter_bytes(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        response = session.get(
+            HttpUrl(echo_mock.bind, path="chunked"), stream=True
+        )
+        assert isinstance(response, StreamResponse)
+        chunks = list(response.iter_bytes(chunk_size=8))
+        assert all(len(chunk) <= 8 for chunk in chunks)
+        assert json.loads(b"".join(chunks))["path"] == "/chunked"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_iter_lines(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        lines = list(
+            session.get(HttpUrl(echo_mock.bind), stream=True).iter_lines()
+        )
+        assert json.loads(lines[0])["method"] == "GET"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_save_to(echo_mock: EchoMock, tmp_path: Path) -> None:
+    with HttpSession() as session:
+        written = session.get(
+            HttpUrl(echo_mock.bind, path="saved"), stream=True
+        ).save_to(tmp_path / "saved.json")
+        content = (tmp_path / "saved.json").read_bytes()
+        assert written == len(content)
+        assert json.loads(content)["path"] == "/saved"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_releases_connection(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        for _ in range(3):
+            with session.get(HttpUrl(echo_mock.bind), stream=True) as stream:
+                assert b"".join(stream.iter_bytes())
+        assert echo_mock.connections == 1
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_error(echo_mock: EchoMock) -> None:
+    with HttpSession() as session, pytest.raises(ResponseError):
+        session.get(HttpUrl(echo_mock.bind, path="status/500"), stream=True)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_readinto(echo_mock: EchoMock) -> None:
+    buffer = bytearray(16)
+    body = bytearray()
+    with HttpSession() as session:
+        response = session.get(
+            HttpUrl(echo_mock.bind, path="encoded/gzip"), stream=True
+        )
+        read = response.readinto(buffer)
+        while read:
+            body += memoryview(buffer)[:read]
+            read = response.readinto(buffer)
+    assert json.loads(body)["path"] == "/encoded/gzip"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_stream_as_bytes(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        response = session.get(HttpUrl(echo_mock.bind), stream=True)
+        assert json.loads(response.as_bytes())["method"] == "GET"
@@ -0,0 +1,87 @@
+from time import monotonic
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    DeadlineExceededError,
+    HttpConnectionError,
+    HttpSession,
+    HttpUrl,
+    RequestTimeoutError,
+    Retry,
+    Timeouts,
+    deadline,
+)
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def test_nested_deadline_shrinks() -> None:
+    with deadline(5) as outer:
+        with deadline(0.1) as inner:
+            assert inner is not None and inner <= 0.1
+        with deadline(10) as kept:
+            assert kept is not None and outer is not None and kept <= outer
+    with deadline(None) as left:
+        assert left is None
+
+
+def test_attempt_bounded_by_deadline() -> None:
+    timeouts = Timeouts(connect=1, read=10)
+    assert timeouts.attempt("url") == (1, 10)
+    with deadline(0.5):
+        connect, read = timeouts.attempt("url")
+    assert connect <= 0.5 and read <= 0.5
+    with deadline(0), pytest.raises(DeadlineExceededError):
+        timeouts.attempt("url")
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_read_timeout(echo_mock: EchoMock) -> None:
+    with HttpSession(timeouts=Timeouts(read=0.2)) as session:
+        with pytest.raises(RequestTimeoutError) as error:
+            session.get(HttpUrl(echo_mock.bind, path="stall"))
+    assert not isinstance(error.value, HttpConnectionError)
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_timeout_argument_overrides(echo_mock: EchoMock) -> None:
+    with HttpSession(timeouts=Timeouts(read=10)) as session:
+        with pytest.raises(RequestTimeoutError):
+            session.get(HttpUrl(echo_mock.bind, path="stall"), timeout=0.2)
+        with pytest.raises(RequestTimeoutError):
+            session.get(
+                HttpUrl(echo_mock.bind, path="stall"),
+                timeout=Timeouts(total=0.2),
+            )
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_total_timeout_covers_retries(echo_mock: EchoMock) -> None:
+    retry = Retry(attempts=10, backoff=0.01)
+    started = monotonic()
+    with HttpSession(retry=retry, timeouts=Timeouts(total=0.5)) as session:
+        with pytest.raises(RequestTimeoutError):
+            session.get(HttpUrl(echo_mock.bind, path="stall"))
+    assert monotonic() - started < 2
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_exceeded_deadline_skips_request(echo_mock: EchoMock) -> None:
+    with HttpSession() as session, deadline(0):
+        with pytest.raises(DeadlineExceededError):
+            session.get(HttpUrl(echo_mock.bind))
+    assert echo_mock.requests == 0
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_batch_inherits_deadline(echo_mock: EchoMock) -> None:
+    url = HttpUrl(echo_mock.bind, path="stall")
+    with HttpSession() as session, deadline(0.3):
+        outcomes = list(session.get_many([url, url]))
+    assert all(
+        isinstance(outcome.error(), RequestTimeoutError)
+        for outcome in outcomes
+    )
@@ -0,0 +1,84 @@
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import (
+    HttpSession,
+    HttpUrl,
+    Latencies,
+    LatencyHistogram,
+    Timing,
+)
+from urequest.response import Response
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_timing_breakdown(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        first: Response = session.get(HttpUrl(echo_mock.bind, "delay/0.1"))
+        second: Response = session.get(HttpUrl(echo_mock.bind))
+    timing: Timing = first.timing()
+    assert timing.dns > 0
+    assert timing.connect > 0
+    assert timing.tls == 0
+    assert 0.1 <= timing.first_byte <= timing.total
+    assert timing.download >= 0
+    assert second.timing().connect == 0
+    assert second.timing().total > 0
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_streamed_timing(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        response = session.get(HttpUrl(echo_mock.bind), stream=True)
+        with response:
+            assert response.timing().first_byte > 0
+            assert response.timing().download == 0
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_session_latencies(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        for _ in range(3):
+            session.get(HttpUrl(echo_mock.bind))
+        session.delete(HttpUrl(echo_mock.bind))
+    exported = session.latencies().export()
+    assert [(row["method"], row["count"]) for row in exported] == [
+        ("DELETE", 1),
+        ("GET", 3),
+    ]
+    assert all(row["host"] == echo_mock.bind for row in exported)
+
+
+def test_histogram_percentiles() -> None:
+    histogram = LatencyHistogram()
+    for millisecond in range(1, 101):
+        histogram.record(millisecond / 1000)
+    assert histogram.count() == 100
+    assert histogram.percentile(0.5) == pytest.approx(0.05, rel=0.02)
+    assert histogram.percentile(0.99) == pytest.approx(0.099, rel=0.02)
+    assert histogram.percentile(1) == 0.1
+    summary = histogram.summary()
+    assert summary["mean"] == pytest.approx(0.0505)
+    assert summary["max"] == 0.1
+
+
+def test_empty_histogram() -> None:
+    assert LatencyHistogram().summary() == {
+        "count": 0,
+        "mean": 0.0,
+        "p50": 0.0,
+        "p95": 0.0,
+        "p99": 0.0,
+        "max": 0.0,
+    }
+
+
+def test_latencies_by_host_and_method() -> None:
+    latencies = Latencies()
+    latencies.record("a.com", "get", 0.2)
+    latencies.record("a.com", "GET", 0.4)
+    assert latencies.histogram("a.com", "GET").count() == 2
+    assert latencies.histogram("b.com", "GET").count() == 0
@@ -0,0 +1,63 @@
+import ssl
+
+import _pytest
+import pytest
+
+from tests.mock.echo import CERTIFICATE, EchoMock
+from urequest import HttpConnectionError, HttpSession, HttpsUrl, Pool, Tls
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def _url(mock: EchoMock) -> HttpsUrl:
+    return HttpsUrl(f"localhost:{mock.bind.split(':')[1]}")
+
+
+def test_context_is_shared() -> None:
+    assert (
+        Tls(ca_bundle=CERTIFICATE).context()
+        is Tls(ca_bundle=CERTIFICATE).context()
+    )
+    assert (
+        Tls(ca_bundle=CERTIFICATE).context()
+        is not Tls(ca_bundle=CERTIFICATE, resumption=False).context()
+    )
+
+
+def test_ca_data() -> None:
+    with open(CERTIFICATE) as certificate:
+        context = Tls(ca_data=certificate.read()).context()
+    assert context.cert_store_stats()["x509_ca"] == 1
+    assert context.verify_mode == ssl.CERT_REQUIRED
+
+
+def test_sessions_are_resumed(tls_mock: EchoMock) -> None:
+    tls = Tls(ca_bundle=CERTIFICATE)
+    before = tls.stats()
+    with HttpSession(pool=Pool(tls=tls)) as session:
+        for _ in range(3):
+            echo = session.get(
+                _url(tls_mock), headers={"Connection": "close"}
+            ).as_json()
+            assert echo["method"] == "GET"
+    assert tls.stats().handshakes - before.handshakes == 3
+    assert tls.stats().resumed - before.resumed == 2
+
+
+def test_sessions_are_not_resumed(tls_mock: EchoMock) -> None:
+    tls = Tls(ca_bundle=CERTIFICATE, resumption=False)
+    before = tls.stats()
+    with HttpSession(pool=Pool(tls=tls)) as session:
+        for _ in range(2):
+            session.get(_url(tls_mock), headers={"Connection": "close"})
+    assert tls.stats().resumed == before.resumed
+
+
+@pytest.mark.filterwarnings(
+    "ignore::urllib3.exceptions.InsecureRequestWarning"
+)
+def test_untrusted_certificate(tls_mock: EchoMock) -> None:
+    with HttpSession(pool=Pool(tls=Tls())) as session:
+        with pytest.raises(HttpConnectionError):
+            session.get(_url(tls_mock))
+        assert session.get(_url(tls_mock), verify=False).is_ok()
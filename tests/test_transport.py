@@ -0,0 +1,107 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Iterator
+
+import _pytest
+import pytest
+
+from tests.mock import Endpoint, Mock
+from tests.mock.echo import CERTIFICATE, EchoMock
+from urequest import (
+    Http2Transport,
+    HttpConnectionError,
+    HttpSession,
+    HttpsUrl,
+    ResponseError,
+    Tls,
+)
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from tests.mock.http2 import Http2Mock  # noqa: E402,I100
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+@pytest.fixture(scope="module")
+def http2_mock() -> Iterator[Mock]:
+    with Http2Mock(Endpoint(host="127.0.0.1", port=4449)) as mock:
+        yield mock
+
+
+@pytest.fixture()
+def http2_session() -> Iterator[HttpSession]:
+    with HttpSession(
+        transport=Http2Transport(Tls(ca_bundle=CERTIFICATE))
+    ) as session:
+        yield session
+
+
+def _url(mock: Mock, path: str = "") -> HttpsUrl:
+    return HttpsUrl(f"localhost:{mock.bind.split(':')[1]}", path=path)
+
+
+def test_get(http2_mock: Mock, http2_session: HttpSession) -> None:
+    echo = http2_session.get(
+        _url(http2_mock, "items"), params={"page": 2}
+    ).as_json()
+    assert echo["protocol"] == "HTTP/2"
+    assert echo["method"] == "GET"
+    assert echo["path"] == "/items?page=2"
+
+
+def test_post(http2_mock: Mock, http2_session: HttpSession) -> None:
+    echo = http2_session.post(
+        _url(http2_mock),
+        as_dict={"name": "Bob"},
+        headers={"Connection": "close"},
+    ).as_json()
+    assert json.loads(echo["body"]) == {"name": "Bob"}
+    assert "connection" not in echo["headers"]
+
+
+def test_status_error(http2_mock: Mock, http2_session: HttpSession) -> None:
+    with pytest.raises(ResponseError):
+        http2_session.get(_url(http2_mock, "status/404"))
+
+
+def test_stream(http2_mock: Mock, http2_session: HttpSession) -> None:
+    buffer = bytearray(16)
+    body = bytearray()
+    with http2_session.get(_url(http2_mock), stream=True) as response:
+        read = response.readinto(buffer)
+        while read:
+            body += memoryview(buffer)[:read]
+            read = response.readinto(buffer)
+    assert json.loads(body)["protocol"] == "HTTP/2"
+
+
+def test_multiplexed(http2_mock: Mock, http2_session: HttpSession) -> None:
+    http2_session.get(_url(http2_mock))
+    http2_mock.clean_up()
+    started = perf_counter()
+    with ThreadPoolExecutor(8) as executor:
+        responses = list(
+            executor.map(
+                lambda _: http2_session.get(_url(http2_mock, "delay/0.3")),
+                range(8),
+            )
+        )
+    assert perf_counter() - started < 1.5
+    assert all(response.is_ok() for response in responses)
+    assert http2_mock.connections == 0
+
+
+def test_http1_fallback(
+    tls_mock: EchoMock, http2_session: HttpSession
+) -> None:
+    echo = http2_session.get(_url(tls_mock)).as_json()
+    assert echo["method"] == "GET"
+
+
+def test_untrusted_certificate(http2_mock: Mock) -> None:
+    with HttpSession(transport=Http2Transport(Tls())) as session:
+        with pytest.raises(HttpConnectionError):
+            session.get(_url(http2_mock))
@@ -0,0 +1,118 @@
+import io
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import _pytest
+import pytest
+
+from tests.mock.echo import EchoMock
+from urequest import HttpSession, HttpUrl, Multipart, Retry, Upload
+
+pytestmark: _pytest.mark.MarkDecorator = pytest.mark.unittest
+
+
+def _chunks() -> Iterator[bytes]:
+    yield b"first "
+    yield b"second"
+
+
+def test_upload_length(tmp_path: Path) -> None:
+    path = tmp_path / "body.txt"
+    path.write_bytes(b"data" * 10)
+    assert Upload(path).length() == 40
+    assert Upload(bytearray(5)).length() == 5
+    assert Upload(_chunks()).length() is None
+
+
+def test_upload_chunks() -> None:
+    stream = Upload(b"abcdefg", chunk_size=3).stream()
+    assert [bytes(chunk) for chunk in stream] == [b"abc", b"def", b"g"]
+    assert stream.len == 7
+
+
+def test_upload_iterator_once() -> None:
+    upload = Upload(_chunks())
+    list(upload.stream())
+    with pytest.raises(ValueError):
+        upload.stream()
+
+
+def test_upload_replayable(tmp_path: Path) -> None:
+    path = tmp_path / "body.txt"
+    path.write_bytes(b"body")
+    assert Upload(io.BytesIO(b"body")).replayable()
+    assert Multipart({"name": "user", "file": ("a.txt", path)}).replayable()
+    assert not Upload(_chunks()).replayable()
+    assert not Multipart({"file": ("a.txt", _chunks())}).replayable()
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_upload_path(echo_mock: EchoMock, tmp_path: Path) -> None:
+    path = tmp_path / "body.txt"
+    path.write_bytes(b"data" * 1000)
+    with HttpSession() as session:
+        echo = session.put(HttpUrl(echo_mock.bind), plain=path).as_json()
+    assert echo["method"] == "PUT"
+    assert echo["headers"]["content-length"] == "4000"
+    assert echo["body"] == "data" * 1000
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_upload_generator_chunked(echo_mock: EchoMock) -> None:
+    with HttpSession() as session:
+        echo = session.post(HttpUrl(echo_mock.bind), plain=_chunks()).as_json()
+    assert echo["headers"]["transfer-encoding"] == "chunked"
+    assert echo["body"] == "first second"
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_upload_progress(echo_mock: EchoMock) -> None:
+    reports: List[Tuple[int, Optional[int]]] = []
+    upload = Upload(
+        io.BytesIO(b"x" * 10),
+        progress=lambda sent, total: reports.append((sent, total)),
+        chunk_size=4,
+    )
+    with HttpSession() as session:
+        session.post(HttpUrl(echo_mock.bind), plain=upload)
+    assert reports == [(4, 10), (8, 10), (10, 10)]
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_upload_replayed_by_retry(echo_mock: EchoMock) -> None:
+    file = io.BytesIO(b"skip body")
+    file.seek(5)
+    retry = Retry(attempts=2, backoff=0.01, methods=("PUT",))
+    with HttpSession(retry=retry) as session:
+        echo = session.put(
+            HttpUrl(echo_mock.bind, path="flaky/1"), plain=file
+        ).as_json()
+    assert echo["body"] == "body"
+    assert echo_mock.requests == 2
+
+
+@pytest.mark.usefixtures("_clean_up_echo")
+def test_multipart(echo_mock: EchoMock, tmp_path: Path) -> None:
+    path = tmp_path / "report.csv"
+    path.write_bytes(b"a,b\n")
+    body = Multipart(
+        {"name": "report", "file": ("report.csv", path, "text/csv")},
+        boundary="edge",
+    )
+    with HttpSession() as session:
+        echo = session.post(HttpUrl(echo_mock.bind), plain=body).as_json()
+    assert echo["headers"]["content-type"] == (
+        "multipart/form-data; boundary=edge"
+    )
+    assert echo["body"] == (
+        "--edge\r\n"
+        'Content-Disposition: form-data; name="name"\r\n\r\n'
+        "report\r\n"
+        "--edge\r\n"
+        'Content-Disposition: form-data; name="file"; '
+        'filename="report.csv"\r\n'
+        "Content-Type: text/csv\r\n\r\n"
+        "a,b\n\r\n"
+        "--edge--\r\n"
+    )
+    assert int(echo["headers"]["content-length"]) == body.length()
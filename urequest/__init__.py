@@ -1,20 +1,56 @@
 """Provides user-friendly HTTP client with clean objects."""
-from typing import Tuple
-from urequest.credentials import Credentials
-from urequest.response import (
-    HTTPStatus,
-    JsonType,
-    Response,
-    ResponseError,
-    safe_response,
-)
-from urequest.session import (
-    HttpConnectionError,
-    HttpSession,
-    LoggedHttpSession,
-    Session,
-)
-from urequest.url import Address, HttpUrl, HttpsUrl, Url
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+if TYPE_CHECKING:
+    from urequest.base import Session
+    from urequest.batch import Outcome
+    from urequest.breaker import (
+        CircuitBreaker,
+        CircuitOpenError,
+        CircuitState,
+    )
+    from urequest.cache import CacheStats, CachedHttpSession, ResponseCache
+    from urequest.codec import Codec
+    from urequest.compression import Compression
+    from urequest.credentials import Credentials
+    from urequest.download import DownloadError
+    from urequest.flight import SingleFlight
+    from urequest.hedge import Hedge, HedgeStats
+    from urequest.hooks import Event, Hook, Hooks
+    from urequest.light import LightHttpSession
+    from urequest.limiter import RateLimitError, RateLimiter
+    from urequest.pipeline import BasicAuth, Call, Handler, Interceptor
+    from urequest.pool import Pool
+    from urequest.resolver import Resolver, ResolverStats
+    from urequest.response import (
+        HTTPStatus,
+        JsonType,
+        Response,
+        ResponseError,
+        StreamResponse,
+        safe_response,
+    )
+    from urequest.retry import Retry, RetryBudget, RetryStats
+    from urequest.session import (
+        AsyncHttpSession,
+        AsyncSession,
+        HttpConnectionError,
+        HttpSession,
+        LoggedHttpSession,
+    )
+    from urequest.timeout import (
+        DeadlineExceededError,
+        RequestTimeoutError,
+        Timeouts,
+        deadline,
+    )
+    from urequest.timing import Latencies, LatencyHistogram, Timing
+    from urequest.tls import Tls, TlsStats
+    from urequest.transport import Http2Transport
+    from urequest.upload import Multipart, Upload
+    from urequest.url import Address, HttpUrl, HttpsUrl, Url
 
 __author__: str = "Volodymyr Yahello"
 __email__: str = "vyahello@gmail.com"
@@ -22,14 +58,58 @@ __version__: str = "0.0.6"
 __license__: str = "MIT License"
 
 __all__: Tuple[str, ...] = (
+    "CachedHttpSession",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "CacheStats",
+    "BasicAuth",
+    "Call",
+    "Codec",
+    "Compression",
     "Credentials",
+    "DownloadError",
+    "Outcome",
+    "Pool",
+    "Resolver",
+    "ResolverStats",
+    "RateLimiter",
+    "RateLimitError",
     "Session",
+    "SingleFlight",
+    "AsyncSession",
+    "AsyncHttpSession",
+    "Hedge",
+    "HedgeStats",
+    "Event",
+    "Hook",
+    "Hooks",
+    "Handler",
     "HttpSession",
+    "Interceptor",
     "HttpConnectionError",
     "LoggedHttpSession",
+    "LightHttpSession",
     "JsonType",
     "Response",
+    "ResponseCache",
     "ResponseError",
+    "Retry",
+    "RetryBudget",
+    "RetryStats",
+    "StreamResponse",
+    "Latencies",
+    "LatencyHistogram",
+    "Timing",
+    "Multipart",
+    "Upload",
+    "DeadlineExceededError",
+    "RequestTimeoutError",
+    "Timeouts",
+    "deadline",
+    "Tls",
+    "TlsStats",
+    "Http2Transport",
     "safe_response",
     "Address",
     "HTTPStatus",
@@ -37,3 +117,81 @@ __all__: Tuple[str, ...] = (
     "HttpsUrl",
     "Url",
 )
+
+# A name is imported once it is used, so `LightHttpSession` is imported
+# without ``requests``. Python 3.6 has no module ``__getattr__`` and
+# imports every name at once.
+_MODULES: Dict[str, str] = {
+    "Session": "urequest.base",
+    "Outcome": "urequest.batch",
+    "CircuitBreaker": "urequest.breaker",
+    "CircuitOpenError": "urequest.breaker",
+    "CircuitState": "urequest.breaker",
+    "CacheStats": "urequest.cache",
+    "CachedHttpSession": "urequest.cache",
+    "ResponseCache": "urequest.cache",
+    "Codec": "urequest.codec",
+    "Compression": "urequest.compression",
+    "Credentials": "urequest.credentials",
+    "DownloadError": "urequest.download",
+    "SingleFlight": "urequest.flight",
+    "Hedge": "urequest.hedge",
+    "HedgeStats": "urequest.hedge",
+    "Event": "urequest.hooks",
+    "Hook": "urequest.hooks",
+    "Hooks": "urequest.hooks",
+    "LightHttpSession": "urequest.light",
+    "RateLimitError": "urequest.limiter",
+    "RateLimiter": "urequest.limiter",
+    "BasicAuth": "urequest.pipeline",
+    "Call": "urequest.pipeline",
+    "Handler": "urequest.pipeline",
+    "Interceptor": "urequest.pipeline",
+    "Pool": "urequest.pool",
+    "Resolver": "urequest.resolver",
+    "ResolverStats": "urequest.resolver",
+    "HTTPStatus": "urequest.response",
+    "JsonType": "urequest.response",
+    "Response": "urequest.response",
+    "ResponseError": "urequest.response",
+    "StreamResponse": "urequest.response",
+    "safe_response": "urequest.response",
+    "Retry": "urequest.retry",
+    "RetryBudget": "urequest.retry",
+    "RetryStats": "urequest.retry",
+    "AsyncHttpSession": "urequest.session",
+    "AsyncSession": "urequest.session",
+    "HttpConnectionError": "urequest.session",
+    "HttpSession": "urequest.session",
+    "LoggedHttpSession": "urequest.session",
+    "DeadlineExceededError": "urequest.timeout",
+    "RequestTimeoutError": "urequest.timeout",
+    "Timeouts": "urequest.timeout",
+    "deadline": "urequest.timeout",
+    "Latencies": "urequest.timing",
+    "LatencyHistogram": "urequest.timing",
+    "Timing": "urequest.timing",
+    "Tls": "urequest.tls",
+    "TlsStats": "urequest.tls",
+    "Http2Transport": "urequest.transport",
+    "Multipart": "urequest.upload",
+    "Upload": "urequest.upload",
+    "Address": "urequest.url",
+    "HttpUrl": "urequest.url",
+    "HttpsUrl": "urequest.url",
+    "Url": "urequest.url",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Returns a name of the package importing its module once."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(importlib.import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
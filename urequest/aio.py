@@ -0,0 +1,420 @@
+"""The module provides API for non-blocking HTTP/1.1 connections."""
+import asyncio
+import math
+import ssl
+import socket
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import (
+    Awaitable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import urlsplit
+from urequest.pool import Pool
+from urequest.protocol import (
+    DEFAULT_HEADERS,
+    IDEMPOTENT,
+    MAX_REDIRECTS,
+    REDIRECTS,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    Timeout,
+    TooManyRedirects,
+    merge_headers,
+    redirect,
+    timeouts,
+    with_params,
+)
+from urequest.resolver import Resolver
+from urequest.response import RawHttpResponse
+
+_Key = Tuple[str, str, int]
+_Result = TypeVar("_Result")
+_PORTS: Dict[str, int] = {"http": 80, "https": 443}
+_HEAD_ENDS: Tuple[bytes, ...] = (b"\r\n", b"\n", b"")
+
+
+class ProtocolError(ConnectionError):
+    """The class represents malformed HTTP response error."""
+
+    pass
+
+
+class _StaleConnection(ConnectionError):
+    """The class represents kept-alive connection dropped by a server."""
+
+    pass
+
+
+class _Reply(NamedTuple):
+    """The class represents a reply read from a connection."""
+
+    code: int
+    headers: Dict[str, str]
+    content: bytes
+    keep_alive: bool
+
+
+async def _within(
+    awaitable: Awaitable[_Result],
+    timeout: Optional[float],
+    error: Exception,
+) -> _Result:
+    """Awaits a result for a given amount of seconds or raises an error."""
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise error from None
+
+
+async def _read_head(
+    reader: asyncio.StreamReader,
+) -> Tuple[str, int, Dict[str, str]]:
+    """Reads status line and headers of an HTTP response."""
+    line: bytes = await reader.readline()
+    if not line:
+        raise _StaleConnection("Connection is closed by a server")
+    try:
+        version, code = line.decode("latin-1").split(None, 2)[:2]
+        status = int(code)
+    except ValueError as error:
+        raise ProtocolError(f"Malformed status line: {line!r}") from error
+    headers: Dict[str, str] = {}
+    line = await reader.readline()
+    while line not in _HEAD_ENDS:
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip().lower(), value.strip()
+        if name in headers:
+            value = f"{headers[name]}, {value}"
+        headers[name] = value
+        line = await reader.readline()
+    return version, status, headers
+
+
+async def _read_chunk_size(reader: asyncio.StreamReader) -> int:
+    """Reads a size of next chunk of a chunked body."""
+    line: bytes = await reader.readline()
+    try:
+        return int(line.split(b";")[0], 16)
+    except ValueError as error:
+        raise ProtocolError(f"Malformed chunk size: {line!r}") from error
+
+
+async def _read_chunks(reader: asyncio.StreamReader) -> bytes:
+    """Reads a body of an HTTP response with chunked transfer encoding."""
+    chunks: List[bytes] = []
+    size: int = await _read_chunk_size(reader)
+    while size:
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+        size = await _read_chunk_size(reader)
+    while await reader.readline() not in _HEAD_ENDS:
+        pass
+    return b"".join(chunks)
+
+
+async def _read_body(
+    reader: asyncio.StreamReader,
+    method: str,
+    code: int,
+    headers: Mapping[str, str],
+) -> Tuple[bytes, bool]:
+    """Reads a body of an HTTP response.
+
+    Returns: a body and `True` if a body has explicit length
+    """
+    if method == "HEAD" or code in (204, 304) or code < 200:
+        return b"", True
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        return await _read_chunks(reader), True
+    if "content-length" in headers:
+        try:
+            length = int(headers["content-length"])
+        except ValueError as error:
+            raise ProtocolError("Malformed content length") from error
+        return await reader.readexactly(length), True
+    return await reader.read(), False
+
+
+class _Connection:
+    """The class represents non-blocking HTTP/1.1 connection."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._reader = reader
+        self._writer = writer
+        self.released: float = math.inf
+
+    async def exchange(self, method: str, message: bytes) -> _Reply:
+        """Sends a request message and reads a reply."""
+        try:
+            self._writer.write(message)
+            await self._writer.drain()
+        except ConnectionError as error:
+            raise _StaleConnection(str(error)) from error
+        version, code, headers = await _read_head(self._reader)
+        while 100 <= code < 200:
+            version, code, headers = await _read_head(self._reader)
+        content, framed = await _read_body(self._reader, method, code, headers)
+        persistent: str = "close" if version == "HTTP/1.0" else "keep-alive"
+        closed: bool = headers.get("connection", persistent).lower() == "close"
+        return _Reply(code, headers, content, framed and not closed)
+
+    def is_closing(self) -> bool:
+        """Returns `True` if connection is closed by either side."""
+        return self._writer.is_closing() or self._reader.at_eof()
+
+    def close(self) -> None:
+        """Closes a connection."""
+        self._writer.close()
+
+
+class AsyncPool:
+    """The class represents a pool of non-blocking HTTP/1.1 connections.
+
+    A pool is configured by the same `Pool` used for blocking sessions.
+    A resolver of a pool resolves and connects to hosts in a worker thread
+    since it blocks, HTTPS connections share a context of its TLS
+    configuration but do not resume TLS sessions.
+    """
+
+    def __init__(self, pool: Pool = None) -> None:
+        self._pool = pool or Pool()
+        self._idle: "OrderedDict[_Key, List[_Connection]]" = OrderedDict()
+        self._slots: Dict[_Key, asyncio.Semaphore] = {}
+        self._context: Optional[ssl.SSLContext] = None
+
+    async def request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        body: bytes = b"",
+        headers: Mapping[str, str] = None,
+        params: Mapping[str, str] = None,
+        timeout: Timeout = None,
+        allow_redirects: bool = True,
+    ) -> RawHttpResponse:
+        """Performs an HTTP request.
+
+        Redirects are followed the same way as ``requests`` does (see
+        `redirect`).
+
+        Args:
+            method: HTTP method
+            url: requested url
+            body: request body
+            headers: request headers
+            params: url query parameters
+            timeout: connect and read timeout in seconds or their pair
+            allow_redirects: follows redirects if `True`
+
+        Raises:
+            `ConnectTimeoutError` if a host is not connected in time
+            `ReadTimeoutError` if a response is not received in time
+            `TooManyRedirects` if redirects exceed a limit
+
+        Returns: an HTTP response
+        """
+        fields: Dict[str, str] = merge_headers(headers or {})
+        reply: _Reply = await self._send(
+            method, with_params(url, params), body, fields, timeout
+        )
+        for _ in range(MAX_REDIRECTS):
+            if not allow_redirects or reply.code not in REDIRECTS:
+                return RawHttpResponse(
+                    reply.code, reply.headers, reply.content
+                )
+            url, redirected, fields = redirect(
+                url,
+                method,
+                reply.code,
+                fields,
+                reply.headers.get("location", ""),
+            )
+            if redirected != method:
+                method, body = redirected, b""
+            reply = await self._send(method, url, body, fields, timeout)
+        raise TooManyRedirects(f"Exceeded {MAX_REDIRECTS} redirects")
+
+    async def close(self) -> None:
+        """Closes all idle connections of a pool."""
+        while self._idle:
+            for connection in self._idle.popitem()[1]:
+                connection.close()
+
+    async def _send(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        body: bytes,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> _Reply:
+        """Sends a single request over a pool."""
+        parts = urlsplit(url)
+        key: _Key = (
+            parts.scheme,
+            parts.hostname or "",
+            parts.port or _PORTS[parts.scheme],
+        )
+        target: str = "?".join(filter(None, (parts.path or "/", parts.query)))
+        message: bytes = _message(method, target, parts.netloc, body, headers)
+        slot: Optional[asyncio.Semaphore] = self._slot(key)
+        if slot is None:
+            return await self._exchange(key, method, message, timeout)
+        async with slot:
+            return await self._exchange(key, method, message, timeout)
+
+    def _slot(self, key: _Key) -> Optional[asyncio.Semaphore]:
+        """Returns a semaphore bounding connections of a blocking pool."""
+        if not self._pool.block:
+            return None
+        if key not in self._slots:
+            self._slots[key] = asyncio.Semaphore(
+                self._pool.connections_for(key[1])
+            )
+        return self._slots[key]
+
+    async def _exchange(
+        self, key: _Key, method: str, message: bytes, timeout: Timeout
+    ) -> _Reply:
+        """Exchanges a message over kept-alive or a new connection.
+
+        A request of idempotent method is sent again over a new connection
+        if a kept-alive connection is dropped before any reply.
+        """
+        connect, read = timeouts(timeout)
+        connection: Optional[_Connection] = self._reuse(key)
+        if connection is not None:
+            try:
+                return await self._complete(
+                    key, connection, method, message, read
+                )
+            except _StaleConnection:
+                if method not in IDEMPOTENT:
+                    raise
+        connection = await _within(
+            self._connect(key, connect),
+            connect,
+            ConnectTimeoutError(f"Connection to {key[1]} timed out"),
+        )
+        return await self._complete(key, connection, method, message, read)
+
+    async def _complete(  # pylint: disable=too-many-arguments
+        self,
+        key: _Key,
+        connection: _Connection,
+        method: str,
+        message: bytes,
+        timeout: Optional[float],
+    ) -> _Reply:
+        """Exchanges a message and releases a connection."""
+        try:
+            reply: _Reply = await _within(
+                connection.exchange(method, message),
+                timeout,
+                ReadTimeoutError(f"Response of {key[1]} timed out"),
+            )
+        except BaseException:
+            connection.close()
+            raise
+        if reply.keep_alive:
+            self._release(key, connection)
+        else:
+            connection.close()
+        return reply
+
+    async def _connect(
+        self, key: _Key, timeout: Optional[float]
+    ) -> _Connection:
+        """Opens a new connection to a host."""
+        scheme, host, port = key
+        context: Optional[ssl.SSLContext] = (
+            self._tls() if scheme == "https" else None
+        )
+        resolver: Optional[Resolver] = self._pool.resolver
+        if resolver is None:
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=context
+            )
+            return _Connection(reader, writer)
+        sock: socket.socket = await asyncio.get_event_loop().run_in_executor(
+            None, partial(_resolved, resolver, host, port, timeout)
+        )
+        reader, writer = await asyncio.open_connection(
+            sock=sock,
+            ssl=context,
+            server_hostname=host if context is not None else None,
+        )
+        return _Connection(reader, writer)
+
+    def _tls(self) -> ssl.SSLContext:
+        """Returns a context of HTTPS connections."""
+        if self._pool.tls is not None:
+            return self._pool.tls.context()
+        if self._context is None:
+            self._context = ssl.create_default_context()
+        return self._context
+
+    def _reuse(self, key: _Key) -> Optional[_Connection]:
+        """Returns an idle connection of a host if any."""
+        idle: List[_Connection] = self._idle.get(key, [])
+        timeout: float = (
+            math.inf
+            if self._pool.idle_timeout is None
+            else self._pool.idle_timeout
+        )
+        while idle:
+            connection: _Connection = idle.pop()
+            idle_for: float = time.monotonic() - connection.released
+            if idle_for <= timeout and not connection.is_closing():
+                return connection
+            connection.close()
+        return None
+
+    def _release(self, key: _Key, connection: _Connection) -> None:
+        """Keeps a connection alive for next requests of a host."""
+        idle: List[_Connection] = self._idle.setdefault(key, [])
+        self._idle.move_to_end(key)
+        if len(idle) >= self._pool.connections_for(key[1]):
+            connection.close()
+            return
+        connection.released = time.monotonic()
+        idle.append(connection)
+        while len(self._idle) > self._pool.hosts:
+            for stale in self._idle.popitem(last=False)[1]:
+                stale.close()
+
+
+def _resolved(
+    resolver: Resolver, host: str, port: int, timeout: Optional[float]
+) -> socket.socket:
+    """Connects to a host resolved by a resolver."""
+    return resolver.connect(resolver.resolve(host, port), timeout)
+
+
+def _message(
+    method: str,
+    target: str,
+    host: str,
+    body: bytes,
+    headers: Mapping[str, str],
+) -> bytes:
+    """Composes an HTTP/1.1 request message."""
+    fields: Dict[str, str] = merge_headers(
+        {"Host": host}, DEFAULT_HEADERS, headers
+    )
+    if body or method in ("POST", "PUT", "PATCH"):
+        fields = merge_headers(fields, {"Content-Length": str(len(body))})
+    head: str = "".join(
+        f"{name}: {value}\r\n" for name, value in fields.items()
+    )
+    return f"{method} {target} HTTP/1.1\r\n{head}\r\n".encode() + body
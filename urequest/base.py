@@ -0,0 +1,387 @@
+"""The module contains an abstract interface of HTTP sessions.
+
+It imports nothing but the standard library and ``punish``, so sessions
+which do not run on ``requests`` implement it without importing it.
+"""
+from abc import abstractmethod
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+from punish.type import AbstractContextManager
+from urequest.batch import Outcome, fan_out
+from urequest.response import Response
+from urequest.upload import Body
+from urequest.url import Address
+
+if TYPE_CHECKING:
+    from urequest.download import Path  # noqa: F401
+
+
+def _with_bodies(
+    urls: Iterable[Address],
+    plains: Optional[Iterable[Optional[str]]],
+    as_dicts: Optional[Iterable[Optional[Dict[Any, Any]]]],
+) -> Iterable[Tuple[Address, Optional[str], Optional[Dict[Any, Any]]]]:
+    """Pairs urls with their request bodies.
+
+    Raises:
+        `ValueError` if amount of bodies differs from amount of urls
+    """
+    addresses: Tuple[Address, ...] = tuple(urls)
+    texts: Tuple[Optional[str], ...] = (
+        (None,) * len(addresses) if plains is None else tuple(plains)
+    )
+    dicts: Tuple[Optional[Dict[Any, Any]], ...] = (
+        (None,) * len(addresses) if as_dicts is None else tuple(as_dicts)
+    )
+    if not len(addresses) == len(texts) == len(dicts):
+        raise ValueError(
+            f"Batch of {len(addresses)} urls got {len(texts)} plain "
+            f"and {len(dicts)} dictionary bodies!"
+        )
+    return zip(addresses, texts, dicts)
+
+
+class Session(AbstractContextManager):
+    """The class represents abstract interfaces for an API Session."""
+
+    @abstractmethod
+    def get(self, url: Address, **kwargs: Any) -> Response:
+        """Performs ``GET`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            kwargs: keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def options(self, url: Address, **kwargs: Any) -> Response:
+        """Performs ``OPTIONS`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            kwargs: keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def head(self, url: Address, **kwargs: Any) -> Response:
+        """Performs ``HEAD`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            kwargs: keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def post(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Performs ``POST`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            plain: requested data as a text, bytes, file, path or chunks
+            as_dict: requested data as dictionary (json)
+            kwargs: other keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def put(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Performs ``PUT`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            plain: requested data as a text, bytes, file, path or chunks
+            as_dict: requested data as dictionary (json)
+            kwargs: other keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def patch(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Performs ``PATCH`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            plain: requested data as a text, bytes, file, path or chunks
+            as_dict: requested data as dictionary (json)
+            kwargs: other keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, url: Address, **kwargs: Any) -> Response:
+        """Performs ``DELETE`` HTTP request of a session.
+
+        Args:
+            url: url path used to perform a request
+            kwargs: keyword arguments
+
+        Returns: response element
+        """
+        pass
+
+    def download(  # pylint: disable=too-many-arguments
+        self,
+        url: Address,
+        path: "Path",
+        segments: int = 1,
+        memory_map: bool = False,
+        attempts: int = 3,
+        **kwargs: Any,
+    ) -> int:
+        """Downloads a resource of a session into a file.
+
+        A resource of known length accepting byte ranges is written into
+        a preallocated file by ``segments`` concurrent ``Range`` requests
+        and an interrupted download resumes where it stopped, even by
+        a next call. Other resources are streamed from their start.
+
+        Args:
+            url: url path of a resource
+            path: a path to a file
+            segments: amount of byte ranges downloaded concurrently
+            memory_map: writes a file through a memory map
+            attempts: max attempts to download a single segment
+            kwargs: keyword arguments of every request
+
+        Raises:
+            `DownloadError` if a resource changed or has unexpected length
+
+        Returns: amount of bytes of a file
+        """
+        from urequest.download import download_file  # noqa: I100
+
+        return download_file(
+            self, url, path, segments, memory_map, attempts, **kwargs
+        )
+
+    def get_many(
+        self,
+        urls: Iterable[Address],
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``GET`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            ((url, partial(self.get, url, **kwargs)) for url in urls),
+            concurrency,
+            ordered,
+        )
+
+    def options_many(
+        self,
+        urls: Iterable[Address],
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``OPTIONS`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            ((url, partial(self.options, url, **kwargs)) for url in urls),
+            concurrency,
+            ordered,
+        )
+
+    def head_many(
+        self,
+        urls: Iterable[Address],
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``HEAD`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            ((url, partial(self.head, url, **kwargs)) for url in urls),
+            concurrency,
+            ordered,
+        )
+
+    def post_many(  # pylint: disable=too-many-arguments
+        self,
+        urls: Iterable[Address],
+        plains: Iterable[Optional[str]] = None,
+        as_dicts: Iterable[Optional[Dict[Any, Any]]] = None,
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``POST`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            plains: requested data as a plain text of every url
+            as_dicts: requested data as dictionary (json) of every url
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Raises:
+            `ValueError` if amount of bodies differs from amount of urls
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            (
+                (url, partial(self.post, url, plain, as_dict, **kwargs))
+                for url, plain, as_dict in _with_bodies(urls, plains, as_dicts)
+            ),
+            concurrency,
+            ordered,
+        )
+
+    def put_many(  # pylint: disable=too-many-arguments
+        self,
+        urls: Iterable[Address],
+        plains: Iterable[Optional[str]] = None,
+        as_dicts: Iterable[Optional[Dict[Any, Any]]] = None,
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``PUT`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            plains: requested data as a plain text of every url
+            as_dicts: requested data as dictionary (json) of every url
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Raises:
+            `ValueError` if amount of bodies differs from amount of urls
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            (
+                (url, partial(self.put, url, plain, as_dict, **kwargs))
+                for url, plain, as_dict in _with_bodies(urls, plains, as_dicts)
+            ),
+            concurrency,
+            ordered,
+        )
+
+    def patch_many(  # pylint: disable=too-many-arguments
+        self,
+        urls: Iterable[Address],
+        plains: Iterable[Optional[str]] = None,
+        as_dicts: Iterable[Optional[Dict[Any, Any]]] = None,
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``PATCH`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            plains: requested data as a plain text of every url
+            as_dicts: requested data as dictionary (json) of every url
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Raises:
+            `ValueError` if amount of bodies differs from amount of urls
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            (
+                (url, partial(self.patch, url, plain, as_dict, **kwargs))
+                for url, plain, as_dict in _with_bodies(urls, plains, as_dicts)
+            ),
+            concurrency,
+            ordered,
+        )
+
+    def delete_many(
+        self,
+        urls: Iterable[Address],
+        concurrency: int = 10,
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[Outcome]:
+        """Performs a batch of ``DELETE`` HTTP requests of a session.
+
+        Args:
+            urls: url paths used to perform requests
+            concurrency: max amount of requests performed at the same time
+            ordered: yields outcomes in input order otherwise as completed
+            kwargs: keyword arguments of every request
+
+        Returns: outcomes of requests
+        """
+        return fan_out(
+            ((url, partial(self.delete, url, **kwargs)) for url in urls),
+            concurrency,
+            ordered,
+        )
@@ -0,0 +1,87 @@
+"""The module provides API for concurrent batches of HTTP requests."""
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextvars import copy_context
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+from urequest.response import Response
+from urequest.url import Address
+
+Task = Tuple[Address, Callable[[], Response]]
+
+
+class Outcome:
+    """The class represents an outcome of a single request from a batch."""
+
+    def __init__(
+        self,
+        url: Address,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self._url = url
+        self._response = response
+        self._error = error
+
+    def url(self) -> Address:
+        """Returns requested url."""
+        return self._url
+
+    def is_ok(self) -> bool:
+        """Returns `True` if request succeeded otherwise `False`."""
+        return self._error is None
+
+    def error(self) -> Optional[Exception]:
+        """Returns an error of a failed request."""
+        return self._error
+
+    def response(self) -> Response:
+        """Returns a response of a request.
+
+        Raises:
+            an error of a failed request e.g `ResponseError`
+        """
+        if self._error is not None:
+            raise self._error
+        return self._response  # type: ignore
+
+    def __str__(self) -> str:
+        return f"{self._url}: {self._error or 'OK'}"
+
+
+def _outcome(task: Task) -> Outcome:
+    """Performs a task and captures its response or error."""
+    url, request = task
+    try:
+        return Outcome(url, response=request())
+    except Exception as error:  # pylint: disable=broad-except
+        return Outcome(url, error=error)
+
+
+def fan_out(
+    tasks: Iterable[Task], concurrency: int = 10, ordered: bool = True
+) -> Iterator[Outcome]:
+    """Performs a batch of requests using bounded amount of threads.
+
+    Requests are submitted at once on first iteration and worker threads
+    are released when iteration completes or an iterator is closed.
+    A concurrency above a connection pool size of a session opens
+    overflow connections which are not kept alive.
+
+    Args:
+        tasks: pairs of url and a request to perform
+        concurrency: max amount of requests performed at the same time
+        ordered: yields outcomes in input order if `True`
+            otherwise as they complete
+
+    Returns: outcomes of requests
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures: List["Future[Outcome]"] = [
+            executor.submit(copy_context().run, _outcome, task)
+            for task in tasks
+        ]
+        try:
+            for future in futures if ordered else as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,169 @@
+"""The module provides API for circuit breakers of upstream hosts."""
+import enum
+from collections import deque
+from functools import partial
+from threading import Lock
+from time import monotonic
+from typing import Callable, Deque, Dict, Optional
+import requests
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import HTTPStatus, Response, ResponseError
+from urequest.url import Address
+
+Listener = Callable[[str, "CircuitState", "CircuitState"], None]
+
+
+@enum.unique
+class CircuitState(enum.Enum):
+    """The class represents a state of a host circuit."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(ResponseError):
+    """The class represents a request rejected by an open circuit."""
+
+    pass
+
+
+def _failed(error: Exception) -> bool:
+    """Returns `True` if an error tells that an upstream is unhealthy."""
+    if isinstance(error, ResponseError):
+        response: Optional[Response] = error.response()
+        if response is None:
+            return False
+        return response.status() >= HTTPStatus.INTERNAL_SERVER_ERROR
+    return isinstance(
+        error,
+        (requests.exceptions.ConnectionError, requests.exceptions.Timeout),
+    )
+
+
+class _Circuit:
+    """The class represents a circuit of a single host."""
+
+    __slots__ = ("state", "outcomes", "opened", "probes")
+
+    def __init__(self, window: int) -> None:
+        self.state: CircuitState = CircuitState.CLOSED
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.opened: float = 0.0
+        self.probes: int = 0
+
+
+class CircuitBreaker(Interceptor):
+    """The class represents circuit breakers keyed by upstream hosts.
+
+    A circuit opens once a share of failures among last ``window`` calls
+    of a host reaches ``failure_rate`` and at least ``minimum`` calls are
+    made. An open circuit rejects calls with `CircuitOpenError` for
+    ``open_for`` seconds, then lets ``probes`` calls through: a success
+    closes it and a failure opens it again. Connection errors, timeouts
+    and server errors are failures. It is safe to share between threads.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        minimum: int = 10,
+        open_for: float = 30.0,
+        probes: int = 1,
+        on_change: Listener = None,
+    ) -> None:
+        self._threshold = (failure_rate, minimum)
+        self._window = window
+        self._open_for = open_for
+        self._probes = probes
+        self._on_change = on_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    def state(self, host: str) -> CircuitState:
+        """Returns a state of a host circuit."""
+        with self._lock:
+            circuit: Optional[_Circuit] = self._circuits.get(host)
+        return CircuitState.CLOSED if circuit is None else circuit.state
+
+    def perform(self, url: Address, send: Callable[[], Response]) -> Response:
+        """Sends a request unless a circuit of its host is open.
+
+        Args:
+            url: requested url
+            send: sends a request over a network
+
+        Raises:
+            `CircuitOpenError` if a circuit of a host is open
+
+        Returns: a response
+        """
+        host: str = url.host()
+        self._admit(host)
+        try:
+            response: Response = send()
+        except Exception as error:  # pylint: disable=broad-except
+            self._record(host, not _failed(error))
+            raise
+        self._record(host, True)
+        return response
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        return self.perform(call.url, partial(proceed, call))
+
+    def _admit(self, host: str) -> None:
+        """Lets a call through or rejects it by a circuit state."""
+        with self._lock:
+            circuit: _Circuit = self._circuits.setdefault(
+                host, _Circuit(self._window)
+            )
+            previous: CircuitState = circuit.state
+            elapsed: float = monotonic() - circuit.opened
+            if previous is CircuitState.OPEN and elapsed >= self._open_for:
+                _switch(circuit, CircuitState.HALF_OPEN)
+            current: CircuitState = circuit.state
+            probing: bool = current is CircuitState.HALF_OPEN
+            admitted: bool = current is CircuitState.CLOSED or (
+                probing and circuit.probes < self._probes
+            )
+            if probing and admitted:
+                circuit.probes += 1
+        self._notify(host, previous, current)
+        if not admitted:
+            raise CircuitOpenError(f"Circuit of '{host}' host is open!")
+
+    def _record(self, host: str, succeeded: bool) -> None:
+        """Records an outcome of a call and switches a circuit state."""
+        with self._lock:
+            circuit: _Circuit = self._circuits[host]
+            previous: CircuitState = circuit.state
+            if previous is CircuitState.HALF_OPEN:
+                _switch(
+                    circuit,
+                    CircuitState.CLOSED if succeeded else CircuitState.OPEN,
+                )
+            elif previous is CircuitState.CLOSED:
+                circuit.outcomes.append(succeeded)
+                rate, minimum = self._threshold
+                calls: int = len(circuit.outcomes)
+                failures: int = circuit.outcomes.count(False)
+                if calls >= minimum and failures >= rate * calls:
+                    _switch(circuit, CircuitState.OPEN)
+            current: CircuitState = circuit.state
+        self._notify(host, previous, current)
+
+    def _notify(
+        self, host: str, previous: CircuitState, current: CircuitState
+    ) -> None:
+        """Tells a listener that a circuit of a host switched its state."""
+        if self._on_change is not None and previous is not current:
+            self._on_change(host, previous, current)
+
+
+def _switch(circuit: _Circuit, state: CircuitState) -> None:
+    """Moves a circuit into a state starting it over."""
+    circuit.state = state
+    circuit.outcomes.clear()
+    circuit.probes = 0
+    circuit.opened = monotonic()
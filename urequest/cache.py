@@ -0,0 +1,486 @@
+"""The module provides API for caching HTTP responses."""
+import hashlib
+import os
+import pickle
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
+import requests
+from requests.structures import CaseInsensitiveDict
+from urequest.base import Session
+from urequest.protocol import merge_headers
+from urequest.response import HTTPStatus, Response, ResponseError
+from urequest.upload import Body
+from urequest.url import Address
+
+_Key = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+_MAX_AGE: Pattern[str] = re.compile(r"max-age\s*=\s*\"?(\d+)")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """The class represents counters of a response cache.
+
+    Attributes:
+        hits: responses served from a cache including revalidated ones
+        misses: responses fetched from a server in full
+        revalidations: conditional requests sent to a server
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+
+
+class _Entry:
+    """The class represents a cached response with its freshness."""
+
+    __slots__ = ("response", "size", "expires")
+
+    def __init__(self, response: Response, size: int, expires: float) -> None:
+        self.response = response
+        self.size = size
+        self.expires = expires
+
+    def is_fresh(self) -> bool:
+        """Returns `True` if a response may be served without a request."""
+        return monotonic() < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Returns headers of a conditional request."""
+        headers: Mapping[str, str] = self.response.headers()
+        conditions: Dict[str, str] = {}
+        if "etag" in headers:
+            conditions["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditions["If-Modified-Since"] = headers["last-modified"]
+        return conditions
+
+
+def _lifetime(headers: Mapping[str, str]) -> Optional[float]:
+    """Returns seconds a response stays fresh.
+
+    Returns: `None` if a response must not be stored
+    """
+    control: str = headers.get("cache-control", "").lower()
+    if "no-store" in control:
+        return None
+    found = _MAX_AGE.search(control)
+    if "no-cache" in control or found is None:
+        return 0.0
+    age: str = headers.get("age", "0")
+    return float(found.group(1)) - (float(age) if age.isdigit() else 0.0)
+
+
+def _vary(headers: Mapping[str, str]) -> Tuple[str, ...]:
+    """Returns lower case names of request headers a response varies by."""
+    return tuple(
+        sorted(
+            name.strip().lower()
+            for name in headers.get("vary", "").split(",")
+            if name.strip()
+        )
+    )
+
+
+def _remove(path: str) -> None:
+    """Removes a file if it exists."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _MemoryStore:
+    """The class represents entries kept in least recently used order."""
+
+    def __init__(self, entries: int, size: int) -> None:
+        self._entries = entries
+        self._size = size
+        self._used = 0
+        self._memory: "OrderedDict[_Key, _Entry]" = OrderedDict()
+
+    def get(self, key: _Key) -> Optional[_Entry]:
+        """Returns an entry and marks it as recently used."""
+        entry: Optional[_Entry] = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+        return entry
+
+    def put(self, key: _Key, entry: _Entry) -> List[Tuple[_Key, _Entry]]:
+        """Puts an entry and returns least recently used evicted ones."""
+        self.pop(key)
+        if entry.size > self._size:
+            return []
+        self._memory[key] = entry
+        self._used += entry.size
+        evicted: List[Tuple[_Key, _Entry]] = []
+        while len(self._memory) > self._entries or self._used > self._size:
+            evicted.append(self._memory.popitem(last=False))
+            self._used -= evicted[-1][1].size
+        return evicted
+
+    def pop(self, key: _Key) -> Optional[_Entry]:
+        """Removes an entry."""
+        entry: Optional[_Entry] = self._memory.pop(key, None)
+        if entry is not None:
+            self._used -= entry.size
+        return entry
+
+    def keys(self) -> List[_Key]:
+        """Returns keys of entries."""
+        return list(self._memory)
+
+
+class _DiskStore:
+    """The class represents evicted entries spilled into a directory.
+
+    Files are owned by a store and the oldest ones are removed once
+    amount of entries exceeds a limit.
+    """
+
+    def __init__(
+        self, directory: Union[str, "os.PathLike[str]"], entries: int
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._entries = entries
+        self._paths: "OrderedDict[_Key, str]" = OrderedDict()
+
+    def pop(self, key: _Key) -> Optional[str]:
+        """Forgets an entry and returns a path of its file."""
+        return self._paths.pop(key, None)
+
+    def discard(self, key: _Key) -> None:
+        """Removes a file of an entry."""
+        _remove(self._paths.pop(key, ""))
+
+    def put(self, key: _Key, entry: _Entry) -> None:
+        """Writes an entry into a file."""
+        path: str = os.path.join(
+            self._directory,
+            f"{hashlib.sha256(repr(key).encode()).hexdigest()}.cache",
+        )
+        try:
+            with open(path, "wb") as file:
+                pickle.dump(entry, file)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            _remove(path)
+            return
+        self._paths[key] = path
+        while len(self._paths) > self._entries:
+            _remove(self._paths.popitem(last=False)[1])
+
+    def keys(self) -> List[_Key]:
+        """Returns keys of entries."""
+        return list(self._paths)
+
+
+def _load(path: str) -> Optional[_Entry]:
+    """Reads and removes a spilled entry."""
+    try:
+        with open(path, "rb") as file:
+            entry: _Entry = pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    finally:
+        _remove(path)
+    return entry
+
+
+class ResponseCache:
+    """The class represents a bounded cache of HTTP responses.
+
+    Responses are kept in memory in least recently used order bounded by
+    amount of entries and total size of texts in characters. Entries
+    evicted from memory are spilled into a directory if it is given.
+    A cache is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        entries: int = 1024,
+        size: int = 64 * 1024 * 1024,
+        directory: Union[None, str, "os.PathLike[str]"] = None,
+        disk_entries: int = 16 * 1024,
+    ) -> None:
+        self._memory = _MemoryStore(entries, size)
+        self._disk: Optional[_DiskStore] = (
+            None if directory is None else _DiskStore(directory, disk_entries)
+        )
+        self._vary: "OrderedDict[Tuple[str, str], Tuple[str, ...]]" = (
+            OrderedDict()
+        )
+        self._stats = CacheStats()
+        self._lock = Lock()
+        self._urls: int = entries + (0 if directory is None else disk_entries)
+
+    def stats(self) -> CacheStats:
+        """Returns counters of a cache."""
+        return self._stats
+
+    def key(self, method: str, url: str, headers: Mapping[str, str]) -> _Key:
+        """Returns a key of a request by its method, url and vary headers.
+
+        Args:
+            method: HTTP method
+            url: requested url with a query
+            headers: case-insensitive request headers
+        """
+        names: Tuple[str, ...] = self._vary.get((method, url), ())
+        values = tuple((name, headers.get(name, "")) for name in names)
+        return method, url, values
+
+    def lookup(self, key: _Key) -> Optional[_Entry]:
+        """Returns a cached entry of a request key."""
+        with self._lock:
+            entry: Optional[_Entry] = self._memory.get(key)
+            path: Optional[str] = None
+            if entry is None and self._disk is not None:
+                path = self._disk.pop(key)
+        if path is not None:
+            entry = _load(path)
+            if entry is not None:
+                with self._lock:
+                    self._remember(key, entry)
+        return entry
+
+    def store(
+        self, key: _Key, response: Response, headers: Mapping[str, str]
+    ) -> bool:
+        """Stores a response of a request if its headers allow it.
+
+        Args:
+            key: a key of a request a response is looked up by
+            response: a response to store
+            headers: case-insensitive request headers
+
+        Only a whole ``200 OK`` response is stored: a partial reply to a
+        request of a byte range would otherwise be served for a plain one.
+
+        Returns: `True` if a response is stored
+        """
+        if response.status() != HTTPStatus.OK or "range" in headers:
+            return False
+        lifetime: Optional[float] = _lifetime(response.headers())
+        names: Tuple[str, ...] = _vary(response.headers())
+        forbidden: bool = (
+            "no-store" in headers.get("cache-control", "").lower()
+        )
+        if lifetime is None or forbidden or "*" in names:
+            return False
+        entry = _Entry(response, len(str(response)), monotonic() + lifetime)
+        with self._lock:
+            self._vary[key[:2]] = names
+            self._vary.move_to_end(key[:2])
+            self._remember(self.key(key[0], key[1], headers), entry)
+        return True
+
+    def refresh(self, entry: _Entry, headers: Mapping[str, str]) -> None:
+        """Prolongs freshness of an entry by headers of ``304`` response."""
+        lifetime: Optional[float] = _lifetime(
+            headers if "cache-control" in headers else entry.response.headers()
+        )
+        entry.expires = monotonic() + (lifetime or 0.0)
+
+    def invalidate(self, url: str) -> None:
+        """Drops every cached response of an url."""
+        with self._lock:
+            for key in self._memory.keys():
+                if key[1] == url:
+                    self._memory.pop(key)
+            if self._disk is not None:
+                for key in self._disk.keys():
+                    if key[1] == url:
+                        self._disk.discard(key)
+
+    def count(
+        self, hits: int = 0, misses: int = 0, revalidations: int = 0
+    ) -> None:
+        """Increments counters of a cache."""
+        with self._lock:
+            self._stats = CacheStats(
+                self._stats.hits + hits,
+                self._stats.misses + misses,
+                self._stats.revalidations + revalidations,
+            )
+
+    def _remember(self, key: _Key, entry: _Entry) -> None:
+        """Puts an entry into memory and spills evicted ones."""
+        while len(self._vary) > self._urls:
+            self._vary.popitem(last=False)
+        for evicted, oldest in self._memory.put(key, entry):
+            if self._disk is not None:
+                self._disk.put(evicted, oldest)
+
+
+def _target(url: Address, params: Any) -> str:
+    """Returns an url with a query composed like ``requests`` does."""
+    if not params:
+        return str(url)
+    request = requests.PreparedRequest()
+    request.prepare_url(str(url), params)
+    return str(request.url)
+
+
+class CachedHttpSession(Session):
+    """The class provides a session caching responses of another session.
+
+    ``GET`` and ``HEAD`` responses are served from a cache while they are
+    fresh by ``Cache-Control`` and are revalidated by ``ETag`` or
+    ``Last-Modified`` otherwise, a ``304`` response counts as a hit.
+    Other methods drop cached responses of an url. Streamed requests
+    bypass a cache and only headers of a request are matched by ``Vary``.
+    """
+
+    def __init__(self, session: Session, cache: ResponseCache = None) -> None:
+        self._session = session
+        self._cache: ResponseCache = (
+            ResponseCache() if cache is None else cache
+        )
+
+    def __enter__(self) -> Session:
+        self._session.__enter__()
+        return self
+
+    def stats(self) -> CacheStats:
+        """Returns counters of a cache."""
+        return self._cache.stats()
+
+    def get(self, url: Address, **kwargs: Any) -> Response:
+        return self._cached("GET", self._session.get, url, **kwargs)
+
+    def options(self, url: Address, **kwargs: Any) -> Response:
+        return self._session.options(url, **kwargs)
+
+    def head(self, url: Address, **kwargs: Any) -> Response:
+        return self._cached("HEAD", self._session.head, url, **kwargs)
+
+    def post(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        response: Response = self._session.post(url, plain, as_dict, **kwargs)
+        self._cache.invalidate(_target(url, kwargs.get("params")))
+        return response
+
+    def put(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        response: Response = self._session.put(url, plain, as_dict, **kwargs)
+        self._cache.invalidate(_target(url, kwargs.get("params")))
+        return response
+
+    def patch(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        response: Response = self._session.patch(url, plain, as_dict, **kwargs)
+        self._cache.invalidate(_target(url, kwargs.get("params")))
+        return response
+
+    def delete(self, url: Address, **kwargs: Any) -> Response:
+        response: Response = self._session.delete(url, **kwargs)
+        self._cache.invalidate(_target(url, kwargs.get("params")))
+        return response
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._session.__exit__(exc_type, exc_value, traceback)
+
+    def _cached(
+        self,
+        method: str,
+        send: Callable[..., Response],
+        url: Address,
+        **kwargs: Any,
+    ) -> Response:
+        """Serves a request from a cache or sends it and stores a response."""
+        if kwargs.get("stream", False):
+            return send(url, **kwargs)
+        headers: Mapping[str, str] = CaseInsensitiveDict(
+            kwargs.get("headers") or {}
+        )
+        if "range" in headers:
+            return send(url, **kwargs)
+        key = self._cache.key(
+            method, _target(url, kwargs.get("params")), headers
+        )
+        entry: Optional[_Entry] = self._cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            self._cache.count(hits=1)
+            return entry.response
+        if entry is None or not entry.validators():
+            return self._fetched(key, headers, send(url, **kwargs))
+
+        def conditional(conditions: Mapping[str, str]) -> Response:
+            return send(
+                url,
+                **{**kwargs, "headers": merge_headers(conditions, headers)},
+            )
+
+        return self._revalidated(entry, key, headers, conditional)
+
+    def _revalidated(
+        self,
+        entry: _Entry,
+        key: _Key,
+        headers: Mapping[str, str],
+        conditional: Callable[[Mapping[str, str]], Response],
+    ) -> Response:
+        """Revalidates a stale entry by a conditional request."""
+        self._cache.count(revalidations=1)
+        try:
+            response: Response = conditional(entry.validators())
+        except ResponseError as error:
+            rejected: Optional[Response] = error.response()
+            if rejected is None or not _unmodified(rejected):
+                raise
+            response = rejected
+        if not _unmodified(response):
+            return self._fetched(key, headers, response)
+        self._cache.refresh(entry, response.headers())
+        self._cache.count(hits=1)
+        return entry.response
+
+    def _fetched(
+        self, key: _Key, headers: Mapping[str, str], response: Response
+    ) -> Response:
+        """Counts a miss and stores a fetched response."""
+        self._cache.count(misses=1)
+        self._cache.store(key, response, headers)
+        return response
+
+
+def _unmodified(response: Response) -> bool:
+    """Returns `True` if a response confirms a cached one."""
+    return response.status() is HTTPStatus.NOT_MODIFIED
@@ -0,0 +1,84 @@
+"""The module provides API for JSON codecs of HTTP bodies.
+
+A fastest installed codec is picked by default: ``orjson``, ``ujson``
+and the standard ``json`` module as a fallback.
+"""
+import importlib
+import json
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import Any, Optional, Union
+
+
+def _installed(name: str) -> Optional[ModuleType]:
+    """Returns a module if it is installed otherwise `None`."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_orjson: Any = _installed("orjson")
+_ujson: Any = _installed("ujson")
+
+
+class Codec(ABC):
+    """The class represents an abstraction of a JSON codec."""
+
+    @abstractmethod
+    def encode(self, document: Any) -> bytes:
+        """Returns JSON document encoded into UTF-8 bytes."""
+        pass
+
+    @abstractmethod
+    def decode(self, content: Union[str, bytes]) -> Any:
+        """Returns JSON document parsed from UTF-8 bytes or a text.
+
+        Raises:
+            `ValueError` if a content is not a valid JSON document
+        """
+        pass
+
+
+class StdCodec(Codec):
+    """The class represents a codec of the standard ``json`` module."""
+
+    def encode(self, document: Any) -> bytes:
+        return json.dumps(
+            document, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def decode(self, content: Union[str, bytes]) -> Any:
+        return json.loads(content)
+
+
+class UJsonCodec(Codec):
+    """The class represents a codec of ``ujson`` package."""
+
+    def encode(self, document: Any) -> bytes:
+        return _ujson.dumps(document, ensure_ascii=False).encode()
+
+    def decode(self, content: Union[str, bytes]) -> Any:
+        return _ujson.loads(content)
+
+
+class OrJsonCodec(Codec):
+    """The class represents a codec of ``orjson`` package.
+
+    A document is encoded straight into bytes without a text copy.
+    """
+
+    def encode(self, document: Any) -> bytes:
+        return _orjson.dumps(document, option=_orjson.OPT_NON_STR_KEYS)
+
+    def decode(self, content: Union[str, bytes]) -> Any:
+        return _orjson.loads(content)
+
+
+def default_codec() -> Codec:
+    """Returns a fastest codec of installed ones."""
+    if _orjson is not None:
+        return OrJsonCodec()
+    if _ujson is not None:
+        return UJsonCodec()
+    return StdCodec()
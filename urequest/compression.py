@@ -0,0 +1,106 @@
+"""The module provides API for compression of HTTP request bodies.
+
+``gzip`` and ``deflate`` are always available, ``zstd`` needs
+``zstandard`` package. Responses are decoded by ``urllib3``, so ``br``
+and ``zstd`` responses are accepted once an installed ``urllib3`` has
+their decoders (``brotli`` and a ``zstd`` package it supports).
+"""
+
+import gzip
+import importlib
+import zlib
+from dataclasses import replace
+from types import ModuleType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Union
+from urllib3.response import HTTPResponse
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.protocol import merge_headers
+from urequest.response import Response
+
+
+def _installed(name: str) -> Optional[ModuleType]:
+    """Returns a module if it is installed otherwise `None`."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_zstandard: Any = _installed("zstandard")
+_LEVELS: Dict[str, int] = {"gzip": 6, "deflate": 6, "zstd": 3}
+
+
+def _compressor(encoding: str, level: int) -> Callable[[bytes], bytes]:
+    """Returns a compressor of a content encoding.
+
+    Raises:
+        `ValueError` if an encoding is not supported or not installed
+    """
+    if encoding == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=level)
+    if encoding == "deflate":
+        return lambda data: zlib.compress(data, level)
+    if encoding == "zstd" and _zstandard is not None:
+        return _zstandard.ZstdCompressor(level=level).compress
+    raise ValueError(f"'{encoding}' content encoding is not supported!")
+
+
+def accepted_encodings() -> str:
+    """Returns content encodings of responses decoded by ``urllib3``."""
+    return ", ".join(
+        encoding
+        for encoding in HTTPResponse.CONTENT_DECODERS
+        if not encoding.startswith("x-")
+    )
+
+
+class Compression(Interceptor):
+    """The class represents compression of request bodies.
+
+    Bodies of compressed methods are encoded by ``encoding`` with
+    ``level`` (a default one of an encoding if `None`) once they reach
+    ``threshold`` bytes, unless a request sets ``Content-Encoding``
+    itself. Requests accept every encoding ``urllib3`` decodes unless
+    a request sets ``Accept-Encoding`` itself. A body is compressed once
+    per request, so retries and hedges send the same compressed body.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "gzip",
+        level: int = None,
+        threshold: int = 1024,
+        methods: Iterable[str] = ("POST", "PUT", "PATCH"),
+    ) -> None:
+        self._encoding = encoding
+        self._compress: Callable[[bytes], bytes] = _compressor(
+            encoding, _LEVELS.get(encoding, 0) if level is None else level
+        )
+        self._threshold = threshold
+        self._methods: FrozenSet[str] = frozenset(
+            method.upper() for method in methods
+        )
+        self._accepted: str = accepted_encodings()
+
+    def compress(self, data: Union[str, bytes]) -> bytes:
+        """Returns a compressed body."""
+        return self._compress(data.encode() if isinstance(data, str) else data)
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        headers: Dict[str, str] = merge_headers(
+            {"Accept-Encoding": self._accepted},
+            call.kwargs.get("headers") or {},
+        )
+        kwargs: Dict[str, Any] = {**call.kwargs, "headers": headers}
+        data: Any = kwargs.get("data")
+        encoded: bool = any(
+            name.lower() == "content-encoding" for name in headers
+        )
+        if call.method in self._methods and not encoded and self._large(data):
+            kwargs["data"] = self.compress(data)
+            headers["Content-Encoding"] = self._encoding
+        return proceed(replace(call, kwargs=kwargs))
+
+    def _large(self, data: Any) -> bool:
+        """Returns `True` if a body is worth compressing."""
+        return isinstance(data, (str, bytes)) and len(data) >= self._threshold
@@ -0,0 +1,419 @@
+"""The module provides API for downloading HTTP resources into files.
+
+A resource which length is known and which accepts byte ranges is
+downloaded into a preallocated file by ``Range`` requests, progress of
+which is kept in a ``<file>.download`` state file next to it, so an
+interrupted download resumes from where it stopped. Other resources
+are streamed into a file from their start.
+"""
+
+import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+import requests
+import urllib3
+from urequest.protocol import merge_headers
+from urequest.response import (
+    HTTPStatus,
+    Response,
+    ResponseError,
+    StreamResponse,
+)
+from urequest.url import Address
+
+if TYPE_CHECKING:
+    from urequest.base import Session  # noqa: F401
+
+Path = Union[str, "os.PathLike[str]"]
+_BUFFER: int = 1024 * 1024
+_SAVE_BYTES: int = 16 * _BUFFER
+_SAVE_SECONDS: float = 1.0
+_NO_HEAD: Tuple[int, ...] = (
+    HTTPStatus.METHOD_NOT_ALLOWED,
+    HTTPStatus.NOT_IMPLEMENTED,
+)
+_FAILURES: Tuple[Type[Exception], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    urllib3.exceptions.HTTPError,
+    OSError,
+)
+
+
+class DownloadError(ResponseError):
+    """The class represents a download which can not be completed."""
+
+    pass
+
+
+_RESUMED: Tuple[Type[Exception], ...] = (*_FAILURES, DownloadError)
+
+
+@dataclass(frozen=True)
+class _Resource:
+    """The class represents a downloaded resource.
+
+    Attributes:
+        length: size of a resource in bytes if it is known
+        etag: an entity tag of a resource if it is known
+        ranges: `True` if a resource accepts byte ranges
+    """
+
+    length: Optional[int]
+    etag: Optional[str]
+    ranges: bool
+
+
+def _probe(
+    session: "Session", url: Address, kwargs: Dict[str, Any]
+) -> _Resource:
+    """Returns a resource described by ``HEAD`` response.
+
+    A server which rejects ``HEAD`` is asked for a first byte instead.
+    """
+    try:
+        headers = session.head(url, allow_redirects=True, **kwargs).headers()
+    except ResponseError as error:
+        rejected: Optional[Response] = error.response()
+        if rejected is None or rejected.status() not in _NO_HEAD:
+            raise
+        return _probe_range(session, url, kwargs)
+    length: str = headers.get("content-length", "")
+    return _Resource(
+        int(length) if length.isdigit() else None,
+        headers.get("etag"),
+        headers.get("accept-ranges", "").lower() == "bytes",
+    )
+
+
+def _probe_range(
+    session: "Session", url: Address, kwargs: Dict[str, Any]
+) -> _Resource:
+    """Returns a resource described by a response to its first byte.
+
+    A resource accepts byte ranges if it replies ``206`` with a total
+    length in ``Content-Range``, otherwise its whole length is known
+    from ``Content-Length`` at best.
+    """
+    headers = merge_headers(
+        kwargs.get("headers") or {}, {"Range": "bytes=0-0"}
+    )
+    with cast(
+        StreamResponse,
+        session.get(url, **{**kwargs, "headers": headers, "stream": True}),
+    ) as response:
+        fields = response.headers()
+        ranged: bool = response.status() == HTTPStatus.PARTIAL_CONTENT
+    length: str = (
+        fields.get("content-range", "").rpartition("/")[2]
+        if ranged
+        else fields.get("content-length", "")
+    )
+    return _Resource(
+        int(length) if length.isdigit() else None,
+        fields.get("etag"),
+        ranged,
+    )
+
+
+class _State:
+    """The class represents progress of segments of a download.
+
+    Every segment is ``[position, end)`` byte range where ``position``
+    is a first byte which is not written yet. A state is saved once
+    ``_SAVE_BYTES`` are written or ``_SAVE_SECONDS`` pass since it was
+    saved last, so a resumed download repeats at most that much.
+    """
+
+    def __init__(
+        self, path: str, resource: _Resource, segments: List[List[int]]
+    ) -> None:
+        self._path = path
+        self.resource = resource
+        self.segments = segments
+        self._unsaved: int = 0
+        self._saved: float = monotonic()
+        self._lock = Lock()
+
+    @classmethod
+    def plan(cls, path: str, resource: _Resource, count: int) -> "_State":
+        """Returns a state of a new download split into segments."""
+        length: int = resource.length or 0
+        size: int = max(1, -(-length // max(1, count)))
+        return cls(
+            path,
+            resource,
+            [
+                [start, min(length, start + size)]
+                for start in range(0, length, size)
+            ],
+        )
+
+    @classmethod
+    def load(cls, path: str, resource: _Resource) -> Optional["_State"]:
+        """Returns a state of an interrupted download of the same resource.
+
+        Returns: `None` if there is no state or a resource changed
+        """
+        try:
+            with open(path) as file:
+                saved: Dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return None
+        expected: Dict[str, Any] = {
+            "etag": resource.etag,
+            "length": resource.length,
+        }
+        if resource.etag is None or any(
+            saved.get(name) != value for name, value in expected.items()
+        ):
+            return None
+        return cls(path, resource, saved["segments"])
+
+    def advance(self, segment: List[int], read: int) -> None:
+        """Moves a segment forward by written bytes and saves it if due."""
+        with self._lock:
+            segment[0] += read
+            self._unsaved += read
+            due: bool = (
+                self._unsaved >= _SAVE_BYTES
+                or monotonic() - self._saved >= _SAVE_SECONDS
+            )
+        if due:
+            self.save()
+
+    def save(self) -> None:
+        """Writes a state atomically."""
+        with self._lock:
+            self._unsaved, self._saved = 0, monotonic()
+            document: str = json.dumps(
+                {
+                    "etag": self.resource.etag,
+                    "length": self.resource.length,
+                    "segments": self.segments,
+                }
+            )
+            with open(f"{self._path}.tmp", "w") as file:
+                file.write(document)
+            os.replace(f"{self._path}.tmp", self._path)
+
+    def remove(self) -> None:
+        """Removes a state of a finished download."""
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+class _Sink:
+    """The class represents a preallocated file written at offsets.
+
+    A memory mapped file is written by concurrent segments without
+    a lock, a plain one is written under a lock.
+    """
+
+    def __init__(self, file: IO[bytes], length: int, mapped: bool) -> None:
+        file.truncate(length)
+        self._file = file
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(file.fileno(), length) if mapped and length else None
+        )
+        self._lock = Lock()
+
+    def write(self, position: int, data: memoryview) -> None:
+        """Writes data at a position of a file."""
+        if self._map is not None:
+            end: int = position + len(data)
+            self._map[position:end] = data
+            return
+        with self._lock:
+            self._file.seek(position)
+            self._file.write(data)
+
+    def close(self) -> None:
+        """Flushes written data to a file."""
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._file.flush()
+
+
+def _fetch_segment(  # pylint: disable=too-many-arguments
+    session: "Session",
+    url: Address,
+    segment: List[int],
+    sink: _Sink,
+    state: _State,
+    kwargs: Dict[str, Any],
+) -> None:
+    """Downloads a remaining part of a segment.
+
+    Raises:
+        `DownloadError` if a resource changed or ignores a range
+    """
+    etag: Optional[str] = state.resource.etag
+    ranged: Dict[str, str] = {"Range": f"bytes={segment[0]}-{segment[1] - 1}"}
+    if etag is not None and not etag.startswith("W/"):
+        ranged["If-Range"] = etag
+    headers = merge_headers(kwargs.get("headers") or {}, ranged)
+    response = cast(
+        StreamResponse,
+        session.get(url, **{**kwargs, "headers": headers, "stream": True}),
+    )
+    with response:
+        received: Optional[str] = response.headers().get("etag")
+        if response.status() != HTTPStatus.PARTIAL_CONTENT or (
+            etag is not None and received not in (None, etag)
+        ):
+            raise DownloadError(
+                f"'{url}' resource changed or ignores byte ranges!", response
+            )
+        buffer = memoryview(bytearray(min(_BUFFER, segment[1] - segment[0])))
+        try:
+            read: int = response.readinto(buffer)
+            while read and segment[0] < segment[1]:
+                read = min(read, segment[1] - segment[0])
+                sink.write(segment[0], buffer[:read])
+                state.advance(segment, read)
+                read = response.readinto(buffer)
+        finally:
+            state.save()
+    if segment[0] < segment[1]:
+        raise DownloadError(f"'{url}' resource is shorter than expected!")
+
+
+def _fetch_whole(  # pylint: disable=too-many-arguments
+    session: "Session",
+    url: Address,
+    path: Path,
+    resource: _Resource,
+    attempts: int,
+    kwargs: Dict[str, Any],
+) -> int:
+    """Streams a whole resource into a file starting over on failures.
+
+    Raises:
+        `DownloadError` if a resource has unexpected length
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            response = cast(
+                StreamResponse, session.get(url, **{**kwargs, "stream": True})
+            )
+            written: int = response.save_to(path)
+        except _FAILURES:
+            if attempt == attempts:
+                raise
+            continue
+        if resource.length not in (None, written):
+            raise DownloadError(f"'{url}' resource has unexpected length!")
+        break
+    return written
+
+
+def _fetch_segments(  # pylint: disable=too-many-arguments
+    session: "Session",
+    url: Address,
+    sink: _Sink,
+    state: _State,
+    attempts: int,
+    kwargs: Dict[str, Any],
+) -> None:
+    """Downloads remaining segments concurrently with their attempts.
+
+    Raises:
+        an error of a segment which attempts are exhausted
+    """
+    pending: List[List[int]] = [
+        segment for segment in state.segments if segment[0] < segment[1]
+    ]
+    for attempt in range(1, attempts + 1):
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = [
+                executor.submit(
+                    copy_context().run,
+                    _fetch_segment,
+                    session,
+                    url,
+                    segment,
+                    sink,
+                    state,
+                    kwargs,
+                )
+                for segment in pending
+            ]
+        errors: List[BaseException] = [
+            error
+            for error in (future.exception() for future in futures)
+            if error
+        ]
+        for error in errors:
+            rejected: Optional[Response] = (
+                error.response() if isinstance(error, DownloadError) else None
+            )
+            if rejected is not None:
+                state.remove()
+                raise error
+            if attempt == attempts or not isinstance(error, _RESUMED):
+                raise error
+        pending = [segment for segment in pending if segment[0] < segment[1]]
+
+
+def download_file(  # pylint: disable=too-many-arguments
+    session: "Session",
+    url: Address,
+    path: Path,
+    segments: int = 1,
+    memory_map: bool = False,
+    attempts: int = 3,
+    **kwargs: Any,
+) -> int:
+    """Downloads a resource into a file resuming interrupted transfers.
+
+    Args:
+        session: a session sending requests
+        url: url of a resource
+        path: a path to a file
+        segments: amount of byte ranges downloaded concurrently
+        memory_map: writes a file through a memory map
+        attempts: max attempts to download a segment
+        kwargs: keyword arguments of every request
+
+    Raises:
+        `DownloadError` if a resource changed or has unexpected length
+
+    Returns: amount of bytes of a file
+    """
+    resource: _Resource = _probe(session, url, kwargs)
+    if resource.length is None or not resource.ranges:
+        return _fetch_whole(session, url, path, resource, attempts, kwargs)
+    progress: str = f"{os.fspath(path)}.download"
+    state: Optional[_State] = (
+        _State.load(progress, resource) if os.path.exists(path) else None
+    )
+    state = state or _State.plan(progress, resource, segments)
+    with open(path, "r+b" if os.path.exists(path) else "w+b") as file:
+        sink = _Sink(file, resource.length, memory_map)
+        try:
+            _fetch_segments(session, url, sink, state, attempts, kwargs)
+        finally:
+            sink.close()
+    state.remove()
+    return resource.length
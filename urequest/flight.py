@@ -0,0 +1,143 @@
+"""The module provides API for coalescing identical in-flight requests."""
+from functools import partial
+from threading import Event, Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import Response
+from urequest.timeout import DeadlineExceededError, remaining
+from urequest.url import Address
+
+_IGNORED: Tuple[str, ...] = ("timeout", "stream")
+
+
+class _Flight:
+    """The class represents a request shared by concurrent callers."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.response: Optional[Response] = None
+        self.error: Optional[BaseException] = None
+
+    def outcome(self, url: Address, timeout: Optional[float]) -> Response:
+        """Returns a shared response or raises a shared error.
+
+        Raises:
+            `DeadlineExceededError` if a flight does not land in time
+        """
+        if not self.done.wait(timeout):
+            raise DeadlineExceededError(f"Deadline of {url} is exceeded")
+        if self.error is not None:
+            raise self.error
+        return self.response  # type: ignore
+
+
+def _patience(kwargs: Mapping[str, Any]) -> Optional[float]:
+    """Returns seconds a caller may wait for a flight.
+
+    A current deadline is preferred to a ``requests`` like timeout of
+    a request, which bounds connecting and reading together.
+    """
+    left: Optional[float] = remaining()
+    if left is not None:
+        return max(left, 0.0)
+    timeout: Any = kwargs.get("timeout")
+    if isinstance(timeout, (int, float)):
+        return 2 * timeout
+    if isinstance(timeout, tuple) and None not in timeout:
+        return float(sum(timeout))
+    return None
+
+
+def _key(method: str, url: Address, kwargs: Mapping[str, Any]) -> Hashable:
+    """Returns a key of a request by its method, url and arguments.
+
+    Header names are case-insensitive and a timeout does not matter.
+    """
+    arguments = {
+        name: value for name, value in kwargs.items() if name not in _IGNORED
+    }
+    headers = arguments.pop("headers", None) or {}
+    return (
+        method,
+        str(url),
+        repr(sorted((name, repr(value)) for name, value in arguments.items())),
+        repr(
+            sorted(
+                (str(name).lower(), value) for name, value in headers.items()
+            )
+        ),
+    )
+
+
+class SingleFlight(Interceptor):
+    """The class represents coalescing of identical concurrent requests.
+
+    While a request is in flight, identical requests of coalesced methods
+    wait for it instead of being sent, so every caller gets the same
+    response or the same error. Streamed requests are never coalesced.
+    A caller waits no longer than its deadline or timeout allows.
+    It is safe to share between threads.
+    """
+
+    def __init__(self, methods: Iterable[str] = ("GET", "HEAD")) -> None:
+        self._methods = frozenset(method.upper() for method in methods)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = Lock()
+
+    def perform(
+        self,
+        method: str,
+        url: Address,
+        kwargs: Mapping[str, Any],
+        send: Callable[[], Response],
+    ) -> Response:
+        """Sends a request or joins an identical one in flight.
+
+        Args:
+            method: HTTP method
+            url: requested url
+            kwargs: keyword arguments of a request
+            send: sends a request over a network
+
+        Raises:
+            `DeadlineExceededError` if an identical request in flight
+            does not complete within a deadline or a timeout of a caller
+
+        Returns: a response shared with concurrent identical requests
+        """
+        if method not in self._methods or kwargs.get("stream", False):
+            return send()
+        key: Hashable = _key(method, url, kwargs)
+        with self._lock:
+            flight: Optional[_Flight] = self._flights.get(key)
+            leading: bool = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+        if not leading:
+            return flight.outcome(url, _patience(kwargs))
+        try:
+            flight.response = send()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.response
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        return self.perform(
+            call.method, call.url, call.kwargs, partial(proceed, call)
+        )
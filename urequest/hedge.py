@@ -0,0 +1,179 @@
+"""The module provides API for hedging slow idempotent requests."""
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextvars import copy_context
+from dataclasses import dataclass
+from functools import partial
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    cast,
+)
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import Response
+from urequest.retry import RetryBudget
+from urequest.url import Address
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """The class represents counters of hedged requests.
+
+    Attributes:
+        requests: requests performed with a hedging policy
+        hedged: requests which got a hedge
+        won: hedges which replied before an original request
+    """
+
+    requests: int = 0
+    hedged: int = 0
+    won: int = 0
+
+
+class Hedge(Interceptor):
+    """The class represents a policy of hedging slow idempotent requests.
+
+    If a request of a hedged method does not reply within ``delay``
+    seconds, an identical one is sent and a first success wins, a loser
+    is cancelled if it has not started or its response is dropped.
+    Without a fixed delay, a ``quantile`` of last ``window`` latencies of
+    a host is used once ``minimum`` of them are known. A ``budget`` caps
+    a share of hedged requests (5% by default). Requests run on own
+    ``workers`` threads, so it should exceed twice the amount of
+    concurrent callers. It is safe to share between threads and sessions.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        delay: float = None,
+        quantile: float = 0.95,
+        window: int = 100,
+        minimum: int = 20,
+        budget: RetryBudget = None,
+        methods: Iterable[str] = ("GET", "HEAD", "OPTIONS"),
+        workers: int = 64,
+    ) -> None:
+        self._delay = delay
+        self._quantile = (quantile, window, minimum)
+        self._budget: RetryBudget = budget or RetryBudget(ratio=0.05)
+        self._methods: FrozenSet[str] = frozenset(
+            method.upper() for method in methods
+        )
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats = HedgeStats()
+        self._lock = Lock()
+
+    def stats(self) -> HedgeStats:
+        """Returns counters of hedged requests."""
+        return self._stats
+
+    def delay(self, host: str) -> Optional[float]:
+        """Returns seconds to wait before hedging a request to a host.
+
+        Returns: `None` if a request is not hedged yet
+        """
+        if self._delay is not None:
+            return self._delay
+        quantile, _, minimum = self._quantile
+        with self._lock:
+            latencies: List[float] = sorted(self._latencies.get(host, ()))
+        if len(latencies) < minimum:
+            return None
+        return latencies[int(quantile * (len(latencies) - 1))]
+
+    def perform(
+        self,
+        method: str,
+        url: Address,
+        kwargs: Mapping[str, Any],
+        send: Callable[[], Response],
+    ) -> Response:
+        """Sends a request and hedges it if it is slow.
+
+        Args:
+            method: HTTP method
+            url: requested url
+            kwargs: keyword arguments of a request
+            send: sends a request over a network
+
+        Raises:
+            an error of a last failed request if every request fails
+
+        Returns: a first successful response
+        """
+        if method not in self._methods or kwargs.get("stream", False):
+            return send()
+        self._budget.deposit()
+        started: float = monotonic()
+        futures: List["Future[Response]"] = [
+            self._executor.submit(copy_context().run, send)
+        ]
+        done, _ = wait(futures, timeout=self.delay(url.host()))
+        if not done and self._budget.withdraw():
+            futures.append(self._executor.submit(copy_context().run, send))
+        winner: "Future[Response]" = _first(futures)
+        self._record(url.host(), monotonic() - started)
+        self._count(
+            HedgeStats(
+                requests=1,
+                hedged=len(futures) - 1,
+                won=int(winner is not futures[0]),
+            )
+        )
+        return winner.result()
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        return self.perform(
+            call.method, call.url, call.kwargs, partial(proceed, call)
+        )
+
+    def _record(self, host: str, latency: float) -> None:
+        """Remembers a latency of a host."""
+        with self._lock:
+            self._latencies.setdefault(
+                host, deque(maxlen=self._quantile[1])
+            ).append(latency)
+
+    def _count(self, increment: HedgeStats) -> None:
+        """Increments counters of hedged requests."""
+        with self._lock:
+            self._stats = HedgeStats(
+                self._stats.requests + increment.requests,
+                self._stats.hedged + increment.hedged,
+                self._stats.won + increment.won,
+            )
+
+
+def _first(futures: List["Future[Response]"]) -> "Future[Response]":
+    """Returns a first succeeded request and cancels others.
+
+    Raises:
+        an error of a last failed request if every request fails
+    """
+    pending: Set["Future[Response]"] = set(futures)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            error = future.exception()
+            if error is None:
+                for loser in pending:
+                    loser.cancel()
+                return future
+    raise cast(BaseException, error)
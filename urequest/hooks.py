@@ -0,0 +1,159 @@
+"""The module provides API for instrumentation hooks of HTTP requests."""
+from dataclasses import dataclass, replace
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, Mapping, Optional, Tuple
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import HTTPStatus, Response, ResponseError
+from urequest.timing import Timing
+from urequest.upload import Upload
+from urequest.url import Address
+
+
+@dataclass(frozen=True)
+class Event:
+    """The class represents an event of a request sent over a network.
+
+    Attributes:
+        method: HTTP method
+        url: requested url
+        sent: length of a request body if it is known
+        status: a response status
+        received: ``Content-Length`` of a response if it is declared
+        timing: a timing breakdown of a request
+        error: an error of a failed request
+    """
+
+    method: str
+    url: Address
+    sent: Optional[int] = None
+    status: Optional[HTTPStatus] = None
+    received: Optional[int] = None
+    timing: Timing = Timing()
+    error: Optional[Exception] = None
+
+
+Hook = Callable[[Event], None]
+
+
+def _sent(kwargs: Mapping[str, Any]) -> Optional[int]:
+    """Returns length of a request body if it is known."""
+    data: Any = kwargs.get("data")
+    if data is None:
+        return 0
+    if isinstance(data, str):
+        return len(data.encode())
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, Upload):
+        return data.length()
+    return None
+
+
+def _received(response: Response) -> Optional[int]:
+    """Returns declared length of a response body."""
+    length: Optional[str] = response.headers().get("content-length")
+    return int(length) if length and length.isdigit() else None
+
+
+class Hooks(Interceptor):
+    """The class represents a registry of request instrumentation hooks.
+
+    Hooks run in a thread of a request for every request sent over
+    a network, so a retried or hedged request fires an event per attempt.
+    An error raised by a hook is raised to a caller. A registry without
+    hooks is falsy and sessions skip it at all.
+    """
+
+    def __init__(self) -> None:
+        self._before: Tuple[Hook, ...] = ()
+        self._after: Tuple[Hook, ...] = ()
+        self._error: Tuple[Hook, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self._before or self._after or self._error)
+
+    def before(self, hook: Hook) -> Hook:
+        """Registers a hook called before a request is sent.
+
+        Returns: a given hook so it can be used as a decorator
+        """
+        self._before += (hook,)
+        return hook
+
+    def after(self, hook: Hook) -> Hook:
+        """Registers a hook called once a response is received.
+
+        Returns: a given hook so it can be used as a decorator
+        """
+        self._after += (hook,)
+        return hook
+
+    def error(self, hook: Hook) -> Hook:
+        """Registers a hook called once a request fails.
+
+        An event of an error status carries its status and timing.
+
+        Returns: a given hook so it can be used as a decorator
+        """
+        self._error += (hook,)
+        return hook
+
+    def perform(
+        self,
+        method: str,
+        url: Address,
+        kwargs: Mapping[str, Any],
+        send: Callable[[], Response],
+    ) -> Response:
+        """Sends a request firing events of registered hooks.
+
+        Args:
+            method: HTTP method
+            url: requested url
+            kwargs: keyword arguments of a request
+            send: sends a request over a network
+
+        Returns: a response
+        """
+        event = Event(method, url, sent=_sent(kwargs))
+        for hook in self._before:
+            hook(event)
+        started: float = perf_counter()
+        try:
+            response: Response = send()
+        except Exception as error:
+            failed: Optional[Response] = (
+                error.response() if isinstance(error, ResponseError) else None
+            )
+            event = replace(
+                event,
+                error=error,
+                timing=Timing(total=perf_counter() - started),
+            )
+            if failed is not None:
+                event = _replied(event, failed)
+            for hook in self._error:
+                hook(event)
+            raise
+        event = _replied(event, response)
+        for hook in self._after:
+            hook(event)
+        return response
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        if not self:
+            return proceed(call)
+        return self.perform(
+            call.method, call.url, call.kwargs, partial(proceed, call)
+        )
+
+
+def _replied(event: Event, response: Response) -> Event:
+    """Returns an event completed by a response."""
+    return replace(
+        event,
+        status=response.status(),
+        received=_received(response),
+        timing=response.timing(),
+    )
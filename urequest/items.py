@@ -0,0 +1,171 @@
+"""The module provides API for selecting items of JSON documents.
+
+A path consists of dot separated object keys and ``item`` markers where
+``item`` stands for every element of an array, e.g ``data.item`` selects
+elements of an array stored under ``data`` key of a document.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, List, Match, Pattern, cast
+
+_WHITESPACE: Pattern[str] = re.compile(r"[ \t\n\r]*")
+_DELIMITERS: str = " \t\n\r,:]}"
+_ITEM: str = "item"
+
+
+def _steps(path: str) -> List[str]:
+    """Returns steps of a path."""
+    return [step for step in path.split(".") if step]
+
+
+def select_items(document: Any, path: str = _ITEM) -> Iterator[Any]:
+    """Yields items of parsed JSON document located by a path.
+
+    Args:
+        document: parsed JSON document
+        path: dot separated path to items
+
+    Returns: JSON items
+    """
+
+    def select(value: Any, steps: List[str]) -> Iterator[Any]:
+        if not steps:
+            yield value
+        elif steps[0] == _ITEM and isinstance(value, list):
+            for item in value:
+                yield from select(item, steps[1:])
+        elif isinstance(value, dict) and steps[0] in value:
+            yield from select(value[steps[0]], steps[1:])
+
+    return select(document, _steps(path))
+
+
+class _Reader:
+    """The class represents incrementally decoded JSON text.
+
+    Only a current unparsed tail of a text is kept in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._text: str = ""
+        self._position: int = 0
+        self._exhausted: bool = False
+
+    def peek(self) -> str:
+        """Returns next non whitespace character."""
+        while True:
+            self._position = cast(
+                Match[str], _WHITESPACE.match(self._text, self._position)
+            ).end()
+            if self._position < len(self._text):
+                return self._text[self._position]
+            if not self._load():
+                raise json.JSONDecodeError(
+                    "Unexpected end of document", self._text, self._position
+                )
+
+    def take(self, expected: str) -> str:
+        """Consumes next character from expected ones."""
+        character: str = self.peek()
+        if character not in expected:
+            raise json.JSONDecodeError(
+                f"Expecting one of '{expected}'", self._text, self._position
+            )
+        self._position += 1
+        return character
+
+    def value(self) -> Any:
+        """Consumes and returns next JSON value.
+
+        A value is complete once it is followed by a delimiter, so a number
+        split between chunks is not parsed prematurely.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._text, self._position)
+            except json.JSONDecodeError:
+                if not self._load():
+                    raise
+                continue
+            delimited: bool = (
+                end < len(self._text) and self._text[end] in _DELIMITERS
+            )
+            if delimited or not self._load():
+                self._position = end
+                return value
+
+    def _load(self) -> bool:
+        """Loads next chunk of a text.
+
+        Returns: `False` if a text is exhausted
+        """
+        if self._exhausted:
+            return False
+        consumed: int = self._position
+        self._text, self._position = self._text[consumed:], 0
+        for chunk in self._chunks:
+            text: str = self._decoder.decode(chunk)
+            if text:
+                self._text += text
+                return True
+        self._exhausted = True
+        self._text += self._decoder.decode(b"", final=True)
+        return False
+
+
+def _walk(reader: _Reader, steps: List[str]) -> Iterator[Any]:
+    """Yields values of a reader located by steps."""
+    if not steps:
+        yield reader.value()
+    elif steps[0] == _ITEM and reader.peek() == "[":
+        reader.take("[")
+        if reader.peek() == "]":
+            reader.take("]")
+            return
+        closing: str = ","
+        while closing == ",":
+            yield from _walk(reader, steps[1:])
+            closing = reader.take(",]")
+    elif steps[0] != _ITEM and reader.peek() == "{":
+        reader.take("{")
+        if reader.peek() == "}":
+            reader.take("}")
+            return
+        closing = ","
+        while closing == ",":
+            key: Any = reader.value()
+            reader.take(":")
+            if key == steps[0]:
+                yield from _walk(reader, steps[1:])
+            else:
+                reader.value()
+            closing = reader.take(",}")
+    else:
+        reader.value()
+
+
+def iter_items(
+    chunks: Iterable[bytes], path: str = _ITEM, encoding: str = "utf-8"
+) -> Iterator[Any]:
+    """Yields items of JSON document located by a path as bytes arrive.
+
+    Only items located by a path are parsed into objects one at a time,
+    other values are skipped.
+
+    Args:
+        chunks: encoded JSON document by chunks
+        path: dot separated path to items
+        encoding: an encoding of a document
+
+    Raises:
+        `json.JSONDecodeError` if a document is malformed
+
+    Returns: JSON items
+    """
+    return _walk(_Reader(chunks, encoding), _steps(path))
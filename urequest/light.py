@@ -0,0 +1,326 @@
+"""The module provides API for HTTP sessions built on ``http.client``.
+
+A session imports nothing but the standard library, so a process using
+it never imports ``requests``, and a request skips per-call work of
+``requests`` like hooks, environment settings and cookie jars.
+"""
+import http.client
+import json
+import math
+import socket
+import ssl
+from threading import Lock
+from time import monotonic
+from types import TracebackType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
+from urllib.parse import SplitResult, urlsplit
+from urequest.base import Session
+from urequest.protocol import (
+    DEFAULT_HEADERS,
+    IDEMPOTENT,
+    MAX_REDIRECTS,
+    REDIRECTS,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    Timeout,
+    TooManyRedirects,
+    check_arguments,
+    merge_headers,
+    redirect,
+    timeouts,
+    with_params,
+)
+from urequest.response import RawHttpResponse, Response, safe_response
+from urequest.upload import Body, Upload, body_of
+from urequest.url import Address
+
+_Key = Tuple[str, str]
+_Payload = Union[None, str, bytes, Upload]
+_Idle = Dict[_Key, List[Tuple[http.client.HTTPConnection, float]]]
+
+
+def _headers(fields: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Returns headers of a response, repeated ones are joined."""
+    headers: Dict[str, str] = {}
+    for name, value in fields:
+        name = name.lower()
+        headers[name] = (
+            f"{headers[name]}, {value}" if name in headers else value
+        )
+    return headers
+
+
+class LightHttpSession(Session):
+    """The class provides HTTP session built on ``http.client`` only.
+
+    Responses are checked the same way as responses of `HttpSession`.
+    Connections are kept alive by own pool of up to ``connections`` idle
+    connections per host, an idle connection is closed once it stays
+    idle longer than ``idle_timeout`` seconds. HTTPS connections are
+    verified by a given context or a default one of a system. Supported
+    keyword arguments of verbs are ``headers``, ``params``, ``timeout``
+    and ``allow_redirects`` with the same meaning as in ``requests``, so
+    bodies are read whole and ``download`` is not supported.
+
+    Errors are those of the standard library: `ConnectTimeoutError` and
+    `ReadTimeoutError` are `TimeoutError`, a failed connection is
+    `ConnectionError` and exceeded redirects are `TooManyRedirects`.
+    """
+
+    def __init__(
+        self,
+        connections: int = 10,
+        idle_timeout: float = None,
+        timeout: Timeout = None,
+        context: ssl.SSLContext = None,
+    ) -> None:
+        self._connections = connections
+        self._idle_timeout: float = (
+            math.inf if idle_timeout is None else idle_timeout
+        )
+        self._timeout = timeout
+        self._context: Optional[ssl.SSLContext] = context
+        self._idle: _Idle = {}
+        self._lock = Lock()
+
+    def __enter__(self) -> Session:
+        return self
+
+    def get(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("GET", url, **kwargs)
+
+    def options(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("OPTIONS", url, **kwargs)
+
+    def head(self, url: Address, **kwargs: Any) -> Response:
+        kwargs.setdefault("allow_redirects", False)
+        return self._request("HEAD", url, **kwargs)
+
+    def post(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("POST", url, plain, as_dict, **kwargs)
+
+    def put(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("PUT", url, plain, as_dict, **kwargs)
+
+    def patch(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("PATCH", url, plain, as_dict, **kwargs)
+
+    def delete(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Closes idle connections of a session."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                connection.close()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Performs an HTTP request of a session.
+
+        A plain body takes precedence over JSON one like in ``requests``.
+        Files, paths, buffers and iterators are streamed as `Upload`.
+
+        Raises:
+            `TypeError` if a keyword argument is not supported
+        """
+        check_arguments(self, kwargs)
+        fields: Dict[str, str] = {}
+        body: _Payload = body_of(plain)
+        if not plain and as_dict is not None:
+            body = json.dumps(as_dict).encode()
+            fields["Content-Type"] = "application/json"
+        elif isinstance(body, Upload) and body.content_type():
+            fields["Content-Type"] = str(body.content_type())
+        fields = merge_headers(
+            DEFAULT_HEADERS, fields, kwargs.get("headers") or {}
+        )
+        target: str = with_params(str(url), kwargs.get("params"))
+        timeout: Timeout = kwargs.get("timeout", self._timeout)
+        follow: bool = kwargs.get("allow_redirects", True)
+        response: RawHttpResponse = self._send(
+            method, target, body, fields, timeout
+        )
+        for _ in range(MAX_REDIRECTS):
+            code: int = response.status()
+            if not follow or code not in REDIRECTS:
+                return safe_response(response)
+            target, redirected, fields = redirect(
+                target,
+                method,
+                code,
+                fields,
+                response.headers().get("location", ""),
+            )
+            if redirected != method:
+                method, body = redirected, None
+            response = self._send(method, target, body, fields, timeout)
+        raise TooManyRedirects(f"Exceeded {MAX_REDIRECTS} redirects")
+
+    def _send(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        body: _Payload,
+        headers: Mapping[str, str],
+        timeout: Timeout,
+    ) -> RawHttpResponse:
+        """Sends a request over kept-alive or a new connection.
+
+        A request of idempotent method is sent again over a new connection
+        if a kept-alive connection is dropped before any reply.
+        """
+        parts: SplitResult = urlsplit(url)
+        key: _Key = (parts.scheme, parts.netloc)
+        target: str = "?".join(filter(None, (parts.path or "/", parts.query)))
+        connect, read = timeouts(timeout)
+        connection: Optional[http.client.HTTPConnection] = self._reuse(key)
+        if connection is not None:
+            try:
+                return self._exchange(
+                    key, connection, method, target, body, headers, read
+                )
+            except ConnectionError:
+                if method not in IDEMPOTENT:
+                    raise
+        connection = self._connect(parts, connect)
+        return self._exchange(
+            key, connection, method, target, body, headers, read
+        )
+
+    def _connect(
+        self, parts: SplitResult, timeout: Optional[float]
+    ) -> http.client.HTTPConnection:
+        """Opens a new connection to a host."""
+        host: str = parts.hostname or ""
+        connection: http.client.HTTPConnection
+        if parts.scheme == "https":
+            if self._context is None:
+                self._context = ssl.create_default_context()
+            connection = http.client.HTTPSConnection(
+                host, parts.port, timeout=timeout, context=self._context
+            )
+        else:
+            connection = http.client.HTTPConnection(
+                host, parts.port, timeout=timeout
+            )
+        try:
+            connection.connect()
+        except socket.timeout as error:
+            connection.close()
+            raise ConnectTimeoutError(
+                f"Connection to {host} timed out"
+            ) from error
+        return connection
+
+    def _exchange(  # pylint: disable=too-many-arguments
+        self,
+        key: _Key,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: _Payload,
+        headers: Mapping[str, str],
+        timeout: Optional[float],
+    ) -> RawHttpResponse:
+        """Exchanges a request and a response and releases a connection.
+
+        An `Upload` body is streamed from its start by every attempt.
+        """
+        fields: Dict[str, str] = dict(headers)
+        payload: Any = body.encode() if isinstance(body, str) else body
+        if isinstance(body, Upload):
+            payload = body.stream()
+            if body.length() is not None:
+                fields = merge_headers(
+                    fields, {"Content-Length": str(body.length())}
+                )
+        try:
+            connection.sock.settimeout(timeout)
+            connection.request(method, target, payload, fields)
+            reply: http.client.HTTPResponse = connection.getresponse()
+            content: bytes = reply.read()
+        except socket.timeout as error:
+            connection.close()
+            raise ReadTimeoutError(
+                f"Response of {key[1]} timed out"
+            ) from error
+        except http.client.HTTPException as error:
+            connection.close()
+            raise ConnectionError(
+                f"Malformed response of {key[1]}: {error!r}"
+            ) from error
+        except BaseException:
+            connection.close()
+            raise
+        finally:
+            if isinstance(body, Upload):
+                payload.close()
+        if reply.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        return RawHttpResponse(
+            reply.status, _headers(reply.getheaders()), content
+        )
+
+    def _reuse(self, key: _Key) -> Optional[http.client.HTTPConnection]:
+        """Returns an idle connection of a host if any."""
+        stale: List[http.client.HTTPConnection] = []
+        found: Optional[http.client.HTTPConnection] = None
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle and found is None:
+                connection, released = idle.pop()
+                if monotonic() - released > self._idle_timeout:
+                    stale.append(connection)
+                elif connection.sock is not None:
+                    found = connection
+        for connection in stale:
+            connection.close()
+        return found
+
+    def _release(
+        self, key: _Key, connection: http.client.HTTPConnection
+    ) -> None:
+        """Keeps a connection alive for next requests of a host."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._connections:
+                idle.append((connection, monotonic()))
+                return
+        connection.close()
@@ -0,0 +1,181 @@
+"""The module provides API for client-side rate limiting of requests."""
+import time
+from functools import partial
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Mapping, Optional
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import Response, ResponseError
+from urequest.retry import retry_after
+from urequest.timeout import DeadlineExceededError, remaining
+from urequest.url import Address
+
+_EPOCH: float = 1e9
+
+
+class RateLimitError(ResponseError):
+    """The class represents a request not admitted by a rate limiter."""
+
+    pass
+
+
+def _number(value: Optional[str]) -> Optional[float]:
+    """Returns a non-negative number of a header value."""
+    try:
+        return None if value is None else max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class _Bucket:
+    """The class represents a token bucket of a single key."""
+
+    __slots__ = ("tokens", "updated", "rate", "until")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+        self.rate: Optional[float] = None
+        self.until: float = 0.0
+
+
+class RateLimiter(Interceptor):
+    """The class represents token buckets pacing requests per key.
+
+    Every key (a host of an url by default) gets ``rate`` tokens per second
+    up to ``burst`` ones and a request takes a token. A bucket pauses on
+    ``Retry-After`` of a response, and spreads ``X-RateLimit-Remaining``
+    requests until ``X-RateLimit-Reset`` if it is slower than ``rate``.
+    Requests of a session wait for a token up to ``timeout`` seconds or
+    forever if it is `None`, but never past a current deadline. It is safe
+    to share between threads.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        key: Optional[Callable[[Address], str]] = None,
+        timeout: float = None,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._key: Callable[[Address], str] = (
+            key if key is not None else Address.host
+        )
+        self._timeout = timeout
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = Lock()
+
+    def acquire(
+        self,
+        key: str,
+        blocking: bool = True,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Takes a token of a key.
+
+        Args:
+            key: a key of a bucket e.g a host
+            blocking: waits for a token if `True`
+            timeout: max seconds to wait or `None` to wait forever
+
+        Returns: `True` if a token is taken
+        """
+        deadline: float = monotonic() + (
+            float("inf") if timeout is None else timeout
+        )
+        while True:
+            with self._lock:
+                wait: float = self._take(key, monotonic())
+            if wait <= 0:
+                return True
+            if not blocking or monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def try_acquire(self, key: str) -> bool:
+        """Takes a token of a key without waiting."""
+        return self.acquire(key, blocking=False)
+
+    def observe(self, key: str, headers: Mapping[str, str]) -> None:
+        """Adjusts a bucket of a key by rate limit headers of a response."""
+        now: float = monotonic()
+        pause: Optional[float] = retry_after(headers)
+        remaining: Optional[float] = _number(
+            headers.get("x-ratelimit-remaining")
+        )
+        reset: Optional[float] = _number(headers.get("x-ratelimit-reset"))
+        if reset is not None and reset > _EPOCH:
+            reset = max(0.0, reset - time.time())
+        if remaining is not None and remaining < 1 and reset is not None:
+            pause = max(pause or 0.0, reset)
+        with self._lock:
+            bucket: _Bucket = self._bucket(key, now)
+            if pause:
+                bucket.tokens, bucket.updated = 0.0, now + pause
+            elif remaining is not None and reset:
+                bucket.rate, bucket.until = remaining / reset, now + reset
+
+    def perform(self, url: Address, send: Callable[[], Response]) -> Response:
+        """Sends a request once a rate limit admits it.
+
+        Args:
+            url: requested url
+            send: sends a request over a network
+
+        Raises:
+            `RateLimitError` if a token is not taken within a timeout
+            `DeadlineExceededError` if a token comes after a deadline
+
+        Returns: a response
+        """
+        key: str = self._key(url)
+        left: Optional[float] = remaining()
+        bounded: bool = left is not None and (
+            self._timeout is None or left < self._timeout
+        )
+        if not self.acquire(key, timeout=left if bounded else self._timeout):
+            if bounded:
+                raise DeadlineExceededError(f"Deadline of {url} is exceeded")
+            raise RateLimitError(f"Rate limit of '{key}' is exceeded!")
+        try:
+            response: Response = send()
+        except ResponseError as error:
+            rejected: Optional[Response] = error.response()
+            if rejected is not None:
+                self.observe(key, rejected.headers())
+            raise
+        self.observe(key, response.headers())
+        return response
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        return self.perform(call.url, partial(proceed, call))
+
+    def _bucket(self, key: str, now: float) -> _Bucket:
+        """Returns a refilled bucket of a key."""
+        bucket: Optional[_Bucket] = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self._burst, now)
+        elapsed: float = max(0.0, now - bucket.updated)
+        bucket.tokens = min(
+            self._burst, bucket.tokens + elapsed * self._rate_of(bucket, now)
+        )
+        bucket.updated = max(now, bucket.updated)
+        return bucket
+
+    def _take(self, key: str, now: float) -> float:
+        """Takes a token and returns seconds to wait if there is none."""
+        bucket: _Bucket = self._bucket(key, now)
+        if bucket.updated > now:
+            return bucket.updated - now
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / self._rate_of(bucket, now)
+
+    def _rate_of(self, bucket: _Bucket, now: float) -> float:
+        """Returns tokens per second of a bucket."""
+        if bucket.rate is not None and now < bucket.until:
+            return min(self._rate, bucket.rate)
+        return self._rate
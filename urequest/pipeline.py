@@ -0,0 +1,78 @@
+"""The module provides API for interceptor pipelines of HTTP requests."""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, Callable, Dict, Iterable
+from requests.auth import HTTPBasicAuth
+from urequest.credentials import Credentials
+from urequest.response import Response
+from urequest.url import Address
+
+
+@dataclass(frozen=True)
+class Call:
+    """The class represents a request passed through a pipeline.
+
+    Attributes:
+        method: HTTP method
+        url: requested url
+        kwargs: keyword arguments of ``requests``
+    """
+
+    method: str
+    url: Address
+    kwargs: Dict[str, Any]
+
+
+Handler = Callable[[Call], Response]
+
+
+class Interceptor(ABC):
+    """The class represents a stage of a request pipeline."""
+
+    @abstractmethod
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        """Handles a request by passing it to a next stage or not.
+
+        Args:
+            call: a request
+            proceed: passes a request to a next stage
+
+        Returns: a response
+        """
+        pass
+
+
+class BasicAuth(Interceptor):
+    """The class represents basic authorization of requests.
+
+    An authorization given to a request itself is kept.
+    """
+
+    def __init__(self, credentials: Credentials) -> None:
+        self._auth = HTTPBasicAuth(credentials.username, credentials.password)
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        if call.kwargs.get("auth") is not None:
+            return proceed(call)
+        return proceed(
+            replace(call, kwargs={**call.kwargs, "auth": self._auth})
+        )
+
+
+def pipeline(stages: Iterable[Interceptor], dispatch: Handler) -> Handler:
+    """Composes stages around a dispatch into a single handler.
+
+    A first stage is an outermost one. Stages are bound once so handling
+    a request is a flat chain of calls.
+
+    Args:
+        stages: stages of a pipeline
+        dispatch: sends a request over a network
+
+    Returns: a handler of requests
+    """
+    handler: Handler = dispatch
+    for stage in reversed(tuple(stages)):
+        handler = partial(stage.intercept, proceed=handler)
+    return handler
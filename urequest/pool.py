@@ -0,0 +1,308 @@
+"""The module provides API for HTTP connection pools."""
+import math
+import socket
+from dataclasses import dataclass, field
+from time import monotonic, perf_counter
+from typing import Any, Dict, List, Mapping, Optional, Tuple, cast
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.poolmanager import PoolManager
+from urllib3.util.connection import allowed_gai_family
+from urequest.resolver import Resolver, SocketAddress
+from urequest.timing import Phases, recorder
+from urequest.tls import Tls, remember_session
+
+_OWN_TLS: Tuple[str, ...] = ("ca_certs", "ca_cert_dir", "cert_file")
+
+
+@dataclass(frozen=True)
+class Pool:
+    """The class represents HTTP connection pool configuration.
+
+    Attributes:
+        hosts: amount of per-host pools kept alive at the same time
+        connections: max amount of connections kept for a single host
+        block: blocks a request if a host pool has no free connection,
+            otherwise opens an overflow connection which is discarded
+            on release
+        idle_timeout: seconds a kept-alive connection may stay idle
+            before it is closed instead of being reused
+        per_host: max amount of connections for specific hosts
+        resolver: resolves hosts of new connections and connects to them
+            instead of a system resolver if it is given
+        tls: TLS configuration of HTTPS connections, which share its
+            context and resume its sessions (non-blocking connections
+            share its context only)
+
+    Connections through a proxy are sized by ``hosts``, ``connections``
+    and ``block`` only, ``idle_timeout``, ``per_host``, ``resolver`` and
+    ``tls`` are not applied.
+    """
+
+    hosts: int = 10
+    connections: int = 10
+    block: bool = False
+    idle_timeout: Optional[float] = None
+    per_host: Mapping[str, int] = field(default_factory=dict)
+    resolver: Optional[Resolver] = None
+    tls: Optional[Tls] = None
+
+    def connections_for(self, host: str) -> int:
+        """Returns max amount of connections kept for a given host."""
+        return self.per_host.get(host, self.connections)
+
+
+class _IdleAwarePool:
+    """The class represents a connection pool dropping idle connections."""
+
+    idle_timeout: Optional[float] = None
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        conn = super()._get_conn(timeout)  # type: ignore
+        idle = monotonic() - getattr(conn, "_urequest_released", math.inf)
+        if self.idle_timeout is not None and idle > self.idle_timeout:
+            conn.close()
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        if conn is not None:
+            conn._urequest_released = monotonic()
+        super()._put_conn(conn)  # type: ignore
+
+
+class _ResolvingPool:
+    """The class represents a connection pool resolving hosts itself."""
+
+    resolver: Optional[Resolver] = None
+
+    def _new_conn(self) -> Any:
+        conn = super()._new_conn()  # type: ignore
+        conn._urequest_resolver = self.resolver
+        return conn
+
+
+class _TimedConnection:
+    """The class represents a connection recording phases of requests.
+
+    A host is resolved apart from connecting to its addresses in turn,
+    so resolution and connection are timed separately.
+    """
+
+    _dns_host: str
+    _urequest_resolver: Optional[Resolver] = None
+    port: int
+
+    def _new_conn(self) -> Any:
+        if self._urequest_resolver is not None:
+            return self._resolved_conn(self._urequest_resolver)
+        phases: Optional[Phases] = recorder()
+        if phases is None:
+            return super()._new_conn()  # type: ignore
+        host: str = self._dns_host
+        started: float = perf_counter()
+        try:
+            addresses: List[Any] = socket.getaddrinfo(
+                host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except OSError:
+            return super()._new_conn()  # type: ignore
+        resolved: float = perf_counter()
+        phases.dns += resolved - started
+        error: Optional[Exception] = None
+        try:
+            for *_, address in addresses:
+                self._dns_host = address[0]
+                try:
+                    return super()._new_conn()  # type: ignore
+                except ConnectTimeoutError as failure:
+                    error = failure
+            raise cast(Exception, error)
+        finally:
+            self._dns_host = host
+            phases.connect += perf_counter() - resolved
+
+    def _resolved_conn(self, resolver: Resolver) -> socket.socket:
+        """Connects to a host resolved by a resolver."""
+        conn: Any = self
+        phases: Optional[Phases] = recorder()
+        started: float = perf_counter()
+        try:
+            addresses: List[SocketAddress] = resolver.resolve(
+                self._dns_host, self.port
+            )
+            resolved: float = perf_counter()
+            timeout: Any = conn.timeout
+            connection: socket.socket = resolver.connect(
+                addresses,
+                timeout if isinstance(timeout, (int, float)) else None,
+                conn.source_address,
+                conn.socket_options or (),
+            )
+        except socket.timeout as error:
+            raise ConnectTimeoutError(
+                conn, f"Connection to {conn.host} timed out"
+            ) from error
+        except OSError as error:
+            raise NewConnectionError(
+                conn, f"Failed to establish a new connection: {error}"
+            ) from error
+        if phases is not None:
+            phases.dns += resolved - started
+            phases.connect += perf_counter() - resolved
+        return connection
+
+    def getresponse(self, *args: Any, **kwargs: Any) -> Any:
+        started: float = perf_counter()
+        response: Any = super().getresponse(*args, **kwargs)  # type: ignore
+        phases: Optional[Phases] = recorder()
+        if phases is not None:
+            phases.headers = perf_counter()
+            phases.first_byte += phases.headers - started
+        return response
+
+
+class _TimedHttpConnection(_TimedConnection, HTTPConnection):
+    """The class represents HTTP connection recording phases of requests."""
+
+    pass
+
+
+class _TimedHttpsConnection(_TimedConnection, HTTPSConnection):
+    """The class represents HTTPS connection recording phases of requests.
+
+    A TLS handshake takes the rest of connecting once a socket is open.
+    A TLS session is kept for resumption once a response is received.
+    """
+
+    sock: Any
+
+    def connect(self) -> None:
+        phases: Optional[Phases] = recorder()
+        started: float = perf_counter()
+        opened: float = 0.0 if phases is None else phases.dns + phases.connect
+        super().connect()
+        if phases is not None:
+            phases.tls += perf_counter() - started
+            phases.tls -= phases.dns + phases.connect - opened
+
+    def getresponse(self, *args: Any, **kwargs: Any) -> Any:
+        sock: Any = self.sock
+        response: Any = super().getresponse(*args, **kwargs)
+        remember_session(sock)
+        return response
+
+
+class _HttpPool(_IdleAwarePool, _ResolvingPool, HTTPConnectionPool):
+    """The class represents idle aware HTTP connection pool."""
+
+    ConnectionCls = _TimedHttpConnection
+
+
+class _HttpsPool(_IdleAwarePool, _ResolvingPool, HTTPSConnectionPool):
+    """The class represents idle aware HTTPS connection pool."""
+
+    ConnectionCls = _TimedHttpsConnection
+
+
+def _own_tls(context: Mapping[str, Any]) -> bool:
+    """Returns `True` if a pool verifies certificates its own way."""
+    unverified: bool = context.get("cert_reqs") == "CERT_NONE"
+    return unverified or any(context.get(name) for name in _OWN_TLS)
+
+
+class _PoolManager(PoolManager):
+    """The class represents pool manager sized by pool configuration.
+
+    Pools of requests which are not verified or verified by their own
+    certificates do not share a TLS context of a configuration.
+    """
+
+    def __init__(self, pool: Pool, **kwargs: Any) -> None:
+        if pool.tls is not None:
+            kwargs.setdefault("ssl_context", pool.tls.context())
+        super().__init__(**kwargs)
+        self._pool = pool
+        self.pool_classes_by_scheme = {"http": _HttpPool, "https": _HttpsPool}
+
+    def _new_pool(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request_context: Optional[Dict[str, Any]] = None,
+    ) -> HTTPConnectionPool:
+        context: Dict[str, Any] = dict(
+            request_context or self.connection_pool_kw
+        )
+        context["maxsize"] = self._pool.connections_for(host)
+        if _own_tls(context):
+            context.pop("ssl_context", None)
+        pool: HTTPConnectionPool = super()._new_pool(
+            scheme, host, port, context
+        )
+        cast(_IdleAwarePool, pool).idle_timeout = self._pool.idle_timeout
+        cast(_ResolvingPool, pool).resolver = self._pool.resolver
+        return pool
+
+
+class PooledAdapter(HTTPAdapter):
+    """The class represents HTTP adapter configured by a connection pool.
+
+    Proxy managers are created by `HTTPAdapter` itself so they get only
+    generic pool sizing (see `Pool`).
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_pool"]
+
+    def __init__(self, pool: Pool) -> None:
+        self._pool = pool
+        super().__init__(
+            pool_connections=pool.hosts,
+            pool_maxsize=pool.connections,
+            pool_block=pool.block,
+        )
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: Any,
+    ) -> None:
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _PoolManager(
+            self._pool,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def build_connection_pool_key_attributes(
+        self, request: Any, verify: Any, cert: Any = None
+    ) -> Any:
+        return super().build_connection_pool_key_attributes(
+            request,
+            bool(verify) if self._shared(verify, cert) else verify,
+            cert,
+        )
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        if not self._shared(verify, cert):
+            super().cert_verify(conn, url, verify, cert)
+            return
+        conn.cert_reqs = "CERT_REQUIRED"
+        conn.ca_certs = None
+        conn.ca_cert_dir = None
+
+    def _shared(self, verify: Any, cert: Any) -> bool:
+        """Returns `True` if a request is verified by a shared TLS context.
+
+        Its trusted certificates take place of a ``verify`` bundle, which
+        includes ``REQUESTS_CA_BUNDLE`` of an environment.
+        """
+        return self._pool.tls is not None and bool(verify) and not cert
@@ -0,0 +1,114 @@
+"""The module provides API of HTTP/1.1 messages of own connection pools.
+
+It imports nothing but the standard library, so sessions which do not
+run on ``requests`` stay free of it.
+"""
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlencode, urljoin, urlsplit
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+ARGUMENTS: Tuple[str, ...] = (
+    "headers",
+    "params",
+    "timeout",
+    "allow_redirects",
+)
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": "urequest",
+    "Accept": "*/*",
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive",
+}
+IDEMPOTENT: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+REDIRECTS: Tuple[int, ...] = (301, 302, 303, 307, 308)
+MAX_REDIRECTS: int = 30
+
+
+class ConnectTimeoutError(TimeoutError):
+    """The class represents a timeout while connecting to a host."""
+
+    pass
+
+
+class ReadTimeoutError(TimeoutError):
+    """The class represents a timeout while waiting for a response."""
+
+    pass
+
+
+class TooManyRedirects(Exception):
+    """The class represents an exceeded amount of followed redirects."""
+
+    pass
+
+
+def merge_headers(*headers: Mapping[str, str]) -> Dict[str, str]:
+    """Merges headers case-insensitively, latter headers take precedence."""
+    fields: Dict[str, Tuple[str, str]] = {}
+    for mapping in headers:
+        for name, value in mapping.items():
+            fields[name.lower()] = (name, value)
+    return dict(fields.values())
+
+
+def check_arguments(session: object, arguments: Mapping[str, Any]) -> None:
+    """Checks keyword arguments of a verb of a session.
+
+    Raises:
+        `TypeError` if an argument is not one of ``ARGUMENTS``
+    """
+    unsupported: Tuple[str, ...] = tuple(sorted(set(arguments) - {*ARGUMENTS}))
+    if unsupported:
+        raise TypeError(
+            f"{type(session).__name__} does not support "
+            f"{', '.join(unsupported)} argument(s)"
+        )
+
+
+def timeouts(timeout: Timeout) -> Tuple[Optional[float], Optional[float]]:
+    """Returns connect and read timeouts from ``requests`` like timeout."""
+    if isinstance(timeout, tuple):
+        return timeout
+    return timeout, timeout
+
+
+def with_params(url: str, params: Optional[Mapping[str, str]]) -> str:
+    """Appends query parameters to a url."""
+    if not params:
+        return url
+    return f"{url}{'&' if urlsplit(url).query else '?'}{urlencode(params)}"
+
+
+def redirect(
+    url: str,
+    method: str,
+    code: int,
+    headers: Mapping[str, str],
+    location: str,
+) -> Tuple[str, str, Dict[str, str]]:
+    """Returns a url, a method and headers of a redirected request.
+
+    Redirects are followed the same way as ``requests`` does: ``302``
+    and ``303`` (or ``301`` of ``POST``) are sent again as ``GET``
+    without a body, authorization is dropped on a host change.
+    """
+    target: str = urljoin(url, location)
+    dropped: Tuple[str, ...] = ()
+    if urlsplit(target).netloc != urlsplit(url).netloc:
+        dropped += ("authorization",)
+    redirected: str = method
+    if code in (302, 303) and method != "HEAD":
+        redirected = "GET"
+    if code == 301 and method == "POST":
+        redirected = "GET"
+    if redirected != method:
+        dropped += ("content-type", "content-length", "transfer-encoding")
+    return (
+        target,
+        redirected,
+        {
+            name: value
+            for name, value in headers.items()
+            if name.lower() not in dropped
+        },
+    )
@@ -0,0 +1,282 @@
+"""The module provides API for resolving and connecting to hosts.
+
+Resolved addresses are cached in process, so new connections to
+a known host skip a system lookup, and addresses are tried by
+"happy eyeballs" (RFC 8305): families alternate and a next address is
+tried while a previous one is still connecting.
+"""
+
+import errno
+import os
+import selectors
+import socket
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from math import isinf
+from time import monotonic
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from urllib3.util.connection import allowed_gai_family
+
+SocketAddress = Tuple[int, Tuple[Any, ...]]
+SocketOption = Tuple[int, int, int]
+_Key = Tuple[str, int, int]
+_STARTED: Tuple[int, ...] = (0, errno.EINPROGRESS, errno.EWOULDBLOCK)
+
+
+@dataclass(frozen=True)
+class ResolverStats:
+    """The class represents counters of a resolver cache.
+
+    Attributes:
+        hits: lookups served from a cache
+        misses: lookups resolved by a system resolver
+        expirations: cached lookups outlived their time to live
+        evictions: cached lookups dropped to stay within a size
+    """
+
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+
+
+class _Record:
+    """The class represents cached addresses of a host."""
+
+    __slots__ = ("addresses", "expires", "turn")
+
+    def __init__(
+        self, addresses: Sequence[SocketAddress], expires: float
+    ) -> None:
+        self.addresses = addresses
+        self.expires = expires
+        self.turn = 0
+
+    def take(self) -> List[SocketAddress]:
+        """Returns addresses in a next order of a rotation."""
+        self.turn += 1
+        return _ordered(self.addresses, self.turn - 1)
+
+
+def _ordered(
+    addresses: Sequence[SocketAddress], turn: int
+) -> List[SocketAddress]:
+    """Returns addresses rotated by a turn within families interleaved.
+
+    Families keep an order of a system resolver, so a preferred one goes
+    first, and a rotation balances connections across records.
+    """
+    families: Dict[int, List[SocketAddress]] = {}
+    for address in addresses:
+        families.setdefault(address[0], []).append(address)
+    rotated: List[List[SocketAddress]] = [
+        _rotated(group, turn) for group in families.values()
+    ]
+    return [
+        group[index]
+        for index in range(max(map(len, rotated), default=0))
+        for group in rotated
+        if index < len(group)
+    ]
+
+
+def _rotated(group: List[SocketAddress], turn: int) -> List[SocketAddress]:
+    """Returns addresses shifted left by a turn."""
+    shift: int = turn % len(group)
+    return group[shift:] + group[:shift]
+
+
+def _numeric(hosts: Iterable[str], port: int) -> List[SocketAddress]:
+    """Returns socket addresses of numeric hosts."""
+    return [
+        (family, address)
+        for host in hosts
+        for family, _, _, _, address in socket.getaddrinfo(
+            host, port, 0, socket.SOCK_STREAM, 0, socket.AI_NUMERICHOST
+        )
+    ]
+
+
+class Resolver:
+    """The class represents a caching resolver of hosts.
+
+    Addresses of a host are kept for ``ttl`` seconds and at most
+    ``entries`` hosts are kept, least recently used ones are dropped
+    first. A system resolver does not tell a time to live of records,
+    so ``ttl`` is an upper bound of their age. Hosts of ``overrides`` are
+    resolved to given IP addresses without a lookup. Every connection
+    takes addresses of a host rotated, so connections are balanced
+    across records. ``delay`` is seconds a connection attempt is given
+    before a next address is tried concurrently.
+    It is safe to share between threads and sessions.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        entries: int = 256,
+        overrides: Mapping[str, Iterable[str]] = None,
+        delay: float = 0.25,
+    ) -> None:
+        self._ttl = ttl
+        self._entries = entries
+        self._overrides: Dict[str, Tuple[str, ...]] = {
+            host: tuple(addresses)
+            for host, addresses in (overrides or {}).items()
+        }
+        self._delay = delay
+        self._records: "OrderedDict[_Key, _Record]" = OrderedDict()
+        self._stats = ResolverStats()
+        self._lock = Lock()
+
+    def stats(self) -> ResolverStats:
+        """Returns counters of a cache."""
+        return self._stats
+
+    def resolve(self, host: str, port: int) -> List[SocketAddress]:
+        """Returns addresses of a host in an order to connect to them.
+
+        Raises:
+            `socket.gaierror` if a host is not resolved
+        """
+        host = host.strip("[]")
+        key: _Key = (host, port, allowed_gai_family())
+        with self._lock:
+            record: Optional[_Record] = self._records.get(key)
+            if record is not None and record.expires > monotonic():
+                self._records.move_to_end(key)
+                self._count(ResolverStats(hits=1))
+                return record.take()
+        if host in self._overrides:
+            addresses: List[SocketAddress] = _numeric(
+                self._overrides[host], port
+            )
+        else:
+            addresses = [
+                (family, address)
+                for family, _, _, _, address in socket.getaddrinfo(
+                    host, port, key[2], socket.SOCK_STREAM
+                )
+            ]
+        with self._lock:
+            self._count(
+                ResolverStats(misses=1, expirations=int(record is not None))
+            )
+            fresh = _Record(addresses, monotonic() + self._ttl)
+            self._records[key] = fresh
+            self._records.move_to_end(key)
+            while len(self._records) > self._entries:
+                self._records.popitem(last=False)
+                self._count(ResolverStats(evictions=1))
+            return fresh.take()
+
+    def connect(
+        self,
+        addresses: Sequence[SocketAddress],
+        timeout: Optional[float] = None,
+        source: Tuple[str, int] = None,
+        options: Iterable[SocketOption] = (),
+    ) -> socket.socket:
+        """Connects to a first address which accepts a connection.
+
+        An attempt is started every ``delay`` seconds or once a previous
+        one fails, and attempts which lose a race are closed.
+
+        Args:
+            addresses: addresses in an order to try them
+            timeout: seconds to connect and a timeout of a socket
+            source: an address to bind a socket to
+            options: options set on a socket before connecting
+
+        Raises:
+            `socket.timeout` if no address is connected in time
+            `OSError` of a last attempt if every attempt fails
+        """
+        expires: float = monotonic() + (
+            float("inf") if timeout is None else timeout
+        )
+        waiting: List[SocketAddress] = list(addresses)
+        error: OSError = OSError("There are no addresses to connect to")
+        with selectors.DefaultSelector() as selector:
+            try:
+                while waiting or selector.get_map():
+                    if waiting:
+                        failure: Optional[OSError] = _attempt(
+                            selector, waiting.pop(0), source, options
+                        )
+                        if failure is not None:
+                            error = failure
+                            continue
+                    left: float = expires - monotonic()
+                    if left <= 0:
+                        raise socket.timeout(f"Connect timed out ({timeout}s)")
+                    pause: float = min(self._delay, left) if waiting else left
+                    ready = selector.select(None if isinf(pause) else pause)
+                    for key, _ in ready:
+                        connection: socket.socket = key.fileobj  # type: ignore
+                        selector.unregister(connection)
+                        code: int = connection.getsockopt(
+                            socket.SOL_SOCKET, socket.SO_ERROR
+                        )
+                        if code == 0:
+                            connection.settimeout(timeout)
+                            return connection
+                        connection.close()
+                        error = OSError(code, os.strerror(code), str(key.data))
+            finally:
+                _close(selector)
+        raise error
+
+    def _count(self, increment: ResolverStats) -> None:
+        """Increments counters of a cache."""
+        self._stats = ResolverStats(
+            self._stats.hits + increment.hits,
+            self._stats.misses + increment.misses,
+            self._stats.expirations + increment.expirations,
+            self._stats.evictions + increment.evictions,
+        )
+
+
+def _attempt(
+    selector: selectors.BaseSelector,
+    address: SocketAddress,
+    source: Optional[Tuple[str, int]],
+    options: Iterable[SocketOption],
+) -> Optional[OSError]:
+    """Starts connecting to an address watched by a selector.
+
+    Returns: an error if an attempt fails at once
+    """
+    connection = socket.socket(address[0], socket.SOCK_STREAM)
+    try:
+        for option in options:
+            connection.setsockopt(*option)
+        if source:
+            connection.bind(source)
+        connection.setblocking(False)
+        code: int = connection.connect_ex(address[1])
+    except OSError as error:
+        connection.close()
+        return error
+    if code not in _STARTED:
+        connection.close()
+        return OSError(code, os.strerror(code), str(address[1]))
+    selector.register(connection, selectors.EVENT_WRITE, address[1])
+    return None
+
+
+def _close(selector: selectors.BaseSelector) -> None:
+    """Closes sockets watched by a selector."""
+    for key in list(selector.get_map().values()):
+        selector.unregister(key.fileobj)
+        key.fileobj.close()  # type: ignore
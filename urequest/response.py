@@ -1,22 +1,70 @@
-"""The module contains a set of API for HTTP responses types."""
+"""The module contains a set of API for HTTP responses types.
+
+``requests`` is imported for type checks only, so raw responses of
+sessions which do not run on ``requests`` stay free of it.
+"""
+import codecs
 import http
+import json
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable, Union
-import requests
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+from urequest.codec import Codec
+from urequest.items import iter_items, select_items
+from urequest.timing import Timing
+
+if TYPE_CHECKING:
+    import requests  # noqa: F401
 
 JsonType = Union[Dict[Any, Any], Any]
 HTTPStatus = http.HTTPStatus
+_UNSET: Any = object()
+
+
+def _json_of(
+    response: "requests.Response", codec: Optional[Codec]
+) -> JsonType:
+    """Parses a body of a response with a codec or ``requests`` decoder.
+
+    A body in a charset other than UTF-8 is decoded into a text first.
+    """
+    if codec is None:
+        return response.json()
+    if response.encoding and codecs.lookup(response.encoding).name != "utf-8":
+        return codec.decode(response.text)
+    return codec.decode(response.content)
 
 
 class ResponseError(Exception):
     """The class represents HTTP api request response error."""
 
-    pass
+    def __init__(self, message: str, response: "Response" = None) -> None:
+        super().__init__(message)
+        self._response: Optional[Response] = response
+
+    def response(self) -> Optional["Response"]:
+        """Returns a rejected response if it is known."""
+        return self._response
 
 
 class Response(ABC):
     """The class represents an abstraction of a response from an API request."""
 
+    __slots__ = ()
+
     @abstractmethod
     def is_ok(self) -> bool:
         """Returns `True` if response is `OK` otherwise `False`."""
@@ -37,12 +85,181 @@ class Response(ABC):
         """Returns HTTP response data as plain data type."""
         pass
 
+    def headers(self) -> Mapping[str, str]:
+        """Returns case-insensitive HTTP response headers."""
+        return {}
+
+    def as_bytes(self) -> bytes:
+        """Returns HTTP response data as received bytes.
+
+        A body is not decoded by a charset so binary payloads are intact.
+        """
+        return str(self).encode()
+
+    def as_memoryview(self) -> memoryview:
+        """Returns a read-only view of HTTP response data without a copy."""
+        return memoryview(self.as_bytes())
+
+    def timing(self) -> Timing:
+        """Returns a timing breakdown of a request of a response."""
+        return Timing()
+
+    def iter_json_items(self, path: str = "item") -> Iterator[JsonType]:
+        """Yields items of HTTP response data (json) located by a path.
+
+        Args:
+            path: dot separated object keys where ``item`` stands for
+                every element of an array e.g ``data.item``
+
+        Returns: JSON items
+        """
+        return select_items(self.as_json(), path)
+
 
 class HttpResponse(Response):
-    """The class represents an HTTP response from HTTP API request."""
+    """The class represents an HTTP response from HTTP API request.
+
+    A status, decoded text and parsed JSON are computed once on first
+    access, so a returned JSON document is shared between calls.
+    JSON is parsed by a given codec or by ``requests`` otherwise.
+    """
+
+    __slots__ = ("_response", "_codec", "_timing", "_status", "_text", "_json")
+
+    def __init__(
+        self,
+        response: "requests.Response",
+        codec: Codec = None,
+        timing: Timing = None,
+    ) -> None:
+        self._response: "requests.Response" = response
+        self._codec: Optional[Codec] = codec
+        self._timing: Timing = timing or Timing()
+        self._status: Optional[HTTPStatus] = None
+        self._text: Optional[str] = None
+        self._json: JsonType = _UNSET
+
+    def is_ok(self) -> bool:
+        return self._response.status_code < HTTPStatus.BAD_REQUEST
+
+    def status(self) -> HTTPStatus:
+        if self._status is None:
+            self._status = HTTPStatus(self._response.status_code)
+        return self._status
+
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    def timing(self) -> Timing:
+        return self._timing
+
+    def as_bytes(self) -> bytes:
+        return self._response.content
+
+    def as_json(self) -> JsonType:
+        if self._json is _UNSET:
+            self._json = _json_of(self._response, self._codec)
+        return self._json
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._response.text
+        return self._text
+
+
+class StreamResponse(Response, ContextManager["StreamResponse"]):
+    """The class represents a response with a body read on demand.
+
+    A connection is released back to a pool once a body is read
+    or a response is closed.
+    """
+
+    @abstractmethod
+    def iter_bytes(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Yields HTTP response data by chunks.
+
+        Args:
+            chunk_size: max size of a single chunk in bytes
+        """
+        pass
+
+    @abstractmethod
+    def iter_lines(self) -> Iterator[str]:
+        """Yields HTTP response data by decoded lines."""
+        pass
+
+    @abstractmethod
+    def readinto(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Reads next HTTP response data into a writable buffer.
+
+        Args:
+            buffer: a buffer filled from its start e.g a reused bytearray
 
-    def __init__(self, response: requests.Response) -> None:
-        self._response: requests.Response = response
+        Returns: amount of read bytes, zero once a body is read
+        """
+        pass
+
+    def save_to(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        chunk_size: int = 64 * 1024,
+    ) -> int:
+        """Writes HTTP response data into a file.
+
+        Args:
+            path: a path to a file
+            chunk_size: max size of a single written chunk in bytes
+
+        Returns: amount of written bytes
+        """
+        written: int = 0
+        with open(path, "wb") as file:
+            for chunk in self.iter_bytes(chunk_size):
+                written += file.write(chunk)
+        return written
+
+    def iter_json_items(self, path: str = "item") -> Iterator[JsonType]:
+        """Yields items of HTTP response data (json) as a body arrives.
+
+        Items are parsed one at a time so memory is bounded by an item.
+
+        Args:
+            path: dot separated object keys where ``item`` stands for
+                every element of an array e.g ``data.item``
+
+        Returns: JSON items
+        """
+        return iter_items(self.iter_bytes(), path)
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases a connection of a response."""
+        pass
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class HttpStreamResponse(StreamResponse):
+    """The class represents a streamed HTTP response from HTTP API request.
+
+    Reading a response as JSON or text loads a whole body into memory.
+    """
+
+    def __init__(
+        self,
+        response: "requests.Response",
+        codec: Codec = None,
+        timing: Timing = None,
+    ) -> None:
+        self._response: "requests.Response" = response
+        self._codec: Optional[Codec] = codec
+        self._timing: Timing = timing or Timing()
 
     def is_ok(self) -> bool:
         return self._response.ok
@@ -50,11 +267,112 @@ class HttpResponse(Response):
     def status(self) -> HTTPStatus:
         return HTTPStatus(self._response.status_code)
 
+    def headers(self) -> Mapping[str, str]:
+        return self._response.headers
+
+    def timing(self) -> Timing:
+        return self._timing
+
+    def as_bytes(self) -> bytes:
+        try:
+            return self._response.content
+        finally:
+            self.close()
+
     def as_json(self) -> JsonType:
-        return self._response.json()
+        try:
+            return _json_of(self._response, self._codec)
+        finally:
+            self.close()
+
+    def iter_bytes(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        try:
+            yield from self._response.iter_content(chunk_size)
+        finally:
+            self.close()
+
+    def iter_lines(self) -> Iterator[str]:
+        encoding: str = self._response.encoding or "utf-8"
+        try:
+            for line in self._response.iter_lines():
+                yield line.decode(encoding, errors="replace")
+        finally:
+            self.close()
+
+    def readinto(self, buffer: Union[bytearray, memoryview]) -> int:
+        raw: Any = self._response.raw
+        raw.decode_content = True
+        read: int = raw.readinto(buffer)
+        if not read:
+            self.close()
+        return read
+
+    def close(self) -> None:
+        self._response.close()
+
+    def __str__(self) -> str:
+        try:
+            return self._response.text
+        finally:
+            self.close()
+
+
+class _Headers(Mapping[str, str]):
+    """The class represents case-insensitive headers of a raw response."""
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        self._fields: Dict[str, Tuple[str, str]] = {
+            name.lower(): (name, value) for name, value in headers.items()
+        }
+
+    def __getitem__(self, name: str) -> str:
+        return self._fields[name.lower()][1]
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._fields.values())
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class RawHttpResponse(Response):
+    """The class represents an HTTP response composed of received bytes."""
+
+    def __init__(
+        self, code: int, headers: Mapping[str, str], content: bytes
+    ) -> None:
+        self._code = code
+        self._headers: Mapping[str, str] = _Headers(headers)
+        self._content = content
+
+    def is_ok(self) -> bool:
+        return self._code < HTTPStatus.BAD_REQUEST
+
+    def status(self) -> HTTPStatus:
+        return HTTPStatus(self._code)
+
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    def as_bytes(self) -> bytes:
+        return self._content
+
+    def as_json(self) -> JsonType:
+        return json.loads(self._content.decode(self._charset()))
 
     def __str__(self) -> str:
-        return self._response.text
+        return self._content.decode(self._charset(), errors="replace")
+
+    def _charset(self) -> str:
+        """Returns a charset of a response from its content type."""
+        for parameter in self._headers.get("content-type", "").split(";"):
+            name, _, value = parameter.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"')
+        return "utf-8"
 
 
 def safe_response(
@@ -76,9 +394,11 @@ def safe_response(
 
     Returns: a response
     """
-    if response.status() not in success_codes:
+    status: HTTPStatus = response.status()
+    if status not in success_codes:
         raise ResponseError(
-            f"HTTP response contains some errors with '{response.status()}' "
-            f"status! Reason: {response}"
+            f"HTTP response contains some errors with '{status}' "
+            f"status! Reason: {response}",
+            response,
         )
     return response
@@ -0,0 +1,207 @@
+"""The module provides API for retrying failed HTTP requests."""
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import partial
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+import requests
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.response import Response, ResponseError
+from urequest.timeout import remaining
+from urequest.upload import Upload
+
+_IDEMPOTENT: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+_STATUSES: Tuple[int, ...] = (429, 502, 503, 504)
+_FAILURES: Tuple[Type[Exception], ...] = (
+    ResponseError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """The class represents counters of retried requests.
+
+    Attributes:
+        requests: requests performed with a retry policy
+        retries: repeated attempts of requests
+        exhausted: requests failed after all attempts
+        throttled: retries denied by a retry budget
+    """
+
+    requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+    throttled: int = 0
+
+
+class RetryBudget:
+    """The class represents a token bucket capping a share of retries.
+
+    Every request deposits ``ratio`` of a token and every retry withdraws
+    a whole one, so retries stay within ``ratio`` of requests once
+    a ``reserve`` of tokens for bursts of failures is spent.
+    """
+
+    def __init__(self, ratio: float = 0.1, reserve: float = 10.0) -> None:
+        self._ratio = ratio
+        self._reserve = reserve
+        self._tokens = reserve
+        self._lock = Lock()
+
+    def deposit(self) -> None:
+        """Deposits a share of a token for a request."""
+        with self._lock:
+            self._tokens = min(self._reserve, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Withdraws a token for a retry.
+
+        Returns: `False` if a budget is spent
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Returns seconds to wait from ``Retry-After`` response header."""
+    value: str = headers.get("retry-after", "").strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+class Retry(Interceptor):
+    """The class represents a policy of retrying failed requests.
+
+    Connection errors, timeouts and responses with retryable statuses of
+    idempotent methods are retried with exponential backoff and full
+    jitter. ``Retry-After`` header of a response is waited out, a request
+    is not retried if it asks to wait longer than ``max_backoff`` or than
+    it is left until a deadline of a request. A request with a body which
+    can not be sent again (see `Upload.replayable`) is never retried.
+    It is safe to share between threads and sessions.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        attempts: int = 3,
+        statuses: Iterable[int] = _STATUSES,
+        methods: Iterable[str] = _IDEMPOTENT,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        budget: RetryBudget = None,
+    ) -> None:
+        self._attempts = attempts
+        self._statuses: FrozenSet[int] = frozenset(statuses)
+        self._methods: FrozenSet[str] = frozenset(
+            method.upper() for method in methods
+        )
+        self._backoff: Tuple[float, float] = (backoff, max_backoff)
+        self._budget: RetryBudget = budget or RetryBudget()
+        self._stats = RetryStats()
+        self._lock = Lock()
+
+    def stats(self) -> RetryStats:
+        """Returns counters of retried requests."""
+        return self._stats
+
+    def perform(
+        self,
+        method: str,
+        send: Callable[[], Response],
+        replayable: bool = True,
+    ) -> Response:
+        """Sends a request until it succeeds or a policy gives up.
+
+        Args:
+            method: HTTP method
+            send: sends a request over a network
+            replayable: `False` if a request can be sent only once
+
+        Raises:
+            an error of a last attempt
+
+        Returns: a response
+        """
+        self._budget.deposit()
+        self._count(RetryStats(requests=1))
+        attempt: int = 1
+        while True:
+            try:
+                return send()
+            except _FAILURES as error:
+                if not replayable:
+                    raise
+                delay: Optional[float] = self._delay(method, attempt, error)
+                if delay is None:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        body: Any = call.kwargs.get("data")
+        return self.perform(
+            call.method,
+            partial(proceed, call),
+            not isinstance(body, Upload) or body.replayable(),
+        )
+
+    def _delay(
+        self, method: str, attempt: int, error: Exception
+    ) -> Optional[float]:
+        """Returns seconds to wait before a next attempt.
+
+        Returns: `None` if a request is not retried
+        """
+        wait: float = random.uniform(
+            0, min(self._backoff[1], self._backoff[0] * 2 ** (attempt - 1))
+        )
+        if isinstance(error, ResponseError):
+            response: Optional[Response] = error.response()
+            if response is None or response.status() not in self._statuses:
+                return None
+            after: Optional[float] = retry_after(response.headers())
+            wait = wait if after is None else after
+        if method not in self._methods or wait > self._backoff[1]:
+            return None
+        left: Optional[float] = remaining()
+        if left is not None and wait >= left:
+            return None
+        if attempt >= self._attempts:
+            self._count(RetryStats(exhausted=1))
+            return None
+        if not self._budget.withdraw():
+            self._count(RetryStats(throttled=1))
+            return None
+        self._count(RetryStats(retries=1))
+        return wait
+
+    def _count(self, increment: RetryStats) -> None:
+        """Increments counters of retried requests."""
+        with self._lock:
+            self._stats = RetryStats(
+                self._stats.requests + increment.requests,
+                self._stats.retries + increment.retries,
+                self._stats.exhausted + increment.exhausted,
+                self._stats.throttled + increment.throttled,
+            )
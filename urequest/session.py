@@ -1,23 +1,343 @@
 """The module contains a set of API for HTTP sessions."""
-from abc import abstractmethod
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from http import HTTPStatus
+from time import perf_counter
 from types import TracebackType
-from typing import Any, Dict, Optional, Type
-from punish.type import AbstractContextManager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
 import requests
-from requests.auth import HTTPBasicAuth
-from urequest.credentials import Credentials  # noqa: I100
-from urequest.response import HttpResponse, Response, safe_response
+from requests.adapters import BaseAdapter
+from urequest.aio import AsyncPool  # noqa: I100
+from urequest.base import Session
+from urequest.breaker import CircuitBreaker
+from urequest.codec import Codec, default_codec
+from urequest.compression import Compression
+from urequest.credentials import Credentials
+from urequest.flight import SingleFlight
+from urequest.hedge import Hedge
+from urequest.hooks import Hooks
+from urequest.limiter import RateLimiter
+from urequest.pipeline import (
+    BasicAuth,
+    Call,
+    Handler,
+    Interceptor,
+    pipeline,
+)
+from urequest.pool import Pool, PooledAdapter
+from urequest.protocol import (
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    Timeout,
+    TooManyRedirects,
+    check_arguments,
+    merge_headers,
+)
+from urequest.response import (
+    HttpResponse,
+    HttpStreamResponse,
+    Response,
+    ResponseError,
+    safe_response,
+)
+from urequest.retry import Retry
+from urequest.timeout import (
+    DeadlineExceededError,
+    RequestTimeoutError,
+    Timeouts,
+    expired,
+)
+from urequest.timing import Latencies, Timing, recording
+from urequest.upload import Body, Upload, body_of
 from urequest.url import Address
 
-
 HttpConnectionError = requests.exceptions.ConnectionError
 
 
-class Session(AbstractContextManager):
-    """The class represents abstract interfaces for an API Session."""
+def _json_headers(
+    defaults: Mapping[str, str], headers: Optional[Mapping[str, str]]
+) -> Dict[str, str]:
+    """Returns request headers declaring JSON content.
+
+    A content type declared by a session or a request is kept.
+    """
+    if "content-type" in defaults:
+        return dict(headers or {})
+    return merge_headers({"Content-Type": "application/json"}, headers or {})
+
+
+def _success_codes(call: Call) -> Tuple[int, ...]:
+    """Returns status codes a response of a call succeeds with.
+
+    ``206 Partial Content`` succeeds a request of a byte range only, so
+    a partial body is never taken for a whole one.
+    """
+    codes: Tuple[int, ...] = (
+        HTTPStatus.OK,
+        HTTPStatus.CREATED,
+        HTTPStatus.NO_CONTENT,
+    )
+    headers: Mapping[str, str] = call.kwargs.get("headers") or {}
+    if any(name.lower() == "range" for name in headers):
+        codes += (HTTPStatus.PARTIAL_CONTENT,)
+    return codes
+
+
+class HttpSession(Session):
+    """The class provides interfaces for current API HTTP session.
+
+    Every session owns its own connection pool unless a ``requests`` session
+    is given. A pool configuration is mounted on a given session as well.
+    A given transport, e.g. `Http2Transport`, carries requests instead of
+    a pool, so responses and errors stay the same whatever protocol is
+    used.
+    JSON bodies are encoded and responses are parsed by a given codec or
+    by a fastest installed one. Identical concurrent requests share one
+    round trip if a single flight is given, failed requests are repeated
+    by a given retry policy, calls to unhealthy hosts are rejected by
+    a given circuit breaker, requests are paced by a given rate limiter
+    and slow idempotent requests are repeated by a given hedging policy.
+    Latencies of responses are counted per host and method, and their
+    timing breakdown is known for requests over a mounted `Pool` only.
+    Requests sent over a network fire events of registered hooks.
+
+    Requests are limited by given timeouts, which a ``timeout`` argument
+    of a request overrides, and by a deadline of a context they are sent
+    in, so a request never outlives a caller.
+
+    Policies are stages of a request pipeline built once per session:
+    given ``interceptors`` (first is outermost), timeouts, a body
+    compression, a single flight, retries, hedging, a circuit breaker,
+    a rate limiter and hooks.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        session: requests.Session = None,
+        pool: Pool = None,
+        codec: Codec = None,
+        flight: SingleFlight = None,
+        retry: Retry = None,
+        breaker: CircuitBreaker = None,
+        limiter: RateLimiter = None,
+        hedge: Hedge = None,
+        hooks: Hooks = None,
+        interceptors: Iterable[Interceptor] = (),
+        compression: Compression = None,
+        timeouts: Timeouts = None,
+        transport: BaseAdapter = None,
+    ) -> None:
+        if session is None:
+            session = requests.Session()
+            pool = pool or (Pool() if transport is None else None)
+        adapter: Optional[BaseAdapter] = transport or (
+            None if pool is None else PooledAdapter(pool)
+        )
+        if adapter is not None:
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session: requests.Session = session
+        self._codec: Codec = codec or default_codec()
+        self._latencies = Latencies()
+        self._hooks: Hooks = Hooks() if hooks is None else hooks
+        stages: Tuple[Optional[Interceptor], ...] = (
+            *interceptors,
+            timeouts or Timeouts(),
+            compression,
+            flight,
+            retry,
+            hedge,
+            breaker,
+            limiter,
+            self._hooks,
+        )
+        self._handler: Handler = pipeline(
+            (stage for stage in stages if stage is not None), self._perform
+        )
+
+    def __enter__(self) -> Session:
+        return self
+
+    def latencies(self) -> Latencies:
+        """Returns latency histograms of responses per host and method."""
+        return self._latencies
+
+    def hooks(self) -> Hooks:
+        """Returns a registry of instrumentation hooks of requests."""
+        return self._hooks
 
-    @abstractmethod
     def get(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("GET", url, **kwargs)
+
+    def options(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("OPTIONS", url, **kwargs)
+
+    def head(self, url: Address, **kwargs: Any) -> Response:
+        kwargs.setdefault("allow_redirects", False)
+        return self._request("HEAD", url, **kwargs)
+
+    def post(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("POST", url, plain, as_dict, **kwargs)
+
+    def put(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("PUT", url, plain, as_dict, **kwargs)
+
+    def patch(
+        self,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        return self._request("PATCH", url, plain, as_dict, **kwargs)
+
+    def delete(self, url: Address, **kwargs: Any) -> Response:
+        return self._request("DELETE", url, **kwargs)
+
+    def _request(
+        self,
+        method: str,
+        url: Address,
+        plain: Body = None,
+        as_dict: Dict[Any, Any] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Performs an HTTP request of a session.
+
+        A plain body takes precedence over JSON one like in ``requests``.
+        Files, paths, buffers and iterators are streamed as `Upload`.
+        A response of ``stream=True`` request is `StreamResponse` which
+        reads a body on demand and releases a connection once it is read.
+        """
+        if not plain and as_dict is not None:
+            kwargs["data"] = self._codec.encode(as_dict)
+            kwargs["headers"] = _json_headers(
+                self._session.headers, kwargs.get("headers")
+            )
+            return self._handler(Call(method, url, kwargs))
+        kwargs["data"] = body_of(plain)
+        kind: Optional[str] = (
+            kwargs["data"].content_type()
+            if isinstance(kwargs["data"], Upload)
+            else None
+        )
+        if kind is not None:
+            kwargs["headers"] = merge_headers(
+                {"Content-Type": kind}, kwargs.get("headers") or {}
+            )
+        return self._handler(Call(method, url, kwargs))
+
+    def _perform(self, call: Call) -> Response:
+        """Sends an HTTP request over a connection pool.
+
+        An `Upload` body is streamed from its start by every attempt.
+
+        Raises:
+            `RequestTimeoutError` if a host is not connected or does not
+                respond in time
+            `DeadlineExceededError` if a deadline of a request has passed
+        """
+        kwargs: Dict[str, Any] = dict(call.kwargs)
+        if isinstance(kwargs.get("timeout"), Timeouts):
+            kwargs["timeout"] = kwargs["timeout"].attempt(str(call.url))
+        body: Any = kwargs.get("data")
+        if isinstance(body, Upload):
+            kwargs["data"] = body.stream()
+        with recording() as phases:
+            started: float = perf_counter()
+            try:
+                response: requests.Response = self._session.request(
+                    call.method, str(call.url), **kwargs
+                )
+            except requests.exceptions.ConnectTimeout as error:
+                raise RequestTimeoutError(
+                    f"Connection to {call.url} timed out"
+                ) from error
+            except requests.exceptions.ReadTimeout as error:
+                raise RequestTimeoutError(
+                    f"Response of {call.url} timed out"
+                ) from error
+            finally:
+                if isinstance(body, Upload):
+                    kwargs["data"].close()
+            streamed: bool = call.kwargs.get("stream", False)
+            timing: Timing = phases.timing(started, perf_counter(), streamed)
+        self._latencies.record(call.url.host(), call.method, timing.total)
+        if expired():
+            response.close()
+            raise DeadlineExceededError(f"Deadline of {call.url} is exceeded")
+        codes: Tuple[int, ...] = _success_codes(call)
+        if not streamed:
+            return safe_response(
+                HttpResponse(response, self._codec, timing), codes
+            )
+        try:
+            return safe_response(
+                HttpStreamResponse(response, self._codec, timing), codes
+            )
+        except ResponseError:
+            response.close()
+            raise
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._session.close()
+
+
+class LoggedHttpSession(HttpSession):
+    """The class provides logged HTTP session.
+
+    Requests are authorized by given credentials unless a request is
+    authorized itself. Keyword options are those of `HttpSession`, and
+    an authorization is an outermost stage of a pipeline.
+    """
+
+    def __init__(
+        self,
+        credentials: Credentials,
+        session: requests.Session = None,
+        **options: Any,
+    ) -> None:
+        options["interceptors"] = (
+            BasicAuth(credentials),
+            *options.get("interceptors", ()),
+        )
+        super().__init__(session, **options)
+
+
+class AsyncSession(ABC):
+    """The class represents abstract interfaces for an asynchronous Session.
+
+    A session represents an asynchronous context manager.
+    """
+
+    @abstractmethod
+    async def get(self, url: Address, **kwargs: Any) -> Response:
         """Performs ``GET`` HTTP request of a session.
 
         Args:
@@ -29,7 +349,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def options(self, url: Address, **kwargs: Any) -> Response:
+    async def options(self, url: Address, **kwargs: Any) -> Response:
         """Performs ``OPTIONS`` HTTP request of a session.
 
         Args:
@@ -41,7 +361,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def head(self, url: Address, **kwargs: Any) -> Response:
+    async def head(self, url: Address, **kwargs: Any) -> Response:
         """Performs ``HEAD`` HTTP request of a session.
 
         Args:
@@ -53,7 +373,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def post(
+    async def post(
         self,
         url: Address,
         plain: str = None,
@@ -73,7 +393,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def put(
+    async def put(
         self,
         url: Address,
         plain: str = None,
@@ -93,7 +413,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def patch(
+    async def patch(
         self,
         url: Address,
         plain: str = None,
@@ -113,7 +433,7 @@ class Session(AbstractContextManager):
         pass
 
     @abstractmethod
-    def delete(self, url: Address, **kwargs: Any) -> Response:
+    async def delete(self, url: Address, **kwargs: Any) -> Response:
         """Performs ``DELETE`` HTTP request of a session.
 
         Args:
@@ -124,147 +444,112 @@ class Session(AbstractContextManager):
         """
         pass
 
+    async def __aenter__(self) -> "AsyncSession":
+        return self
 
-class HttpSession(Session):
-    """The class provides interfaces for current API HTTP session."""
+    @abstractmethod
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
 
-    def __init__(self, session: requests.Session = requests.Session()) -> None:
-        self._session: requests.Session = session
 
-    def __enter__(self) -> Session:
-        return self
+class AsyncHttpSession(AsyncSession):
+    """The class provides interfaces for asynchronous HTTP session.
 
-    def get(self, url: Address, **kwargs: Any) -> Response:
-        return safe_response(
-            HttpResponse(self._session.get(str(url), **kwargs))
-        )
+    Requests are sent over own non-blocking connection pool so a single
+    event loop drives many requests at the same time. Supported keyword
+    arguments of verbs are ``headers``, ``params``, ``timeout`` and
+    ``allow_redirects`` with the same meaning as in ``requests``.
+    """
 
-    def options(self, url: Address, **kwargs: Any) -> Response:
-        return safe_response(
-            HttpResponse(self._session.options(str(url), **kwargs))
-        )
+    def __init__(self, pool: Pool = None, timeout: Timeout = None) -> None:
+        self._pool = AsyncPool(pool)
+        self._timeout = timeout
 
-    def head(self, url: Address, **kwargs: Any) -> Response:
-        return safe_response(
-            HttpResponse(self._session.head(str(url), **kwargs))
-        )
+    async def get(self, url: Address, **kwargs: Any) -> Response:
+        return await self._send("GET", url, **kwargs)
 
-    def post(
+    async def options(self, url: Address, **kwargs: Any) -> Response:
+        return await self._send("OPTIONS", url, **kwargs)
+
+    async def head(self, url: Address, **kwargs: Any) -> Response:
+        return await self._send("HEAD", url, **kwargs)
+
+    async def post(
         self,
         url: Address,
         plain: str = None,
         as_dict: Dict[Any, Any] = None,
         **kwargs: Any,
     ) -> Response:
-        return safe_response(
-            HttpResponse(
-                self._session.post(
-                    str(url), data=plain, json=as_dict, **kwargs
-                )
-            )
-        )
+        return await self._send("POST", url, plain, as_dict, **kwargs)
 
-    def put(
+    async def put(
         self,
         url: Address,
         plain: str = None,
         as_dict: Dict[Any, Any] = None,
         **kwargs: Any,
     ) -> Response:
-        return safe_response(
-            HttpResponse(
-                self._session.put(str(url), data=plain, json=as_dict, **kwargs)
-            )
-        )
+        return await self._send("PUT", url, plain, as_dict, **kwargs)
 
-    def patch(
+    async def patch(
         self,
         url: Address,
         plain: str = None,
         as_dict: Dict[Any, Any] = None,
         **kwargs: Any,
     ) -> Response:
-        return safe_response(
-            HttpResponse(
-                self._session.patch(
-                    str(url), data=plain, json=as_dict, **kwargs
-                )
-            )
-        )
+        return await self._send("PATCH", url, plain, as_dict, **kwargs)
 
-    def delete(self, url: Address, **kwargs: Any) -> Response:
-        return safe_response(
-            HttpResponse(self._session.delete(str(url), **kwargs))
-        )
+    async def delete(self, url: Address, **kwargs: Any) -> Response:
+        return await self._send("DELETE", url, **kwargs)
 
-    def __exit__(
+    async def __aexit__(
         self,
         exc_type: Optional[Type[BaseException]],
         exc_value: Optional[BaseException],
         traceback: Optional[TracebackType],
     ) -> None:
-        self._session.close()
-
-
-class LoggedHttpSession(Session):
-    """The class provides logged HTTP session."""
-
-    def __init__(
-        self,
-        credentials: Credentials,
-        session: requests.Session = requests.Session(),
-    ) -> None:
-        session.auth = HTTPBasicAuth(
-            credentials.username, credentials.password
-        )
-        self._session: Session = HttpSession(session)
-
-    def __enter__(self) -> Any:
-        return self._session.__enter__()
-
-    def get(self, url: Address, **kwargs: Any) -> Response:
-        return self._session.get(url, **kwargs)
-
-    def options(self, url: Address, **kwargs: Any) -> Response:
-        return self._session.options(url, **kwargs)
-
-    def head(self, url: Address, **kwargs: Any) -> Response:
-        return self._session.head(url, **kwargs)
-
-    def post(
-        self,
-        url: Address,
-        plain: str = None,
-        as_dict: Dict[Any, Any] = None,
-        **kwargs: Any,
-    ) -> Response:
-        return self._session.post(url, plain, as_dict, **kwargs)
+        await self._pool.close()
 
-    def put(
+    async def _send(
         self,
+        method: str,
         url: Address,
         plain: str = None,
         as_dict: Dict[Any, Any] = None,
         **kwargs: Any,
     ) -> Response:
-        return self._session.post(url, plain, as_dict, **kwargs)
+        """Sends a request over a connection pool.
 
-    def patch(
-        self,
-        url: Address,
-        plain: str = None,
-        as_dict: Dict[Any, Any] = None,
-        **kwargs: Any,
-    ) -> Response:
-        return self._session.patch(url, plain, as_dict, **kwargs)
-
-    def delete(self, url: Address, **kwargs: Any) -> Response:
-        return self._session.delete(url, **kwargs)
-
-    def __exit__(
-        self,
-        exception_type: Optional[Type[BaseException]],
-        exception_value: Optional[BaseException],
-        traceback: Optional[TracebackType],
-    ) -> None:
-        self._session.__exit__(exception_type, exception_value, traceback)
+        Raises:
+            `TypeError` if a keyword argument is not supported
+        """
+        check_arguments(self, kwargs)
+        body: bytes = b""
+        headers: Dict[str, str] = {}
+        if as_dict is not None:
+            body = json.dumps(as_dict).encode()
+            headers["Content-Type"] = "application/json"
+        elif plain is not None:
+            body = plain.encode()
+        kwargs.setdefault("timeout", self._timeout)
+        kwargs["headers"] = merge_headers(headers, kwargs.get("headers") or {})
+        try:
+            response: Response = await self._pool.request(
+                method, str(url), body, **kwargs
+            )
+        except ConnectTimeoutError as error:
+            raise requests.exceptions.ConnectTimeout(error) from error
+        except ReadTimeoutError as error:
+            raise requests.exceptions.ReadTimeout(error) from error
+        except TooManyRedirects as error:
+            raise requests.exceptions.TooManyRedirects(error) from error
+        except (OSError, asyncio.IncompleteReadError) as error:
+            raise HttpConnectionError(error) from error
+        return safe_response(response)
@@ -0,0 +1,128 @@
+"""The module provides API for timeouts and deadlines of HTTP requests.
+
+A deadline is a moment a request has to complete by. It is kept in
+a context variable, so requests made within ``deadline()`` block, including
+nested ones and those sent by worker threads of a session, inherit it,
+and a nested deadline can only shrink an inherited one.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
+from time import monotonic
+from typing import Iterator, Optional, Tuple, Union
+import requests
+from urequest.pipeline import Call, Handler, Interceptor
+from urequest.protocol import Timeout
+from urequest.response import Response
+
+_DEADLINE: ContextVar[Optional[float]] = ContextVar(
+    "urequest_deadline", default=None
+)
+
+
+class RequestTimeoutError(requests.exceptions.Timeout):
+    """The class represents a request which did not complete in time.
+
+    Unlike ``requests.exceptions.ConnectTimeout`` it is not
+    `HttpConnectionError`.
+    """
+
+    pass
+
+
+class DeadlineExceededError(RequestTimeoutError):
+    """The class represents a request which outlived its deadline."""
+
+    pass
+
+
+def remaining() -> Optional[float]:
+    """Returns seconds left until a current deadline.
+
+    Returns: `None` if there is no deadline
+    """
+    until: Optional[float] = _DEADLINE.get()
+    return None if until is None else until - monotonic()
+
+
+def expired() -> bool:
+    """Returns `True` if a current deadline has passed."""
+    left: Optional[float] = remaining()
+    return left is not None and left <= 0
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """Limits requests of a block by a deadline in ``seconds`` from now.
+
+    An inherited deadline which comes earlier is kept, so a block never
+    outlives a caller, `None` keeps an inherited deadline as it is.
+
+    Returns: seconds left until a deadline of a block
+    """
+    until: Optional[float] = _DEADLINE.get()
+    if seconds is not None:
+        moment: float = monotonic() + seconds
+        until = moment if until is None else min(until, moment)
+    token = _DEADLINE.set(until)
+    try:
+        yield remaining()
+    finally:
+        _DEADLINE.reset(token)
+
+
+def _bounded(timeout: Optional[float], left: float) -> float:
+    """Returns a timeout shrunk to fit into seconds left."""
+    return left if timeout is None else min(timeout, left)
+
+
+class Timeouts(Interceptor):
+    """The class represents a policy of request timeouts.
+
+    ``connect`` limits connecting to a host and ``read`` limits waiting
+    for every chunk of a response. ``total`` is a deadline of a whole
+    request including its retries and redirects: every attempt is limited
+    by what is left of it and no attempt starts once it has passed.
+    A ``timeout`` argument of a request overrides a policy: a `Timeouts`
+    one replaces it, a ``requests`` like one replaces ``connect`` and
+    ``read`` only.
+    """
+
+    def __init__(
+        self,
+        connect: float = None,
+        read: float = None,
+        total: float = None,
+    ) -> None:
+        self._connect = connect
+        self._read = read
+        self._total = total
+
+    def attempt(self, url: str) -> Tuple[Optional[float], Optional[float]]:
+        """Returns connect and read timeouts of a next attempt.
+
+        Raises:
+            `DeadlineExceededError` if a deadline has passed
+        """
+        if expired():
+            raise DeadlineExceededError(f"Deadline of {url} is exceeded")
+        left: Optional[float] = remaining()
+        if left is None:
+            return self._connect, self._read
+        return _bounded(self._connect, left), _bounded(self._read, left)
+
+    def intercept(self, call: Call, proceed: Handler) -> Response:
+        policy: Timeouts = self._override(call.kwargs.get("timeout", self))
+        with deadline(policy._total):
+            return proceed(
+                replace(call, kwargs={**call.kwargs, "timeout": policy})
+            )
+
+    def _override(self, timeout: Union["Timeouts", Timeout]) -> "Timeouts":
+        """Returns a policy of a request with a given timeout."""
+        if isinstance(timeout, Timeouts):
+            return timeout
+        if isinstance(timeout, tuple):
+            return Timeouts(*timeout, total=self._total)
+        return Timeouts(timeout, timeout, self._total)
@@ -0,0 +1,176 @@
+"""The module provides API for timings and latencies of HTTP requests."""
+import math
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_RESOLUTION: float = 1e-6
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class Timing:
+    """The class represents a timing breakdown of a request in seconds.
+
+    Phases of a kept-alive connection (DNS, connect and TLS) are zero and
+    phases of redirected requests are summed up. A body of a streamed
+    response is downloaded after a request so its download is zero.
+
+    Attributes:
+        dns: resolution of a host name
+        connect: establishing of a TCP connection
+        tls: TLS handshake
+        first_byte: waiting for response headers after a request is sent
+        download: reading of a response body
+        total: a whole request
+    """
+
+    dns: float = 0.0
+    connect: float = 0.0
+    tls: float = 0.0
+    first_byte: float = 0.0
+    download: float = 0.0
+    total: float = 0.0
+
+
+class Phases:
+    """The class represents phases of a request being recorded."""
+
+    __slots__ = ("dns", "connect", "tls", "first_byte", "headers")
+
+    def __init__(self) -> None:
+        self.dns = 0.0
+        self.connect = 0.0
+        self.tls = 0.0
+        self.first_byte = 0.0
+        self.headers: Optional[float] = None
+
+    def timing(
+        self, started: float, finished: float, streamed: bool = False
+    ) -> Timing:
+        """Returns a timing of a request finished at a given moment."""
+        return Timing(
+            self.dns,
+            self.connect,
+            self.tls,
+            self.first_byte,
+            (
+                0.0
+                if streamed or self.headers is None
+                else finished - self.headers
+            ),
+            finished - started,
+        )
+
+
+@contextmanager
+def recording() -> Iterator[Phases]:
+    """Records phases of requests sent by a current thread."""
+    previous: Optional[Phases] = recorder()
+    _local.phases = Phases()
+    try:
+        yield _local.phases
+    finally:
+        _local.phases = previous
+
+
+def recorder() -> Optional[Phases]:
+    """Returns phases recorded by a current thread if any."""
+    return getattr(_local, "phases", None)
+
+
+class LatencyHistogram:
+    """The class represents a histogram of latencies.
+
+    Like HDR histograms, latencies are counted in logarithmic buckets
+    of a relative ``precision`` (1% by default) from a microsecond, so
+    memory is bounded by a range of latencies rather than their amount.
+    It is safe to share between threads.
+    """
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self._base = math.log1p(precision)
+        self._counts: Dict[int, int] = {}
+        self._total: Tuple[int, float, float] = (0, 0.0, 0.0)
+        self._lock = Lock()
+
+    def record(self, seconds: float) -> None:
+        """Counts a latency in seconds."""
+        index: int = int(
+            math.log(max(seconds, _RESOLUTION) / _RESOLUTION) / self._base
+        )
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            count, summed, longest = self._total
+            self._total = (count + 1, summed + seconds, max(longest, seconds))
+
+    def count(self) -> int:
+        """Returns amount of counted latencies."""
+        return self._total[0]
+
+    def percentile(self, quantile: float) -> float:
+        """Returns a latency a given share of latencies does not exceed.
+
+        Args:
+            quantile: a share of latencies from 0 to 1 e.g 0.99
+
+        Returns: an upper bound of a bucket of a latency in seconds
+        """
+        with self._lock:
+            counts: List[Tuple[int, int]] = sorted(self._counts.items())
+            count, _, longest = self._total
+        rank: int = max(1, math.ceil(quantile * count))
+        for index, amount in counts:
+            rank -= amount
+            if rank <= 0:
+                return min(
+                    longest, _RESOLUTION * math.exp(self._base * (index + 1))
+                )
+        return longest
+
+    def summary(self) -> Dict[str, float]:
+        """Returns amount, mean, p50, p95, p99 and max latencies."""
+        count, summed, longest = self._total
+        return {
+            "count": count,
+            "mean": summed / count if count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": longest,
+        }
+
+
+class Latencies:
+    """The class represents latency histograms per host and method."""
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self._precision = precision
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = Lock()
+
+    def record(self, host: str, method: str, seconds: float) -> None:
+        """Counts a latency of a request."""
+        self.histogram(host, method).record(seconds)
+
+    def histogram(self, host: str, method: str) -> LatencyHistogram:
+        """Returns a histogram of requests of a method to a host."""
+        key: Tuple[str, str] = (host, method.upper())
+        histogram: Optional[LatencyHistogram] = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    key, LatencyHistogram(self._precision)
+                )
+        return histogram
+
+    def export(self) -> List[Dict[str, Any]]:
+        """Returns summaries of histograms with their hosts and methods."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+        return [
+            {"host": host, "method": method, **histogram.summary()}
+            for (host, method), histogram in histograms
+        ]
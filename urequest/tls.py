@@ -0,0 +1,150 @@
+"""The module provides API for TLS of HTTPS connections.
+
+A TLS configuration builds a single ``SSLContext`` shared by every
+connection made with it, so trusted certificates are loaded once, and
+the context resumes TLS sessions of hosts it has connected to before,
+so a new connection skips a full handshake.
+"""
+
+import os
+import ssl
+from dataclasses import dataclass
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Dict, Optional
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+
+@dataclass(frozen=True)
+class TlsStats:
+    """The class represents counters of TLS handshakes.
+
+    Attributes:
+        handshakes: handshakes of new connections
+        resumed: handshakes which resumed a previous session
+    """
+
+    handshakes: int = 0
+    resumed: int = 0
+
+
+class _ResumingContext(ssl.SSLContext):
+    """The class represents a client context resuming TLS sessions.
+
+    A last session of every host is kept once a connection gets
+    a response, since TLS 1.3 session tickets arrive after a handshake.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self.resumption: bool = True
+        self._sessions: Dict[str, ssl.SSLSession] = {}
+        self._stats = TlsStats()
+        self._lock = Lock()
+
+    def stats(self) -> TlsStats:
+        """Returns counters of handshakes."""
+        return self._stats
+
+    def wrap_socket(  # type: ignore  # pylint: disable=too-many-arguments
+        self,
+        sock: Any,
+        server_side: bool = False,
+        do_handshake_on_connect: bool = True,
+        suppress_ragged_eofs: bool = True,
+        server_hostname: str = None,
+        session: ssl.SSLSession = None,
+    ) -> ssl.SSLSocket:
+        if session is None and self.resumption and server_hostname:
+            session = self._sessions.get(server_hostname)
+        wrapped: ssl.SSLSocket = super().wrap_socket(
+            sock,
+            server_side,
+            do_handshake_on_connect,
+            suppress_ragged_eofs,
+            server_hostname,
+            session,
+        )
+        with self._lock:
+            self._stats = TlsStats(
+                self._stats.handshakes + 1,
+                self._stats.resumed + int(wrapped.session_reused is True),
+            )
+        return wrapped
+
+    def remember(self, sock: ssl.SSLSocket) -> None:
+        """Keeps a session of a connection to resume it later."""
+        session: Optional[ssl.SSLSession] = sock.session
+        if self.resumption and session is not None and sock.server_hostname:
+            self._sessions[sock.server_hostname] = session
+
+
+def remember_session(sock: Any) -> None:
+    """Keeps a session of a connection if its context resumes sessions."""
+    context: Any = getattr(sock, "context", None)
+    if isinstance(context, _ResumingContext):
+        context.remember(sock)
+
+
+@dataclass(frozen=True)
+class Tls:
+    """The class represents TLS configuration of HTTPS connections.
+
+    Attributes:
+        ca_bundle: a file or a directory of trusted certificates,
+            ``requests`` bundle is trusted if neither it nor ``ca_data``
+            is given
+        ca_data: PEM text of trusted certificates
+        client_cert: a file of a client certificate chain
+        client_key: a file of a client private key if ``client_cert``
+            does not include it
+        resumption: resumes TLS sessions of hosts by session tickets or
+            identifiers
+
+    Trusted certificates of a configuration take place of a ``verify``
+    bundle of a request, including ``REQUESTS_CA_BUNDLE`` of
+    an environment. Requests with ``verify=False`` or with ``cert`` do
+    not share a context of a configuration.
+    """
+
+    ca_bundle: Optional[str] = None
+    ca_data: Optional[str] = None
+    client_cert: Optional[str] = None
+    client_key: Optional[str] = None
+    resumption: bool = True
+
+    def context(self, shared: bool = True) -> ssl.SSLContext:
+        """Returns a context of a configuration.
+
+        Args:
+            shared: returns a context shared by every equal configuration
+                otherwise a new one
+        """
+        return _shared_context(self) if shared else _context(self)
+
+    def stats(self) -> TlsStats:
+        """Returns counters of handshakes of a shared context."""
+        return _shared_context(self).stats()
+
+
+@lru_cache(maxsize=None)
+def _shared_context(tls: Tls) -> _ResumingContext:
+    """Returns a context of a configuration built once."""
+    return _context(tls)
+
+
+def _context(tls: Tls) -> _ResumingContext:
+    """Returns a new context of a configuration."""
+    context = _ResumingContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.resumption = tls.resumption
+    if tls.ca_bundle is None and tls.ca_data is None:
+        context.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)
+    elif tls.ca_bundle is not None and os.path.isdir(tls.ca_bundle):
+        context.load_verify_locations(capath=tls.ca_bundle)
+    elif tls.ca_bundle is not None:
+        context.load_verify_locations(cafile=tls.ca_bundle)
+    if tls.ca_data is not None:
+        context.load_verify_locations(cadata=tls.ca_data)
+    if tls.client_cert is not None:
+        context.load_cert_chain(tls.client_cert, tls.client_key)
+    return context
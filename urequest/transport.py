@@ -0,0 +1,190 @@
+"""The module provides API for transports of HTTP sessions.
+
+A transport is a ``requests`` adapter mounted on a session, so every
+session stage, response and error stays the same whatever protocol
+carries requests. `PooledAdapter` carries HTTP/1.1 over ``urllib3``
+pools, `Http2Transport` carries HTTP/2 over ``httpx`` which is an optional
+dependency (``pip install httpx[http2]``) imported once a transport is
+made.
+"""
+
+import importlib
+import io
+from contextlib import contextmanager
+from datetime import timedelta
+from functools import partial
+from typing import Any, Iterator, Mapping, Optional, Tuple, Union
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urequest.tls import Tls
+
+_HOP_BY_HOP: Tuple[str, ...] = (
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+)
+
+
+class _Body(io.RawIOBase):
+    """The class represents a raw body of a streamed ``httpx`` response.
+
+    It reads decoded content like ``urllib3`` raw body of ``requests``
+    with ``decode_content`` set.
+    """
+
+    def __init__(self, response: Any, errors: Any) -> None:
+        super().__init__()
+        self._response = response
+        self._chunks: Iterator[bytes] = response.iter_bytes()
+        self._rest: bytes = b""
+        self._errors = errors
+        self.decode_content: bool = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        view = memoryview(buffer).cast("B")
+        with self._errors():
+            while not self._rest:
+                self._rest = next(self._chunks, b"")
+                if not self._rest:
+                    return 0
+        read: int = min(len(view), len(self._rest))
+        view[:read] = self._rest[:read]
+        self._rest = self._rest[read:]
+        return read
+
+    def stream(
+        self, amt: int = 64 * 1024, decode_content: bool = None
+    ) -> Iterator[bytes]:
+        """Yields decoded chunks of a body."""
+        yield from iter(partial(self.read, amt), b"")
+
+    def release_conn(self) -> None:
+        """Releases a stream of a connection."""
+        self._response.close()
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class Http2Transport(BaseAdapter):
+    """The class represents HTTP/2 transport of a session.
+
+    Concurrent requests to a host are multiplexed over a single
+    connection, hosts which do not negotiate HTTP/2 are served over
+    HTTP/1.1. Up to ``connections`` connections are kept, and
+    certificates are verified by a given TLS configuration, which builds
+    a context of its own since ``httpx`` tunes a context it is given.
+    ``verify`` and ``cert`` arguments of requests and proxies are not
+    applied. Redirects are followed by a session.
+
+    Raises:
+        `ImportError` if ``httpx`` with HTTP/2 support is not installed
+    """
+
+    def __init__(self, tls: Tls = None, connections: int = 10) -> None:
+        super().__init__()
+        try:
+            self._httpx: Any = importlib.import_module("httpx")
+            importlib.import_module("h2")
+        except ImportError as error:
+            raise ImportError(
+                "HTTP/2 transport needs 'httpx[http2]' package"
+            ) from error
+        self._client: Any = self._httpx.Client(
+            http2=True,
+            verify=(tls or Tls()).context(shared=False),
+            cert=None,
+            limits=self._httpx.Limits(max_connections=connections),
+            trust_env=False,
+            follow_redirects=False,
+        )
+
+    def send(  # pylint: disable=too-many-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Union[bool, str] = True,
+        cert: Any = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        outgoing: Any = self._client.build_request(
+            str(request.method),
+            str(request.url),
+            headers=_headers(request.headers),
+            content=_content(request.body),
+            timeout=self._timeout(timeout),
+        )
+        with self._errors(request):
+            incoming: Any = self._client.send(outgoing, stream=True)
+        response = requests.Response()
+        response.status_code = incoming.status_code
+        response.headers = CaseInsensitiveDict(incoming.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = incoming.reason_phrase
+        response.url = str(request.url)
+        response.request = request
+        response.connection = self  # type: ignore
+        response.elapsed = timedelta(0)
+        response.raw = _Body(incoming, partial(self._errors, request))
+        if not stream:
+            with self._errors(request):
+                response._content = incoming.read()
+            response._content_consumed = True
+            incoming.close()
+        return response
+
+    def close(self) -> None:
+        self._client.close()
+
+    def _timeout(self, timeout: Any) -> Any:
+        """Returns ``httpx`` timeout of ``requests`` one."""
+        connect, read = (
+            timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        )
+        return self._httpx.Timeout(read, connect=connect)
+
+    @contextmanager
+    def _errors(self, request: requests.PreparedRequest) -> Iterator[None]:
+        """Turns ``httpx`` errors into ``requests`` ones."""
+        httpx: Any = self._httpx
+        try:
+            yield
+        except httpx.ConnectTimeout as error:
+            raise requests.exceptions.ConnectTimeout(
+                error, request=request
+            ) from error
+        except httpx.TimeoutException as error:
+            raise requests.exceptions.ReadTimeout(
+                error, request=request
+            ) from error
+        except httpx.TransportError as error:
+            raise requests.exceptions.ConnectionError(
+                error, request=request
+            ) from error
+
+
+def _headers(headers: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Returns headers without hop-by-hop ones forbidden by HTTP/2."""
+    return {
+        name: value
+        for name, value in headers.items()
+        if name.lower() not in _HOP_BY_HOP
+    }
+
+
+def _content(body: Any) -> Optional[Union[bytes, Iterator[bytes]]]:
+    """Returns ``httpx`` content of a prepared request body."""
+    if body is None or isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode()
+    return (bytes(chunk) for chunk in body)
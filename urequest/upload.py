@@ -0,0 +1,246 @@
+"""The module provides API for request bodies streamed in constant memory."""
+import io
+import os
+import uuid
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+Source = Union[
+    bytes,
+    bytearray,
+    memoryview,
+    IO[bytes],
+    "os.PathLike[str]",
+    Iterable[bytes],
+]
+Field = Union[str, Tuple[str, Source], Tuple[str, Source, str]]
+Progress = Callable[[int, Optional[int]], None]
+_BYTES: Tuple[Type[bytes], Type[bytearray], Type[memoryview]] = (
+    bytes,
+    bytearray,
+    memoryview,
+)
+_OCTETS: str = "application/octet-stream"
+
+
+def _length(source: Any, start: Optional[int]) -> Optional[int]:
+    """Returns amount of bytes of a source from a start if it is known."""
+    if isinstance(source, _BYTES):
+        return memoryview(source).nbytes
+    if isinstance(source, os.PathLike):
+        return os.path.getsize(source)
+    if start is None:
+        return None
+    position: int = source.tell()
+    end: int = source.seek(0, io.SEEK_END)
+    source.seek(position)
+    return end - start
+
+
+def _start(source: Any) -> Optional[int]:
+    """Returns a position a file body starts from if it is seekable."""
+    try:
+        return source.tell() if source.seekable() else None
+    except (AttributeError, OSError):
+        return None
+
+
+def _reader(file: IO[bytes], size: int) -> Callable[[], bytes]:
+    """Returns a reader of next ``size`` bytes of a file."""
+    return lambda: file.read(size)
+
+
+class _Stream:
+    """The class represents a body of a single attempt of a request.
+
+    ``requests`` sends it with ``Content-Length`` of ``len`` attribute
+    or by chunks if it is `None`.
+    """
+
+    def __init__(self, chunks: Iterator[Any], length: Optional[int]) -> None:
+        self._chunks = chunks
+        self.len = length
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._chunks
+
+    def close(self) -> None:
+        """Closes files opened by a body."""
+        getattr(self._chunks, "close", lambda: None)()
+
+
+class Upload:
+    """The class represents a request body streamed from a source.
+
+    A source is bytes-like, a binary file, a path or an iterator of bytes,
+    it is read by ``chunk_size`` blocks, so memory does not depend on
+    a size of a body. A body is sent with ``Content-Length`` if a size is
+    known, otherwise by chunks. Files and paths are read from their start
+    on every attempt, so retried requests send a whole body, while
+    iterators and unseekable files can be sent once, which `replayable`
+    tells in advance. A ``progress`` callback gets amounts of sent and
+    total (`None` if unknown) bytes.
+    """
+
+    def __init__(
+        self,
+        source: Source,
+        progress: Progress = None,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        self._sources: List[Any] = [source]
+        self._progress = progress
+        self._chunk_size = chunk_size
+        self._starts: Dict[int, Optional[int]] = {}
+        self._sent: Set[int] = set()
+
+    def content_type(self) -> Optional[str]:
+        """Returns a content type of a body if it defines one."""
+        return None
+
+    def length(self) -> Optional[int]:
+        """Returns a size of a body in bytes if it is known."""
+        total: int = 0
+        for index, source in enumerate(self._sources):
+            length: Optional[int] = _length(source, self._start(index))
+            if length is None:
+                return None
+            total += length
+        return total
+
+    def replayable(self) -> bool:
+        """Returns `True` if a body can be sent by more than one attempt."""
+        return all(
+            isinstance(source, (*_BYTES, os.PathLike))
+            or self._start(index) is not None
+            for index, source in enumerate(self._sources)
+        )
+
+    def stream(self) -> _Stream:
+        """Returns a body of a next attempt of a request.
+
+        Raises:
+            `ValueError` if a body can not be sent again
+        """
+        for index, source in enumerate(self._sources):
+            if isinstance(source, (*_BYTES, os.PathLike)):
+                continue
+            if self._start(index) is None and index in self._sent:
+                raise ValueError("A request body can not be sent again!")
+            self._sent.add(index)
+        return _Stream(self._chunks(), self.length())
+
+    def _start(self, index: int) -> Optional[int]:
+        """Returns a position a file source starts from once it is seen.
+
+        Returns: `None` if a source is not a seekable file
+        """
+        if index not in self._starts:
+            self._starts[index] = _start(self._sources[index])
+        return self._starts[index]
+
+    def _chunks(self) -> Iterator[Any]:
+        """Yields blocks of a body reporting its progress."""
+        sent: int = 0
+        total: Optional[int] = self.length()
+        for index, source in enumerate(self._sources):
+            for chunk in self._read(index, source):
+                yield chunk
+                sent += len(chunk)
+                if self._progress is not None:
+                    self._progress(sent, total)
+
+    def _read(self, index: int, source: Any) -> Iterator[Any]:
+        """Yields blocks of a single source."""
+        size: int = self._chunk_size
+        if isinstance(source, _BYTES):
+            view = memoryview(source).cast("B")
+            for start in range(0, len(view), size):
+                yield view[start:][:size]
+        elif isinstance(source, os.PathLike):
+            with open(source, "rb") as file:
+                yield from iter(_reader(file, size), b"")
+        elif hasattr(source, "read"):
+            position: Optional[int] = self._start(index)
+            if position is not None:
+                source.seek(position)
+            yield from iter(_reader(source, size), b"")
+        else:
+            yield from source
+
+
+class Multipart(Upload):
+    """The class represents a ``multipart/form-data`` body streamed by parts.
+
+    A field is either a text or a ``(filename, source)`` file optionally
+    followed by its content type (``application/octet-stream`` by
+    default), where a source is any `Upload` source.
+    """
+
+    def __init__(
+        self,
+        fields: Mapping[str, Field],
+        progress: Progress = None,
+        chunk_size: int = 64 * 1024,
+        boundary: str = None,
+    ) -> None:
+        super().__init__(b"", progress, chunk_size)
+        self._boundary: str = boundary or uuid.uuid4().hex
+        self._sources = [
+            part
+            for name, field in fields.items()
+            for part in self._part(name, field)
+        ]
+        self._sources.append(f"--{self._boundary}--\r\n".encode())
+
+    def content_type(self) -> Optional[str]:
+        return f"multipart/form-data; boundary={self._boundary}"
+
+    def _part(self, name: str, field: Field) -> Iterator[Any]:
+        """Yields a head, a content and a tail of a field."""
+        disposition: str = f'form-data; name="{_quoted(name)}"'
+        if isinstance(field, str):
+            head: str = f"Content-Disposition: {disposition}\r\n"
+            content: Any = field.encode()
+        else:
+            filename, content, *kind = field
+            disposition += f'; filename="{_quoted(filename)}"'
+            head = (
+                f"Content-Disposition: {disposition}\r\n"
+                f"Content-Type: {kind[0] if kind else _OCTETS}\r\n"
+            )
+        yield f"--{self._boundary}\r\n{head}\r\n".encode()
+        yield content
+        yield b"\r\n"
+
+
+def _quoted(value: str) -> str:
+    """Returns a value escaped for a quoted header parameter."""
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def body_of(plain: Optional["Body"]) -> Union[None, str, bytes, Upload]:
+    """Returns ``requests`` data of a request body.
+
+    Texts and bytes are sent as they are, other sources are streamed as
+    `Upload` since ``requests`` iterates them by items otherwise.
+    """
+    if plain is None or isinstance(plain, (str, bytes, Upload)):
+        return plain
+    return Upload(plain)
+
+
+Body = Union[str, Source, Upload]